@@ -0,0 +1,63 @@
+"""Times the edge lookups of a graph with the edge index against a linear scan of the edges.
+
+Usage: python scripts/benchmark_edge_index.py --nodes 50 200 1000 2000
+"""
+
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+from langflow.graph import Graph
+
+
+def generate_edges(num_nodes: int, fan_out: int = 3, seed: int = 42) -> list[SimpleNamespace]:
+    """Generates a random DAG shaped like a flow, where each node feeds up to `fan_out` later nodes."""
+    rng = random.Random(seed)  # noqa: S311
+    return [
+        SimpleNamespace(source_id=f"node-{source}", target_id=f"node-{target}")
+        for source in range(num_nodes - 1)
+        for target in rng.sample(range(source + 1, num_nodes), min(fan_out, num_nodes - source - 1))
+    ]
+
+
+def linear_vertex_edges(edges, vertex_id: str):
+    return [edge for edge in edges if vertex_id in {edge.source_id, edge.target_id}]
+
+
+def benchmark(num_nodes: int, lookups: int) -> tuple[int, float, float]:
+    graph = Graph()
+    graph.edges = generate_edges(num_nodes)
+    # Sample a fixed number of lookups so the linear scan stays cheap on large graphs
+    vertex_ids = [f"node-{node}" for node in random.Random(0).sample(range(num_nodes), min(lookups, num_nodes))]  # noqa: S311
+
+    start = time.perf_counter()
+    indexed = [graph.get_vertex_edges(vertex_id) for vertex_id in vertex_ids]
+    indexed_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scanned = [linear_vertex_edges(graph.edges, vertex_id) for vertex_id in vertex_ids]
+    scanned_time = time.perf_counter() - start
+
+    if indexed != scanned:
+        msg = f"The indexed edges of the {num_nodes} node graph differ from the linear scan"
+        raise AssertionError(msg)
+    return len(graph.edges), indexed_time, scanned_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the edge index of graphs.")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[50, 200, 1000, 2000], help="The graph sizes.")
+    parser.add_argument("--lookups", type=int, default=50, help="The number of vertices looked up per graph.")
+    args = parser.parse_args()
+
+    for num_nodes in args.nodes:
+        num_edges, indexed_time, scanned_time = benchmark(num_nodes, args.lookups)
+        print(
+            f"{num_nodes} nodes, {num_edges} edges: "
+            f"indexed {indexed_time * 1000:.2f}ms, linear scan {scanned_time * 1000:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -16,7 +16,7 @@ from langflow.services.database.models import User
 from langflow.services.database.models.flow import Flow
 from langflow.services.database.models.transactions.model import TransactionTable
 from langflow.services.database.models.vertex_builds.model import VertexBuildTable
-from langflow.services.deps import get_session
+from langflow.services.deps import get_log_writer_service, get_session
 from langflow.services.store.utils import get_lf_version_from_pypi
 
 if TYPE_CHECKING:
@@ -85,14 +85,18 @@ def validate_is_component(flows: list[Flow]):
         if not flow.data or flow.is_component is not None:
             continue
 
-        is_component = get_is_component_from_data(flow.data)
-        if is_component is not None:
-            flow.is_component = is_component
-        else:
-            flow.is_component = len(flow.data.get("nodes", [])) == 1
+        flow.is_component = infer_is_component(flow.data)
     return flows
 
 
+def infer_is_component(data: dict) -> bool:
+    """Returns whether the data of a flow that doesn't have is_component set is a component."""
+    is_component = get_is_component_from_data(data)
+    if is_component is not None:
+        return is_component
+    return len(data.get("nodes", [])) == 1
+
+
 def get_is_component_from_data(data: dict):
     """Returns True if the data is a component."""
     return data.get("is_component")
@@ -265,6 +269,8 @@ def parse_value(value: Any, input_type: str) -> Any:
 
 
 async def cascade_delete_flow(session: Session, flow: Flow) -> None:
+    # Write pending logs first so none of them are inserted after the flow is gone
+    await get_log_writer_service().aflush()
     try:
         session.exec(delete(TransactionTable).where(TransactionTable.flow_id == flow.id))
         session.exec(delete(VertexBuildTable).where(VertexBuildTable.flow_id == flow.id))
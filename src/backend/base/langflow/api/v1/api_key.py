@@ -10,6 +10,7 @@ from langflow.services.auth import utils as auth_utils
 # Assuming you have these methods in your service layer
 from langflow.services.database.models.api_key.crud import create_api_key, delete_api_key, get_api_keys
 from langflow.services.database.models.api_key.model import ApiKeyCreate, UnmaskedApiKeyRead
+from langflow.services.database.models.user.model import User
 from langflow.services.deps import get_settings_service
 
 if TYPE_CHECKING:
@@ -72,9 +73,15 @@ def save_store_api_key(
 
         # Encrypt the API key
         encrypted = auth_utils.encrypt_api_key(api_key, settings_service=settings_service)
-        current_user.store_api_key = encrypted
-        db.add(current_user)
+        # The current user can be a cached copy, so the user is loaded to be changed
+        user = db.get(User, current_user.id)
+        if user is None:
+            msg = "User not found"
+            raise ValueError(msg)
+        user.store_api_key = encrypted
+        db.add(user)
         db.commit()
+        auth_utils.invalidate_user_caches(current_user.id)
 
         response.set_cookie(
             "apikey_tkn_lflw",
@@ -98,8 +105,13 @@ def delete_store_api_key(
     db: DbSession,
 ):
     try:
-        current_user.store_api_key = None
+        user = db.get(User, current_user.id)
+        if user is None:
+            msg = "User not found"
+            raise ValueError(msg)
+        user.store_api_key = None
         db.commit()
+        auth_utils.invalidate_user_caches(current_user.id)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
@@ -6,7 +6,7 @@ import time
 import traceback
 import typing
 import uuid
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, cast
 
 from fastapi import APIRouter, BackgroundTasks, Body, HTTPException
 from fastapi.responses import StreamingResponse
@@ -36,12 +36,20 @@ from langflow.api.v1.schemas import (
     VerticesOrderResponse,
 )
 from langflow.events.event_manager import EventManager, create_default_event_manager
+from langflow.events.flow_control import FlowControlQueue
 from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.graph.base import Graph
 from langflow.graph.utils import log_vertex_build
 from langflow.schema.schema import OutputValue
 from langflow.services.chat.service import ChatService
-from langflow.services.deps import get_chat_service, get_session, get_telemetry_service
+from langflow.services.deps import (
+    get_chat_service,
+    get_executor_service,
+    get_session,
+    get_settings_service,
+    get_telemetry_service,
+)
+from langflow.services.telemetry import metrics
 from langflow.services.telemetry.schema import ComponentPayload, PlaygroundPayload
 
 if TYPE_CHECKING:
@@ -154,6 +162,7 @@ async def build_flow(
 ):
     chat_service = get_chat_service()
     telemetry_service = get_telemetry_service()
+    executor_service = get_executor_service()
     if not inputs:
         inputs = InputValueRequest(session=str(flow_id))
 
@@ -209,7 +218,9 @@ async def build_flow(
 
         return first_layer, vertices_to_run, graph
 
-    async def _build_vertex(vertex_id: str, graph: Graph, event_manager: EventManager) -> VertexBuildResponse:
+    async def _build_vertex(
+        vertex_id: str, graph: Graph, event_manager: EventManager, queued_at: float | None = None
+    ) -> VertexBuildResponse:
         flow_id_str = str(flow_id)
 
         next_runnable_vertices = []
@@ -228,6 +239,7 @@ async def build_flow(
                     get_cache=chat_service.get_cache,
                     set_cache=chat_service.set_cache,
                     event_manager=event_manager,
+                    queued_at=queued_at,
                 )
                 result_dict = vertex_build_result.result_dict
                 params = vertex_build_result.params
@@ -268,7 +280,7 @@ async def build_flow(
                     artifacts=artifacts,
                 )
             else:
-                await chat_service.set_cache(flow_id_str, graph)
+                await chat_service.checkpoint_graph(flow_id_str, graph, vertex_ids=[vertex_id])
 
             timedelta = time.perf_counter() - start_time
             duration = format_elapsed_time(timedelta)
@@ -325,10 +337,14 @@ async def build_flow(
     async def build_vertices(
         vertex_id: str,
         graph: Graph,
-        client_consumed_queue: asyncio.Queue,
+        event_queue: FlowControlQueue,
         event_manager: EventManager,
     ) -> None:
-        build_task = asyncio.create_task(asyncio.to_thread(asyncio.run, _build_vertex(vertex_id, graph, event_manager)))
+        build_task = asyncio.create_task(
+            executor_service.run(
+                _build_vertex(vertex_id, graph, event_manager, queued_at=time.perf_counter()), flow_id=str(flow_id)
+            )
+        )
         try:
             await build_task
         except asyncio.CancelledError as exc:
@@ -345,11 +361,11 @@ async def build_flow(
             msg = f"Error serializing vertex build response: {exc}"
             raise ValueError(msg) from exc
         event_manager.on_end_vertex(data={"build_data": build_data})
-        await client_consumed_queue.get()
+        await event_queue.wait_for_credit()
         if vertex_build_response.valid and vertex_build_response.next_vertices_ids:
             tasks = []
             for next_vertex_id in vertex_build_response.next_vertices_ids:
-                task = asyncio.create_task(build_vertices(next_vertex_id, graph, client_consumed_queue, event_manager))
+                task = asyncio.create_task(build_vertices(next_vertex_id, graph, event_queue, event_manager))
                 tasks.append(task)
             try:
                 await asyncio.gather(*tasks)
@@ -358,10 +374,23 @@ async def build_flow(
                     task.cancel()
                 return
 
-    async def event_generator(event_manager: EventManager, client_consumed_queue: asyncio.Queue) -> None:
+    async def event_generator(event_manager: EventManager, event_queue: FlowControlQueue) -> None:
+        start_time = time.perf_counter()
+        build_status = "error"
+        try:
+            await _generate_events(event_manager, event_queue)
+            build_status = "success"
+        finally:
+            metrics.observe(
+                "graph_build_duration",
+                time.perf_counter() - start_time,
+                {"flow_id": str(flow_id), "source": "playground", "status": build_status},
+            )
+
+    async def _generate_events(event_manager: EventManager, event_queue: FlowControlQueue) -> None:
         if not data:
-            # using another thread since the DB query is I/O bound
-            vertices_task = asyncio.create_task(asyncio.to_thread(asyncio.run, build_graph_and_get_order()))
+            # using an executor loop since the DB query is I/O bound
+            vertices_task = asyncio.create_task(executor_service.run(build_graph_and_get_order()))
             try:
                 await vertices_task
             except asyncio.CancelledError:
@@ -385,11 +414,11 @@ async def build_flow(
                 event_manager.on_error(data={"error": str(e)})
                 raise
         event_manager.on_vertices_sorted(data={"ids": ids, "to_run": vertices_to_run})
-        await client_consumed_queue.get()
+        await event_queue.wait_for_credit()
 
         tasks = []
         for vertex_id in ids:
-            task = asyncio.create_task(build_vertices(vertex_id, graph, client_consumed_queue, event_manager))
+            task = asyncio.create_task(build_vertices(vertex_id, graph, event_queue, event_manager))
             tasks.append(task)
         try:
             await asyncio.gather(*tasks)
@@ -398,35 +427,50 @@ async def build_flow(
             for task in tasks:
                 task.cancel()
             return
+        if graph.checkpointed_vertices:
+            # Consolidate the checkpoints written during the build into a single snapshot
+            await chat_service.set_cache(str(flow_id), graph)
         event_manager.on_end(data={})
         await event_manager.queue.put((None, None, time.time))
 
-    async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio.Queue) -> typing.AsyncGenerator:
-        while True:
-            event_id, value, put_time = await queue.get()
-            if value is None:
-                break
-            get_time = time.time()
-            yield value
-            get_time_yield = time.time()
-            client_consumed_queue.put_nowait(event_id)
-            logger.debug(
-                f"consumed event {event_id} "
-                f"(time in queue, {get_time - put_time:.4f}, "
-                f"client {get_time_yield - get_time:.4f})"
-            )
-
-    asyncio_queue: asyncio.Queue = asyncio.Queue()
-    asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
-    event_manager = create_default_event_manager(queue=asyncio_queue)
-    main_task = asyncio.create_task(event_generator(event_manager, asyncio_queue_client_consumed))
+    async def consume_and_yield(queue: FlowControlQueue) -> typing.AsyncGenerator:
+        metric_labels = {"flow_id": str(flow_id)}
+        try:
+            while True:
+                event_id, value, put_time = await queue.get()
+                if value is None:
+                    break
+                get_time = time.time()
+                metrics.observe("event_queue_wait", get_time - put_time, metric_labels)
+                metrics.set_gauge("event_queue_backlog", queue.qsize(), metric_labels)
+                yield value
+                get_time_yield = time.time()
+                await queue.mark_consumed()
+                logger.debug(
+                    f"consumed event {event_id} "
+                    f"(time in queue, {get_time - put_time:.4f}, "
+                    f"client {get_time_yield - get_time:.4f})"
+                )
+        finally:
+            # The backlog of a finished build isn't reported, so the gauge doesn't keep one value per flow
+            metrics.remove_gauge("event_queue_backlog", metric_labels)
+
+    settings = get_settings_service().settings
+    asyncio_queue = FlowControlQueue(
+        settings.build_events_window,
+        detached=settings.build_events_detached,
+        max_buffer_bytes=settings.build_events_max_buffer_mb * 1024 * 1024,
+    )
+    token_coalesce_window = settings.event_token_coalesce_ms / 1000
+    event_manager = create_default_event_manager(queue=asyncio_queue, token_coalesce_window=token_coalesce_window)
+    main_task = asyncio.create_task(event_generator(event_manager, asyncio_queue))
 
     def on_disconnect() -> None:
         logger.debug("Client disconnected, closing tasks")
         main_task.cancel()
 
     return DisconnectHandlerStreamingResponse(
-        consume_and_yield(asyncio_queue, asyncio_queue_client_consumed),
+        consume_and_yield(asyncio_queue),
         media_type="application/x-ndjson",
         on_disconnect=on_disconnect,
     )
@@ -487,20 +531,19 @@ async def build_vertex(
     telemetry_service = get_telemetry_service()
     flow_id_str = str(flow_id)
 
-    next_runnable_vertices = []
+    next_runnable_vertices: list[str] = []
     top_level_vertices = []
     start_time = time.perf_counter()
     error_message = None
     try:
-        cache = await chat_service.get_cache(flow_id_str)
-        if not cache:
+        graph: Graph | None = await chat_service.get_graph(flow_id_str)
+        if graph is None:
             # If there's no cache
             logger.warning(f"No cache found for {flow_id_str}. Building graph starting at {vertex_id}")
-            graph: Graph = await build_graph_from_db(
+            graph = await build_graph_from_db(
                 flow_id=flow_id_str, session=next(get_session()), chat_service=chat_service
             )
         else:
-            graph = cache.get("result")
             await graph.initialize_run()
         vertex = graph.get_vertex(vertex_id)
 
@@ -564,7 +607,7 @@ async def build_vertex(
         graph.reset_inactivated_vertices()
         graph.reset_activated_vertices()
 
-        await chat_service.set_cache(flow_id_str, graph)
+        await chat_service.checkpoint_graph(flow_id_str, graph, vertex_ids=[vertex_id])
 
         # graph.stop_vertex tells us if the user asked
         # to stop the build of the graph at a certain vertex
@@ -615,23 +658,21 @@ async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService
     graph = None
     try:
         try:
-            cache = await chat_service.get_cache(flow_id)
+            graph = await chat_service.get_graph(flow_id)
         except Exception as exc:  # noqa: BLE001
             logger.exception("Error building Component")
             yield str(StreamData(event="error", data={"error": str(exc)}))
             return
 
-        if not cache:
+        if graph is None:
             # If there's no cache
             msg = f"No cache found for {flow_id}."
             logger.error(msg)
             yield str(StreamData(event="error", data={"error": msg}))
             return
-        else:
-            graph = cache.get("result")
 
         try:
-            vertex: InterfaceVertex = graph.get_vertex(vertex_id)
+            vertex = cast("InterfaceVertex", graph.get_vertex(vertex_id))
         except Exception as exc:  # noqa: BLE001
             logger.exception("Error building Component")
             yield str(StreamData(event="error", data={"error": str(exc)}))
@@ -689,7 +730,7 @@ async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService
     finally:
         logger.debug("Closing stream")
         if graph:
-            await chat_service.set_cache(flow_id, graph)
+            await chat_service.checkpoint_graph(flow_id, graph, vertex_ids=[vertex_id])
         yield str(StreamData(event="close", data={"message": "Stream closed"}))
 
 
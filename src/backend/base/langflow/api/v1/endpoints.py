@@ -7,6 +7,7 @@ from uuid import UUID
 
 import sqlalchemy as sa
 from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Request, UploadFile, status
+from fastapi.responses import JSONResponse
 from loguru import logger
 from sqlmodel import select
 
@@ -24,6 +25,7 @@ from langflow.api.v1.schemas import (
     UploadFileResponse,
 )
 from langflow.custom.custom_component.component import Component
+from langflow.custom.eval import invalidate_component_class_cache
 from langflow.custom.utils import build_custom_component_template, get_instance_name
 from langflow.exceptions.api import APIException, InvalidChatInputError
 from langflow.graph.graph.base import Graph
@@ -31,6 +33,7 @@ from langflow.graph.schema import RunOutputs
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.interface.initialize.loading import update_params_with_load_from_db_fields
+from langflow.processing.graph_cache import get_prepared_graph
 from langflow.processing.process import process_tweaks, run_graph_internal
 from langflow.schema.graph import Tweaks
 from langflow.services.auth.utils import api_key_security, get_current_active_user
@@ -102,15 +105,18 @@ async def simple_run_flow(
         task_result: list[RunOutputs] = []
         user_id = api_key_user.id if api_key_user else None
         flow_id_str = str(flow.id)
-        if flow.data is None:
-            msg = f"Flow {flow_id_str} has no data"
-            raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
-        inputs = [
-            InputValueRequest(components=[], input_value=input_request.input_value, type=input_request.input_type)
-        ]
+        graph = await get_prepared_graph(flow, input_request.tweaks, stream=stream, user_id=user_id)
+        max_concurrency = 1
+        if input_request.input_values is not None:
+            inputs = [
+                InputValueRequest(components=[], input_value=input_value, type=input_request.input_type)
+                for input_value in input_request.input_values
+            ]
+            max_concurrency = get_settings_service().settings.run_batch_max_concurrency
+        else:
+            inputs = [
+                InputValueRequest(components=[], input_value=input_request.input_value, type=input_request.input_type)
+            ]
         if input_request.output_component:
             outputs = [input_request.output_component]
         else:
@@ -130,6 +136,7 @@ async def simple_run_flow(
             inputs=inputs,
             outputs=outputs,
             stream=stream,
+            max_concurrency=max_concurrency,
         )
 
         return RunResponse(outputs=task_result, session_id=session_id)
@@ -158,6 +165,28 @@ async def simple_run_flow_task(
         logger.exception(f"Error running flow {flow.id} task")
 
 
+async def _queue_run_flow(
+    *,
+    flow: FlowRead,
+    input_request: SimplifiedAPIRequest,
+    stream: bool,
+    api_key_user: UserRead,
+) -> JSONResponse:
+    """Queues a run of the flow in the local task queue and returns its task ID."""
+    task_service = get_task_service()
+    if task_service.backend_name != "local":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Running flows in the background requires the local task queue (LANGFLOW_TASK_BACKEND=local)",
+        )
+    if stream:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Background runs can't be streamed")
+    task_id, task = await task_service.launch_task(
+        simple_run_flow, flow=flow, input_request=input_request, api_key_user=api_key_user
+    )
+    return JSONResponse(status_code=HTTPStatus.ACCEPTED, content={"task_id": task_id, "status": task.status})
+
+
 @router.post("/run/{flow_id_or_name}", response_model_exclude_none=True)  # noqa: RUF100, FAST003
 async def simplified_run_flow(
     *,
@@ -165,6 +194,7 @@ async def simplified_run_flow(
     flow: Annotated[FlowRead | None, Depends(get_flow_by_id_or_endpoint_name)],
     input_request: SimplifiedAPIRequest | None = None,
     stream: bool = False,
+    background: bool = False,
     api_key_user: Annotated[UserRead, Depends(api_key_security)],
 ) -> RunResponse:
     """Executes a specified flow by ID.
@@ -177,11 +207,17 @@ async def simplified_run_flow(
     - `flow_id_or_name` (str): ID or endpoint name of the flow to run.
     - `input_request` (SimplifiedAPIRequest): Request object containing input values, types, output selection, tweaks,
       and session ID.
+    - `background` (bool, default=False): Queue the run in the local task queue and return its task ID right away.
+      The result can be polled at `/task/{task_id}`. Requires `LANGFLOW_TASK_BACKEND=local`.
     - `api_key_user` (User): User object derived from the provided API key, used for authentication.
     - `session_service` (SessionService): Service for managing flow sessions, essential for session reuse and caching.
 
     ### SimplifiedAPIRequest:
     - `input_value` (Optional[str], default=""): Input value to pass to the flow.
+    - `input_values` (Optional[list[str]], default=None): Input values to run through the flow as a batch. Each value
+      runs on its own copy of the flow, several at a time, and the response has one output entry per value. The
+      value at index `i` runs in the session `<session_id>-<i>`. At most `LANGFLOW_RUN_BATCH_MAX_INPUTS` values are
+      accepted.
     - `input_type` (Optional[Literal["chat", "text", "any"]], default="chat"): Type of the input value,
       determining how the input is interpreted.
     - `output_type` (Optional[Literal["chat", "text", "any", "debug"]], default="chat"): Desired type of output,
@@ -235,6 +271,14 @@ async def simplified_run_flow(
     input_request = input_request if input_request is not None else SimplifiedAPIRequest()
     if flow is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Flow not found")
+    max_batch_inputs = get_settings_service().settings.run_batch_max_inputs
+    if input_request.input_values is not None and len(input_request.input_values) > max_batch_inputs:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch can have at most {max_batch_inputs} input values, got {len(input_request.input_values)}",
+        )
+    if background:
+        return await _queue_run_flow(flow=flow, input_request=input_request, stream=stream, api_key_user=api_key_user)
     start_time = time.perf_counter()
     try:
         result = await simple_run_flow(
@@ -300,7 +344,7 @@ async def webhook_run_flow(
         background_tasks (BackgroundTasks): The background tasks manager.
 
     Returns:
-        dict: A dictionary containing the status of the task.
+        dict: A dictionary containing the status of the task, and its ID if it was queued in the local task queue.
 
     Raises:
         HTTPException: If the flow is not found or if there is an error processing the request.
@@ -309,6 +353,7 @@ async def webhook_run_flow(
     start_time = time.perf_counter()
     logger.debug("Received webhook request")
     error_msg = ""
+    task_id = None
     try:
         try:
             data = await request.body()
@@ -336,12 +381,22 @@ async def webhook_run_flow(
             )
 
             logger.debug("Starting background task")
-            background_tasks.add_task(
-                simple_run_flow_task,
-                flow=flow,
-                input_request=input_request,
-                api_key_user=user,
-            )
+            task_service = get_task_service()
+            if task_service.backend_name == "local":
+                # Queue detached copies, the arguments are stored with the task
+                task_id, _ = await task_service.launch_task(
+                    simple_run_flow,
+                    flow=FlowRead.model_validate(flow, from_attributes=True),
+                    input_request=input_request,
+                    api_key_user=UserRead.model_validate(user, from_attributes=True),
+                )
+            else:
+                background_tasks.add_task(
+                    simple_run_flow_task,
+                    flow=flow,
+                    input_request=input_request,
+                    api_key_user=user,
+                )
         except Exception as exc:
             error_msg = str(exc)
             raise HTTPException(status_code=500, detail=error_msg) from exc
@@ -356,7 +411,10 @@ async def webhook_run_flow(
             ),
         )
 
-    return {"message": "Task started in the background", "status": "in progress"}
+    response = {"message": "Task started in the background", "status": "in progress"}
+    if task_id is not None:
+        response["task_id"] = task_id
+    return response
 
 
 @router.post("/run/advanced/{flow_id}", response_model=RunResponse, response_model_exclude_none=True)
@@ -503,7 +561,7 @@ async def process() -> None:
 @router.get("/task/{task_id}")
 async def get_task_status(task_id: str) -> TaskStatusResponse:
     task_service = get_task_service()
-    task = task_service.get_task(task_id)
+    task = await task_service.aget_task(task_id)
     result = None
     if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -587,6 +645,8 @@ async def custom_component_update(
 
     """
     try:
+        # Recompile the submitted code so the template reflects the latest version of its imports
+        invalidate_component_class_cache(code_request.code)
         component = Component(_code=code_request.code)
 
         component_node, cc_instance = build_custom_component_template(
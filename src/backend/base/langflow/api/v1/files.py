@@ -1,4 +1,5 @@
 import hashlib
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from http import HTTPStatus
 from io import BytesIO
@@ -6,14 +7,15 @@ from pathlib import Path
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, Header, HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
+from loguru import logger
 
 from langflow.api.utils import CurrentActiveUser, DbSession
 from langflow.api.v1.schemas import UploadFileResponse
 from langflow.services.database.models.flow import Flow
 from langflow.services.deps import get_settings_service, get_storage_service
-from langflow.services.storage.service import StorageService
+from langflow.services.storage.service import CHUNK_SIZE, StorageService
 from langflow.services.storage.utils import build_content_type_from_extension
 
 router = APIRouter(tags=["Files"], prefix="/files")
@@ -37,6 +39,38 @@ def get_flow_id(
     return flow_id_str
 
 
+async def _read_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await file.read(CHUNK_SIZE):
+        yield chunk
+
+
+def _parse_range(range_header: str | None, file_size: int) -> tuple[int, int] | None:
+    """Returns the first and last byte of the range requested, or None to send the whole file.
+
+    Only single byte ranges are supported, other requests get the whole file.
+    """
+    if not range_header:
+        return None
+    unit, _, byte_range = range_header.partition("=")
+    first, separator, last = byte_range.strip().partition("-")
+    if unit.strip().lower() != "bytes" or not separator or "," in byte_range:
+        return None
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else file_size - 1
+        else:
+            start = max(file_size - int(last), 0)
+            end = file_size - 1
+    except ValueError:
+        return None
+    if start > end or start >= file_size:
+        raise HTTPException(
+            status_code=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, headers={"Content-Range": f"bytes */{file_size}"}
+        )
+    return start, min(end, file_size - 1)
+
+
 @router.post("/upload/{flow_id}", status_code=HTTPStatus.CREATED)
 async def upload_file(
     *,
@@ -66,12 +100,20 @@ async def upload_file(
         raise HTTPException(status_code=403, detail="You don't have access to this flow")
 
     try:
-        file_content = await file.read()
         timestamp = datetime.now(tz=timezone.utc).astimezone().strftime("%Y-%m-%d_%H-%M-%S")
-        file_name = file.filename or hashlib.sha256(file_content).hexdigest()
+        file_name = file.filename
+        if not file_name:
+            digest = hashlib.sha256()
+            async for chunk in _read_upload(file):
+                digest.update(chunk)
+            await file.seek(0)
+            file_name = digest.hexdigest()
         full_file_name = f"{timestamp}_{file_name}"
         folder = flow_id_str
-        await storage_service.save_file(flow_id=folder, file_name=full_file_name, data=file_content)
+        stored_file = await storage_service.save_file_stream(
+            flow_id=folder, file_name=full_file_name, chunks=_read_upload(file)
+        )
+        logger.debug(f"Uploaded {full_file_name}: {stored_file.size} bytes, sha256 {stored_file.sha256}")
         return UploadFileResponse(flow_id=flow_id_str, file_path=f"{folder}/{full_file_name}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -79,7 +121,10 @@ async def upload_file(
 
 @router.get("/download/{flow_id}/{file_name}")
 async def download_file(
-    file_name: str, flow_id: UUID, storage_service: Annotated[StorageService, Depends(get_storage_service)]
+    file_name: str,
+    flow_id: UUID,
+    storage_service: Annotated[StorageService, Depends(get_storage_service)],
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
 ):
     flow_id_str = str(flow_id)
     extension = file_name.split(".")[-1]
@@ -95,16 +140,26 @@ async def download_file(
         raise HTTPException(status_code=500, detail=f"Content type not found for extension {extension}")
 
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
-        headers = {
-            "Content-Disposition": f"attachment; filename={file_name} filename*=UTF-8''{file_name}",
-            "Content-Type": "application/octet-stream",
-            "Content-Length": str(len(file_content)),
-        }
-        return StreamingResponse(BytesIO(file_content), media_type=content_type, headers=headers)
+        file_size = await storage_service.get_file_size(flow_id=flow_id_str, file_name=file_name)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+    headers = {
+        "Content-Disposition": f"attachment; filename={file_name} filename*=UTF-8''{file_name}",
+        "Content-Type": "application/octet-stream",
+        "Accept-Ranges": "bytes",
+    }
+    byte_range = _parse_range(range_header, file_size)
+    if byte_range is None:
+        start, length, status_code = 0, file_size, HTTPStatus.OK
+    else:
+        start, end = byte_range
+        length, status_code = end - start + 1, HTTPStatus.PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+    headers["Content-Length"] = str(length)
+    chunks = storage_service.get_file_stream(flow_id=flow_id_str, file_name=file_name, start=start, length=length)
+    return StreamingResponse(chunks, status_code=status_code, media_type=content_type, headers=headers)
+
 
 @router.get("/images/{flow_id}/{file_name}")
 async def download_image(file_name: str, flow_id: UUID):
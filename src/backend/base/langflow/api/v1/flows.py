@@ -9,14 +9,21 @@ from typing import Annotated
 from uuid import UUID
 
 import orjson
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params, add_pagination
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlmodel import Session, and_, col, select
-
-from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, remove_api_keys, validate_is_component
+from sqlmodel import Session, and_, col, or_, select
+
+from langflow.api.utils import (
+    CurrentActiveUser,
+    DbSession,
+    cascade_delete_flow,
+    infer_is_component,
+    remove_api_keys,
+    validate_is_component,
+)
 from langflow.api.v1.schemas import FlowListCreate
 from langflow.initial_setup.setup import STARTER_FOLDER_NAME
 from langflow.services.database.models.flow import Flow, FlowCreate, FlowRead, FlowUpdate
@@ -27,7 +34,7 @@ from langflow.services.database.models.folder.model import Folder
 from langflow.services.database.models.transactions.crud import get_transactions_by_flow_id
 from langflow.services.database.models.user.model import User
 from langflow.services.database.models.vertex_builds.crud import get_vertex_builds_by_flow_id
-from langflow.services.deps import get_settings_service
+from langflow.services.deps import get_log_writer_service, get_settings_service
 from langflow.services.settings.service import SettingsService
 
 # build router
@@ -123,6 +130,18 @@ def create_flow(
     return db_flow
 
 
+def _read_flow_headers(session: Session, stmt) -> list[FlowHeader]:
+    """Reads the headers of the flows selected by `stmt`, without loading their data."""
+    headers = [FlowHeader.model_validate(row._asdict()) for row in session.exec(stmt).all()]
+    # The data is only loaded for the flows saved before is_component was stored
+    unknown = {header.id: header for header in headers if header.is_component is None}
+    if unknown:
+        for flow_id, data in session.exec(select(Flow.id, Flow.data).where(col(Flow.id).in_(unknown))).all():
+            if data:
+                unknown[flow_id].is_component = infer_is_component(data)
+    return headers
+
+
 @router.get("/", response_model=list[FlowRead] | Page[FlowRead] | list[FlowHeader], status_code=200)
 def read_flows(
     *,
@@ -134,6 +153,8 @@ def read_flows(
     folder_id: UUID | None = None,
     params: Annotated[Params, Depends()],
     header_flows: bool = False,
+    after: UUID | None = None,
+    limit: Annotated[int | None, Query(ge=1)] = None,
 ):
     """Retrieve a list of flows with pagination support.
 
@@ -150,6 +171,9 @@ def read_flows(
         params (Params): Pagination parameters.
         remove_example_flows (bool, optional): Whether to remove example flows. Defaults to False.
         header_flows (bool, optional): Whether to return only specific headers of the flows. Defaults to False.
+        after (UUID, optional): With get_all, return only the flows whose ID comes after this one.
+            Flows are ordered by ID, so passing the ID of the last flow of a response returns the next ones.
+        limit (int, optional): With get_all, the maximum number of flows to return. Defaults to all of them.
 
     Returns:
         list[FlowRead] | Page[FlowRead] | list[FlowHeader]
@@ -174,33 +198,44 @@ def read_flows(
             folder_id = default_folder_id
 
         if auth_settings.AUTO_LOGIN:
-            stmt = select(Flow).where(
-                (Flow.user_id == None) | (Flow.user_id == current_user.id)  # noqa: E711
-            )
+            conditions = [(Flow.user_id == None) | (Flow.user_id == current_user.id)]  # noqa: E711
         else:
-            stmt = select(Flow).where(Flow.user_id == current_user.id)
+            conditions = [Flow.user_id == current_user.id]
 
-        if remove_example_flows:
-            stmt = stmt.where(Flow.folder_id != starter_folder_id)
-
-        if components_only:
-            stmt = stmt.where(Flow.is_component == True)  # noqa: E712
+        if remove_example_flows and starter_folder_id:
+            conditions.append(or_(col(Flow.folder_id).is_(None), Flow.folder_id != starter_folder_id))
 
         if get_all:
-            flows = session.exec(stmt).all()
-            flows = validate_is_component(flows)
             if components_only:
-                flows = [flow for flow in flows if flow.is_component]
-            if remove_example_flows and starter_folder_id:
-                flows = [flow for flow in flows if flow.folder_id != starter_folder_id]
-            if header_flows:
-                return [
-                    {"id": flow.id, "name": flow.name, "folder_id": flow.folder_id, "is_component": flow.is_component}
-                    for flow in flows
-                ]
-            return flows
-
-        stmt = stmt.where(Flow.folder_id == folder_id)
+                # Flows saved before is_component was stored are selected too, and filtered once it's inferred
+                conditions.append(or_(Flow.is_component == True, col(Flow.is_component).is_(None)))  # noqa: E712
+
+            def read_page(after_id: UUID | None) -> list:
+                page_conditions = conditions if after_id is None else [*conditions, Flow.id > after_id]
+                if header_flows:
+                    stmt = select(
+                        Flow.id, Flow.name, Flow.folder_id, Flow.is_component, Flow.endpoint_name, Flow.description
+                    )
+                else:
+                    stmt = select(Flow)
+                stmt = stmt.where(*page_conditions).order_by(Flow.id).limit(limit)
+                if header_flows:
+                    return _read_flow_headers(session, stmt)
+                return validate_is_component(session.exec(stmt).all())
+
+            flows = read_page(after)
+            if not components_only:
+                return flows
+            components = [flow for flow in flows if flow.is_component]
+            # Keep reading while legacy flows that aren't components leave the page short
+            while limit is not None and len(flows) == limit and len(components) < limit:
+                flows = read_page(flows[-1].id)
+                components.extend(flow for flow in flows if flow.is_component)
+            return components[:limit]
+
+        if components_only:
+            conditions.append(Flow.is_component == True)  # noqa: E712
+        stmt = select(Flow).where(*conditions, Flow.folder_id == folder_id)
         return paginate(session, stmt, params=params)
 
     except Exception as e:
@@ -381,6 +416,8 @@ async def delete_multiple_flows(
 
     """
     try:
+        # Write pending logs first so none of them are inserted after the flows are gone
+        await get_log_writer_service().aflush()
         flows_to_delete = db.exec(select(Flow).where(col(Flow.id).in_(flow_ids)).where(Flow.user_id == user.id)).all()
         for flow in flows_to_delete:
             transactions_to_delete = get_transactions_by_flow_id(db, flow.id)
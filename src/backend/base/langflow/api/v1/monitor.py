@@ -16,6 +16,7 @@ from langflow.services.database.models.vertex_builds.crud import (
     get_vertex_builds_by_flow_id,
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
+from langflow.services.deps import get_log_writer_service
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
@@ -23,6 +24,7 @@ router = APIRouter(prefix="/monitor", tags=["Monitor"])
 @router.get("/builds")
 async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
     try:
+        await get_log_writer_service().aflush()
         vertex_builds = get_vertex_builds_by_flow_id(session, flow_id)
         return VertexBuildMapModel.from_list_of_dicts(vertex_builds)
     except Exception as e:
@@ -32,6 +34,7 @@ async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSessio
 @router.delete("/builds", status_code=204)
 async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> None:
     try:
+        await get_log_writer_service().aflush()
         delete_vertex_builds_by_flow_id(session, flow_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -162,6 +165,7 @@ async def get_transactions(
     session: DbSession,
 ) -> list[TransactionReadResponse]:
     try:
+        await get_log_writer_service().aflush()
         transactions = get_transactions_by_flow_id(session, flow_id)
         return [
             TransactionReadResponse(
@@ -327,6 +327,13 @@ class InputValueRequest(BaseModel):
 
 class SimplifiedAPIRequest(BaseModel):
     input_value: str | None = Field(default=None, description="The input value")
+    input_values: list[str] | None = Field(
+        default=None,
+        description=(
+            "Input values to run through the flow as a batch, one run per value. Overrides input_value. "
+            "Each value runs in its own session, named after session_id and the index of the value."
+        ),
+    )
     input_type: InputType | None = Field(default="chat", description="The input type")
     output_type: OutputType | None = Field(default="chat", description="The output type")
     output_component: str | None = Field(
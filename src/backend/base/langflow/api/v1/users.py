@@ -12,6 +12,7 @@ from langflow.api.v1.schemas import UsersResponse
 from langflow.services.auth.utils import (
     get_current_active_superuser,
     get_password_hash,
+    invalidate_user_caches,
     verify_password,
 )
 from langflow.services.database.models.folder.utils import create_default_folder_if_it_doesnt_exist
@@ -96,7 +97,10 @@ def patch_user(
     if user_db := get_user_by_id(session, user_id):
         if not update_password:
             user_update.password = user_db.password
-        return update_user(user_db, user_update, session)
+        user_db = update_user(user_db, user_update, session)
+        # Deactivated users must not keep authenticating with cached credentials
+        invalidate_user_caches(user_id)
+        return user_db
     raise HTTPException(status_code=404, detail="User not found")
 
 
@@ -119,6 +123,7 @@ def reset_password(
     user.password = new_password
     session.commit()
     session.refresh(user)
+    invalidate_user_caches(user_id)
 
     return user
 
@@ -141,5 +146,6 @@ def delete_user(
 
     session.delete(user_db)
     session.commit()
+    invalidate_user_caches(user_id)
 
     return {"detail": "User deleted"}
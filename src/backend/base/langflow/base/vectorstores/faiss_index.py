@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.faiss import dependable_faiss_import
+from loguru import logger
+
+if TYPE_CHECKING:
+    from langchain_core.documents import Document
+    from langchain_core.embeddings import Embeddings
+
+IndexSignature = tuple[int, int, int, int]
+
+_MODEL_ATTRIBUTES = ("model", "model_name", "model_id", "deployment", "repo_id")
+_DIMENSION_ATTRIBUTES = ("dimensions", "dimension", "embedding_dim", "size")
+
+
+def document_id(document: Document) -> str:
+    """Returns the id a document is stored under: a hash of its content and metadata."""
+    metadata = json.dumps(document.metadata, sort_keys=True, default=str)
+    return hashlib.sha256(f"{document.page_content}\0{metadata}".encode()).hexdigest()
+
+
+def _index_files(folder_path: Path, index_name: str) -> tuple[Path, Path]:
+    return folder_path / f"{index_name}.faiss", folder_path / f"{index_name}.pkl"
+
+
+def _fingerprint_file(folder_path: Path, index_name: str) -> Path:
+    return folder_path / f"{index_name}.embeddings.json"
+
+
+def embeddings_fingerprint(embeddings: Embeddings) -> dict[str, str | int | None]:
+    """Identifies the model `embeddings` embeds with: its class, model name and dimension, when it has them."""
+    model = next((value for name in _MODEL_ATTRIBUTES if (value := getattr(embeddings, name, None))), None)
+    dimension = next(
+        (value for name in _DIMENSION_ATTRIBUTES if isinstance(value := getattr(embeddings, name, None), int)), None
+    )
+    return {
+        "class": f"{type(embeddings).__module__}.{type(embeddings).__qualname__}",
+        "model": str(model) if model is not None else None,
+        "dimension": dimension,
+    }
+
+
+def _read_fingerprint(folder_path: Path, index_name: str) -> dict | None:
+    try:
+        return json.loads(_fingerprint_file(folder_path, index_name).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_fingerprint(folder_path: Path, index_name: str, fingerprint: dict) -> None:
+    _fingerprint_file(folder_path, index_name).write_text(json.dumps(fingerprint, sort_keys=True), encoding="utf-8")
+
+
+def _embedded_with(vector_store: FAISS, stored: dict | None, fingerprint: dict) -> bool:
+    """Whether the vectors of `vector_store` were made by the model `fingerprint` identifies."""
+    if stored != fingerprint:
+        return False
+    return fingerprint["dimension"] is None or fingerprint["dimension"] == vector_store.index.d
+
+
+def _signature(folder_path: Path, index_name: str) -> IndexSignature | None:
+    try:
+        index_stat, docstore_stat = (path.stat() for path in _index_files(folder_path, index_name))
+    except FileNotFoundError:
+        return None
+    return index_stat.st_mtime_ns, index_stat.st_size, docstore_stat.st_mtime_ns, docstore_stat.st_size
+
+
+def _with_embeddings(vector_store: FAISS, embeddings: Embeddings) -> FAISS:
+    """Returns a store that searches the index of `vector_store`, embedding queries with `embeddings`."""
+    return FAISS(
+        embedding_function=embeddings,
+        index=vector_store.index,
+        docstore=vector_store.docstore,
+        index_to_docstore_id=vector_store.index_to_docstore_id,
+        relevance_score_fn=vector_store.override_relevance_score_fn,
+        normalize_L2=vector_store._normalize_L2,
+        distance_strategy=vector_store.distance_strategy,
+    )
+
+
+def _copy(vector_store: FAISS, embeddings: Embeddings) -> FAISS:
+    """Returns a copy of `vector_store` that can be changed without affecting it."""
+    faiss = dependable_faiss_import()
+    return FAISS(
+        embedding_function=embeddings,
+        index=faiss.clone_index(vector_store.index),
+        docstore=InMemoryDocstore(dict(vector_store.docstore._dict)),
+        index_to_docstore_id=dict(vector_store.index_to_docstore_id),
+        relevance_score_fn=vector_store.override_relevance_score_fn,
+        normalize_L2=vector_store._normalize_L2,
+        distance_strategy=vector_store.distance_strategy,
+    )
+
+
+def _check_deserialization(*, allow_dangerous_deserialization: bool) -> None:
+    # FAISS.load_local checks this when the index is read, which a cached index skips
+    if not allow_dangerous_deserialization:
+        msg = (
+            "Loading a FAISS index relies on loading a pickle file, which can be modified to run arbitrary code. "
+            "Set `allow_dangerous_deserialization` to `True` if you trust the source of the index."
+        )
+        raise ValueError(msg)
+
+
+class FaissIndexCache:
+    """Keeps the FAISS indexes loaded in the process, so they aren't read from disk on every run.
+
+    An index is loaded again when the modification time or size of its files changes, so changes
+    made by another process are picked up. Indexes are evicted in least recently used order once
+    more than `maxsize` are loaded.
+
+    The cached indexes are shared by every caller and never changed: each caller gets a store
+    with its own embeddings, and changes are made to a copy that replaces the cached index once
+    it's saved.
+    """
+
+    def __init__(self, maxsize: int = 16) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._indexes: OrderedDict[tuple[str, str], tuple[IndexSignature, FAISS]] = OrderedDict()
+        self._path_locks: dict[tuple[str, str], threading.Lock] = {}
+
+    def _key(self, folder_path: Path, index_name: str) -> tuple[str, str]:
+        return str(folder_path.resolve()), index_name
+
+    def path_lock(self, folder_path: Path, index_name: str) -> threading.Lock:
+        """Returns the lock that serializes the writes to an index."""
+        with self._lock:
+            return self._path_locks.setdefault(self._key(folder_path, index_name), threading.Lock())
+
+    def load(
+        self,
+        folder_path: str | Path,
+        index_name: str,
+        embeddings: Embeddings,
+        *,
+        allow_dangerous_deserialization: bool = False,
+    ) -> FAISS | None:
+        """Returns the index saved in `folder_path`, or None if there isn't one."""
+        folder_path = Path(folder_path)
+        key = self._key(folder_path, index_name)
+        signature = _signature(folder_path, index_name)
+        if signature is None:
+            self.invalidate(folder_path, index_name)
+            return None
+        _check_deserialization(allow_dangerous_deserialization=allow_dangerous_deserialization)
+        with self._lock:
+            cached = self._indexes.get(key)
+            if cached is not None and cached[0] == signature:
+                self._indexes.move_to_end(key)
+                return _with_embeddings(cached[1], embeddings)
+        vector_store = FAISS.load_local(
+            folder_path=str(folder_path),
+            embeddings=embeddings,
+            index_name=index_name,
+            allow_dangerous_deserialization=allow_dangerous_deserialization,
+        )
+        self._set(key, signature, vector_store)
+        return _with_embeddings(vector_store, embeddings)
+
+    def save(self, folder_path: str | Path, index_name: str, vector_store: FAISS) -> None:
+        """Saves an index to `folder_path` and keeps it loaded.
+
+        The cache takes over `vector_store`, which mustn't be changed afterwards.
+        """
+        folder_path = Path(folder_path)
+        vector_store.save_local(str(folder_path), index_name)
+        signature = _signature(folder_path, index_name)
+        if signature is not None:
+            self._set(self._key(folder_path, index_name), signature, vector_store)
+
+    def invalidate(self, folder_path: str | Path, index_name: str) -> None:
+        with self._lock:
+            self._indexes.pop(self._key(Path(folder_path), index_name), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+
+    def _set(self, key: tuple[str, str], signature: IndexSignature, vector_store: FAISS) -> None:
+        with self._lock:
+            self._indexes[key] = (signature, vector_store)
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self.maxsize:
+                self._indexes.popitem(last=False)
+
+
+faiss_index_cache = FaissIndexCache()
+
+
+def sync_faiss_index(
+    folder_path: str | Path,
+    index_name: str,
+    embeddings: Embeddings,
+    documents: list[Document],
+    *,
+    allow_dangerous_deserialization: bool = False,
+) -> FAISS:
+    """Makes the index saved in `folder_path` hold exactly `documents`.
+
+    Documents are stored under a hash of their content, so only the documents that aren't in the
+    index yet are embedded, and the documents that are no longer given are removed. The index is
+    only written when it changes.
+
+    The fingerprint of the embeddings is saved next to the index, and every document is embedded
+    again when the index was made with other embeddings.
+    """
+    folder_path = Path(folder_path)
+    documents_by_id = {document_id(document): document for document in documents}
+    fingerprint = embeddings_fingerprint(embeddings)
+    with faiss_index_cache.path_lock(folder_path, index_name):
+        vector_store = faiss_index_cache.load(
+            folder_path,
+            index_name,
+            embeddings,
+            allow_dangerous_deserialization=allow_dangerous_deserialization,
+        )
+        if vector_store is not None and not _embedded_with(
+            vector_store, _read_fingerprint(folder_path, index_name), fingerprint
+        ):
+            logger.debug(f"FAISS index {index_name} was made with other embeddings, embedding every document again")
+            vector_store = None
+        if vector_store is None:
+            ids = list(documents_by_id)
+            vector_store = FAISS.from_documents(documents=list(documents_by_id.values()), embedding=embeddings, ids=ids)
+            faiss_index_cache.save(folder_path, index_name, vector_store)
+            _write_fingerprint(folder_path, index_name, fingerprint)
+            logger.debug(f"Created FAISS index {index_name} with {len(ids)} documents")
+            return _with_embeddings(vector_store, embeddings)
+
+        stored_ids = set(vector_store.index_to_docstore_id.values())
+        new_ids = [id_ for id_ in documents_by_id if id_ not in stored_ids]
+        stale_ids = [id_ for id_ in stored_ids if id_ not in documents_by_id]
+        if not new_ids and not stale_ids:
+            logger.debug(f"FAISS index {index_name} is up to date")
+            return vector_store
+        # Searches running on the cached index keep using it until the copy replaces it
+        vector_store = _copy(vector_store, embeddings)
+        if stale_ids:
+            vector_store.delete(stale_ids)
+        if new_ids:
+            vector_store.add_documents([documents_by_id[id_] for id_ in new_ids], ids=new_ids)
+        faiss_index_cache.save(folder_path, index_name, vector_store)
+        logger.debug(f"Updated FAISS index {index_name}: {len(new_ids)} added, {len(stale_ids)} removed")
+        return _with_embeddings(vector_store, embeddings)
@@ -1,6 +1,7 @@
 from langchain_community.vectorstores import FAISS
 from loguru import logger
 
+from langflow.base.vectorstores.faiss_index import faiss_index_cache, sync_faiss_index
 from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
 from langflow.helpers.data import docs_to_data
 from langflow.io import BoolInput, DataInput, HandleInput, IntInput, MultilineInput, StrInput
@@ -56,7 +57,11 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
 
     @check_cached_vector_store
     def build_vector_store(self) -> FAISS:
-        """Builds the FAISS object."""
+        """Builds the FAISS object.
+
+        Only the ingested documents that aren't in the saved index yet are embedded. Without
+        documents to ingest, the saved index is used as is.
+        """
         if not self.persist_directory:
             msg = "Folder path is required to save the FAISS index."
             raise ValueError(msg)
@@ -70,10 +75,23 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             else:
                 documents.append(_input)
 
-        faiss = FAISS.from_documents(documents=documents, embedding=self.embedding)
-        faiss.save_local(str(path), self.index_name)
-
-        return faiss
+        if not documents:
+            vector_store = faiss_index_cache.load(
+                path,
+                self.index_name,
+                self.embedding,
+                allow_dangerous_deserialization=self.allow_dangerous_deserialization,
+            )
+            if vector_store is not None:
+                return vector_store
+
+        return sync_faiss_index(
+            path,
+            self.index_name,
+            self.embedding,
+            documents,
+            allow_dangerous_deserialization=self.allow_dangerous_deserialization,
+        )
 
     def search_documents(self) -> list[Data]:
         """Search for documents in the FAISS vector store."""
@@ -82,10 +100,10 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             raise ValueError(msg)
         path = self.resolve_path(self.persist_directory)
 
-        vector_store = FAISS.load_local(
-            folder_path=path,
-            embeddings=self.embedding,
-            index_name=self.index_name,
+        vector_store = faiss_index_cache.load(
+            path,
+            self.index_name,
+            self.embedding,
             allow_dangerous_deserialization=self.allow_dangerous_deserialization,
         )
 
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import ast
 import inspect
-from copy import deepcopy
+from copy import copy, deepcopy
+from dataclasses import dataclass, field
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, ClassVar, get_type_hints
 
@@ -53,6 +54,30 @@ BACKWARDS_COMPATIBLE_ATTRIBUTES = ["user_id", "vertex", "tracing_service"]
 CONFIG_ATTRIBUTES = ["_display_name", "_description", "_icon", "_name", "_metadata"]
 
 
+@dataclass
+class _ComponentClassMetadata:
+    """What a Component class derives from its source, computed once for all its instances."""
+
+    source: str | None = None
+    return_types: dict[str, list[str]] = field(default_factory=dict)
+    required_inputs: dict[tuple[str, frozenset[str]], list[str]] = field(default_factory=dict)
+
+
+def _copy_field(template: BaseModel) -> Any:
+    """Copies a class-level Input or Output for a component instance.
+
+    Only the containers an instance can change in place are copied, instead of deep copying the
+    whole model: the value is deep copied, and the other lists and dicts are copied one level deep.
+    """
+    copied = template.model_copy()
+    for key, value in template.__dict__.items():
+        if key == "value":
+            copied.__dict__[key] = deepcopy(value)
+        elif isinstance(value, list | dict | set):
+            copied.__dict__[key] = copy(value)
+    return copied
+
+
 class Component(CustomComponent):
     inputs: list[InputTypes] = []
     outputs: list[Output] = []
@@ -60,6 +85,7 @@ class Component(CustomComponent):
     _output_logs: dict[str, Log] = {}
     _current_output: str = ""
     _metadata: dict = {}
+    _class_metadata: ClassVar[_ComponentClassMetadata | None] = None
 
     def __init__(self, **kwargs) -> None:
         # if key starts with _ it is a config
@@ -153,20 +179,31 @@ class Component(CustomComponent):
         memo[id(self)] = new_component
         return new_component
 
+    @classmethod
+    def _get_class_metadata(cls) -> _ComponentClassMetadata:
+        # Looked up in the class' own namespace so subclasses don't share their parent's metadata
+        metadata = cls.__dict__.get("_class_metadata")
+        if metadata is None:
+            metadata = _ComponentClassMetadata()
+            cls._class_metadata = metadata
+        return metadata
+
     def set_class_code(self) -> None:
         # Get the source code of the calling class
         if self._code:
             return
-        try:
-            module = inspect.getmodule(self.__class__)
-            if module is None:
-                msg = "Could not find module for class"
-                raise ValueError(msg)
-            class_code = inspect.getsource(module)
-            self._code = class_code
-        except OSError as e:
-            msg = f"Could not find source code for {self.__class__.__name__}"
-            raise ValueError(msg) from e
+        metadata = self._get_class_metadata()
+        if metadata.source is None:
+            try:
+                module = inspect.getmodule(self.__class__)
+                if module is None:
+                    msg = "Could not find module for class"
+                    raise ValueError(msg)
+                metadata.source = inspect.getsource(module)
+            except OSError as e:
+                msg = f"Could not find source code for {self.__class__.__name__}"
+                raise ValueError(msg) from e
+        self._code = metadata.source
 
     def set(self, **kwargs):
         """Connects the component to other components or sets parameters and attributes.
@@ -276,9 +313,9 @@ class Component(CustomComponent):
             if output.name is None:
                 msg = "Output name cannot be None."
                 raise ValueError(msg)
-            # Deepcopy is required to avoid modifying the original component;
+            # The copy is required to avoid modifying the original component;
             # allows each instance of each component to modify its own output
-            self._outputs_map[output.name] = deepcopy(output)
+            self._outputs_map[output.name] = _copy_field(output)
 
     def map_inputs(self, inputs: list[InputTypes]) -> None:
         """Maps the given inputs to the component.
@@ -294,7 +331,7 @@ class Component(CustomComponent):
             if input_.name is None:
                 msg = "Input name cannot be None."
                 raise ValueError(msg)
-            self._inputs[input_.name] = deepcopy(input_)
+            self._inputs[input_.name] = _copy_field(input_)
 
     def validate(self, params: dict) -> None:
         """Validates the component parameters.
@@ -319,21 +356,30 @@ class Component(CustomComponent):
             output.set_selected()
 
     def _set_output_required_inputs(self) -> None:
+        metadata = self._get_class_metadata()
+        input_names = frozenset(self._inputs)
         for output in self.outputs:
             if not output.method:
                 continue
             method = getattr(self, output.method, None)
             if not method or not callable(method):
                 continue
-            try:
-                source_code = inspect.getsource(method)
-                ast_tree = ast.parse(dedent(source_code))
-            except Exception:  # noqa: BLE001
-                ast_tree = ast.parse(dedent(self._code or ""))
-
-            visitor = RequiredInputsVisitor(self._inputs)
-            visitor.visit(ast_tree)
-            output.required_inputs = sorted(visitor.required_inputs)
+            key = (output.method, input_names)
+            required_inputs = metadata.required_inputs.get(key)
+            if required_inputs is None:
+                try:
+                    source_code = inspect.getsource(method)
+                    ast_tree = ast.parse(dedent(source_code))
+                except Exception:  # noqa: BLE001
+                    ast_tree = ast.parse(dedent(self._code or ""))
+
+                visitor = RequiredInputsVisitor(self._inputs)
+                visitor.visit(ast_tree)
+                required_inputs = sorted(visitor.required_inputs)
+                metadata.required_inputs[key] = required_inputs
+            output.required_inputs = list(required_inputs)
+            if output.name in self._outputs_map:
+                self._outputs_map[output.name].required_inputs = list(required_inputs)
 
     def get_output_by_method(self, method: Callable):
         # method is a callable and output.method is a string
@@ -571,10 +617,18 @@ class Component(CustomComponent):
                 raise ValueError(msg) from e
 
     def _get_method_return_type(self, method_name: str) -> list[str]:
+        # Methods defined on the class have the same return type for all its instances
+        cacheable = inspect.isfunction(getattr(type(self), method_name, None))
+        metadata = self._get_class_metadata()
+        if cacheable and method_name in metadata.return_types:
+            return list(metadata.return_types[method_name])
         method = getattr(self, method_name)
         return_type = get_type_hints(method)["return"]
         extracted_return_types = self._extract_return_type(return_type)
-        return [format_type(extracted_return_type) for extracted_return_type in extracted_return_types]
+        return_types = [format_type(extracted_return_type) for extracted_return_type in extracted_return_types]
+        if cacheable:
+            metadata.return_types[method_name] = return_types
+        return list(return_types)
 
     def _update_template(self, frontend_node: dict):
         return frontend_node
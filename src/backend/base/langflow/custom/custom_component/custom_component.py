@@ -424,9 +424,12 @@ class CustomComponent(BaseComponent):
                 msg = f"User id is not set for {self.__class__.__name__}"
                 raise ValueError(msg)
             variable_service = get_variable_service()  # Get service instance
+            user_id = self.user_id or ""
+            value = variable_service.get_cached_variable(user_id=user_id, name=name, field=field)
+            if value is not None:
+                return value
             # Retrieve and decrypt the variable by name for the current user
             with session_scope() as session:
-                user_id = self.user_id or ""
                 return variable_service.get_variable(user_id=user_id, name=name, field=field, session=session)
 
         return get_variable
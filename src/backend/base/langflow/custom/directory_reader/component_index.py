@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from loguru import logger
+
+import langflow
+from langflow.services.settings.feature_flags import FEATURE_FLAGS
+from langflow.utils.version import get_version_info
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from langflow.services.settings.base import Settings
+
+INDEX_FILE_NAME = "component_index.json"
+COMPONENTS_PATH = Path(langflow.__file__).parent / "components"
+
+
+@dataclass
+class IndexedComponent:
+    mtime_ns: int
+    size: int
+    sha256: str
+    menu_name: str
+    component_name: str
+    template: dict[str, Any]
+    dependencies: dict[str, list[int]] = field(default_factory=dict)
+    """The modification time and size of the component files the file imports."""
+    environment: dict[str, str | None] = field(default_factory=dict)
+    """The environment variables the file and its dependencies read, with their values."""
+
+
+def _file_hash(file_path: Path) -> str:
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def _file_stat(file_path: str | Path) -> list[int] | None:
+    try:
+        stat = Path(file_path).stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _langflow_fingerprint() -> str:
+    """Identifies the langflow code the component templates are built with.
+
+    Templates also depend on the base classes and inputs the component files import, and on the
+    installed packages, so the modification times of the package files and the versions of the
+    installed distributions are part of the fingerprint along with the version.
+    """
+    package_path = Path(langflow.__file__).parent
+    digest = hashlib.sha256()
+    digest.update(str(get_version_info().get("version")).encode())
+    digest.update(json.dumps(FEATURE_FLAGS.model_dump(), sort_keys=True, default=str).encode())
+    distributions = sorted(f"{dist.metadata['Name']}=={dist.version}" for dist in metadata.distributions())
+    digest.update("\n".join(distributions).encode())
+    for file_path in sorted(package_path.rglob("*.py")):
+        if file_path.is_relative_to(COMPONENTS_PATH):
+            continue
+        digest.update(f"{file_path}:{file_path.stat().st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def _imported_paths(tree: ast.AST, file_path: Path) -> Iterator[Path]:
+    """Yields the paths, without suffix, of the component modules imported in `tree`."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.startswith("langflow.components."):
+                    yield COMPONENTS_PATH.joinpath(*alias.name.split(".")[2:])
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                if node.level > len(file_path.parents):
+                    continue
+                base = file_path.parents[node.level - 1]
+                if node.module:
+                    base = base.joinpath(*node.module.split("."))
+            elif node.module and (node.module + ".").startswith("langflow.components."):
+                base = COMPONENTS_PATH.joinpath(*node.module.split(".")[2:])
+            else:
+                continue
+            # The __init__ of the components package imports every component
+            if base != COMPONENTS_PATH:
+                yield base
+            for alias in node.names:
+                yield base / alias.name
+
+
+def _read_environment_variables(tree: ast.AST) -> Iterator[str]:
+    """Yields the names of the environment variables read with os.getenv or os.environ."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and node.args and isinstance(node.args[0], ast.Constant):
+            function = ast.unparse(node.func)
+            if function in {"os.getenv", "getenv", "os.environ.get", "environ.get"}:
+                yield str(node.args[0].value)
+        elif isinstance(node, ast.Subscript) and isinstance(node.slice, ast.Constant):
+            if ast.unparse(node.value) in {"os.environ", "environ"}:
+                yield str(node.slice.value)
+
+
+def _inspect_file(file_path: Path) -> tuple[set[Path], set[str]]:
+    """Returns the component files `file_path` imports, directly or not, and the environment variables they read."""
+    dependencies: set[Path] = set()
+    variables: set[str] = set()
+    pending = [file_path]
+    while pending:
+        current = pending.pop()
+        try:
+            tree = ast.parse(current.read_bytes())
+        except (OSError, SyntaxError, ValueError):
+            continue
+        variables.update(_read_environment_variables(tree))
+        for path in _imported_paths(tree, current):
+            for candidate in (path.with_suffix(".py"), path / "__init__.py"):
+                if candidate != file_path and candidate not in dependencies and candidate.is_file():
+                    dependencies.add(candidate)
+                    pending.append(candidate)
+    return dependencies, variables
+
+
+class ComponentIndex:
+    """The templates built from component files, kept on disk so unchanged files aren't built again.
+
+    Each template is stored with the modification time, size and hash of the file it was built
+    from, the state of the component files it imports and the values of the environment variables
+    it reads, and is used as long as none of them change. The whole index is discarded when the
+    langflow version, code or installed packages change. The index is written to a temporary file
+    that replaces the previous one, so processes sharing it only ever read a complete index.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.fingerprint = _langflow_fingerprint()
+        self._entries: dict[str, IndexedComponent] = {}
+        self._changed = False
+        self._load()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> ComponentIndex | None:
+        if not settings.component_index_enabled:
+            return None
+        if settings.component_index_path:
+            return cls(settings.component_index_path)
+        if not settings.config_dir:
+            return None
+        return cls(Path(settings.config_dir) / INDEX_FILE_NAME)
+
+    def _load(self) -> None:
+        try:
+            data = orjson.loads(self.path.read_bytes())
+            if not isinstance(data, dict) or data.get("fingerprint") != self.fingerprint:
+                logger.debug("Langflow changed since the component index was built, discarding it")
+                return
+            self._entries = {key: IndexedComponent(**entry) for key, entry in data["entries"].items()}
+        except FileNotFoundError:
+            return
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug(f"Could not read the component index at {self.path}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, file_path: str | Path) -> IndexedComponent | None:
+        """Returns the indexed component of a file, or None if the file changed since it was indexed."""
+        file_path = Path(file_path)
+        entry = self._entries.get(str(file_path))
+        if entry is None or not self._is_current(entry):
+            return None
+        try:
+            stat = file_path.stat()
+            if (stat.st_mtime_ns, stat.st_size) == (entry.mtime_ns, entry.size):
+                return entry
+            if stat.st_size == entry.size and _file_hash(file_path) == entry.sha256:
+                # Touched but not changed
+                entry.mtime_ns = stat.st_mtime_ns
+                self._changed = True
+                return entry
+        except OSError:
+            pass
+        return None
+
+    @staticmethod
+    def _is_current(entry: IndexedComponent) -> bool:
+        return all(
+            _file_stat(dependency) == dependency_stat for dependency, dependency_stat in entry.dependencies.items()
+        ) and all(os.environ.get(name) == value for name, value in entry.environment.items())
+
+    def add(self, file_path: str | Path, menu_name: str, component_name: str, template: dict[str, Any]) -> None:
+        file_path = Path(file_path)
+        try:
+            stat = file_path.stat()
+            sha256 = _file_hash(file_path)
+        except OSError:
+            return
+        dependencies, variables = _inspect_file(file_path)
+        self._entries[str(file_path)] = IndexedComponent(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            sha256=sha256,
+            menu_name=menu_name,
+            component_name=component_name,
+            template=template,
+            dependencies={
+                str(dependency): dependency_stat
+                for dependency in dependencies
+                if (dependency_stat := _file_stat(dependency)) is not None
+            },
+            environment={name: os.environ.get(name) for name in sorted(variables)},
+        )
+        self._changed = True
+
+    def retain(self, directory: str | Path, file_paths: Iterable[str | Path]) -> None:
+        """Removes the entries of the files of `directory` that aren't in `file_paths`."""
+        directory = Path(directory)
+        keep = {str(file_path) for file_path in file_paths}
+        for key in [key for key in self._entries if Path(key).is_relative_to(directory) and key not in keep]:
+            del self._entries[key]
+            self._changed = True
+
+    def save(self) -> None:
+        if not self._changed:
+            return
+        temp_path: Path | None = None
+        try:
+            data = orjson.dumps(
+                {
+                    "fingerprint": self.fingerprint,
+                    "entries": {key: asdict(entry) for key, entry in self._entries.items()},
+                },
+                option=orjson.OPT_NON_STR_KEYS,
+                default=str,
+            )
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=self.path.parent, suffix=".tmp", delete=False) as file:
+                temp_path = Path(file.name)
+                file.write(data)
+            temp_path.replace(self.path)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).warning(f"Could not write the component index at {self.path}")
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
+            return
+        self._changed = False
+        logger.debug(f"Saved {len(self._entries)} components to the component index at {self.path}")
@@ -1,6 +1,9 @@
 import ast
 import asyncio
+import multiprocessing
 import zlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from loguru import logger
@@ -12,6 +15,27 @@ class CustomComponentPathValueError(ValueError):
     pass
 
 
+MAX_WORKERS = 8
+# The number of files processed at the same time on threads when no worker processes are used
+MAX_THREADS = 8
+
+
+def _get_mp_context():
+    # Workers are forked from a server process that imported langflow once, instead of from
+    # this process, which may have threads running
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def _discover_component(file_path, *, directory_path, compress_code_field: bool) -> dict:
+    """Runs in a worker process, see DirectoryReader.discover_component."""
+    reader = DirectoryReader(directory_path, compress_code_field=compress_code_field, max_workers=1)
+    return reader.discover_component(file_path, build=True)
+
+
 class StringCompressor:
     def __init__(self, input_string) -> None:
         """Initialize StringCompressor with a string to compress."""
@@ -39,10 +63,16 @@ class DirectoryReader:
     # the custom components from this directory.
     base_path = ""
 
-    def __init__(self, directory_path, *, compress_code_field=False) -> None:
-        """Initialize DirectoryReader with a directory path and a flag indicating whether to compress the code."""
+    def __init__(self, directory_path, *, compress_code_field=False, max_workers: int = 1) -> None:
+        """Initialize DirectoryReader with a directory path and a flag indicating whether to compress the code.
+
+        Component files are processed by up to `max_workers` processes, at most 8. With 1, the default,
+        they are processed in this process, on up to 8 threads at a time when building the menu list
+        asynchronously.
+        """
         self.directory_path = directory_path
         self.compress_code_field = compress_code_field
+        self.max_workers = min(max(max_workers, 1), MAX_WORKERS)
 
     def get_safe_path(self):
         """Check if the path is valid and return it, or None if it's not."""
@@ -66,7 +96,13 @@ class DirectoryReader:
             for component in menu["components"]:
                 try:
                     if component["error"] if with_errors else not component["error"]:
-                        component_tuple = (*build_component(component), component)
+                        # Components processed by a worker process were built there
+                        if "built" in component:
+                            if component["built"] is None:
+                                continue
+                            component_tuple = (*component["built"], component)
+                        else:
+                            component_tuple = (*build_component(component), component)
                         components.append(component_tuple)
                 except Exception:  # noqa: BLE001
                     logger.debug(f"Error while loading component {component['name']} from {component['file']}")
@@ -203,132 +239,139 @@ class DirectoryReader:
             file_content = str(StringCompressor(file_content).compress_string())
         return True, file_content
 
-    def build_component_menu_list(self, file_paths):
-        """Build a list of menus with their components from the .py files in the directory."""
-        response = {"menu": []}
-        logger.debug("-------------------- Building component menu list --------------------")
+    def discover_component(self, file_path, *, build: bool = False) -> dict:
+        """Process a component file and return its information for the component menu.
 
-        for file_path in file_paths:
-            _file_path = Path(file_path)
-            menu_name = _file_path.parent.name
-            filename = _file_path.name
+        Errors are kept in the returned information, so a file that can't be processed doesn't
+        affect the others. If `build` is True, the component template is built as well.
+        """
+        _file_path = Path(file_path)
+        try:
             validation_result, result_content = self.process_file(file_path)
-            if not validation_result:
-                logger.error(f"Error while processing file {file_path}")
-
-            menu_result = self.find_menu(response, menu_name) or {
-                "name": menu_name,
-                "path": str(_file_path.parent),
-                "components": [],
-            }
-            component_name = filename.split(".")[0]
-            # This is the name of the file which will be displayed in the UI
-            # We need to change it from snake_case to CamelCase
-
-            # first check if it's already CamelCase
-            if "_" in component_name:
-                component_name_camelcase = " ".join(word.title() for word in component_name.split("_"))
-            else:
-                component_name_camelcase = component_name
-
-            if validation_result:
-                try:
-                    output_types = self.get_output_types_from_code(result_content)
-                except Exception:  # noqa: BLE001
-                    logger.opt(exception=True).debug("Error while getting output types from code")
-                    output_types = [component_name_camelcase]
-            else:
+        except Exception as exc:  # noqa: BLE001
+            logger.opt(exception=True).debug(f"Error while processing file {file_path}")
+            validation_result, result_content = False, f"Error while processing {_file_path.name}: {exc}"
+        if not validation_result:
+            logger.error(f"Error while processing file {file_path}")
+
+        component_name = _file_path.name.split(".")[0]
+        # This is the name of the file which will be displayed in the UI
+        # We need to change it from snake_case to CamelCase
+
+        # first check if it's already CamelCase
+        if "_" in component_name:
+            component_name_camelcase = " ".join(word.title() for word in component_name.split("_"))
+        else:
+            component_name_camelcase = component_name
+
+        if validation_result:
+            try:
+                output_types = self.get_output_types_from_code(result_content)
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).debug("Error while getting output types from code")
                 output_types = [component_name_camelcase]
+        else:
+            output_types = [component_name_camelcase]
+
+        component_info = {
+            "name": component_name_camelcase,
+            "output_types": output_types,
+            "file": _file_path.name,
+            "code": result_content if validation_result else "",
+            "error": "" if validation_result else result_content,
+        }
+        if build:
+            component_info["built"] = self._build_component(component_info)
+        return component_info
 
-            component_info = {
-                "name": component_name_camelcase,
-                "output_types": output_types,
-                "file": filename,
-                "code": result_content if validation_result else "",
-                "error": "" if validation_result else result_content,
-            }
-            menu_result["components"].append(component_info)
+    @staticmethod
+    def _build_component(component_info: dict) -> tuple[str, dict] | None:
+        from langflow.custom.utils import build_component
 
-            if menu_result not in response["menu"]:
+        if component_info["error"]:
+            return None
+        try:
+            return build_component(component_info)
+        except Exception:  # noqa: BLE001
+            logger.debug(f"Error while loading component {component_info['name']} from {component_info['file']}")
+            return None
+
+    def _menu_list(self, file_paths, component_infos) -> dict:
+        response: dict = {"menu": []}
+        for file_path, component_info in zip(file_paths, component_infos, strict=True):
+            _file_path = Path(file_path)
+            menu_name = _file_path.parent.name
+            menu_result = self.find_menu(response, menu_name)
+            if menu_result is None:
+                menu_result = {"name": menu_name, "path": str(_file_path.parent), "components": []}
                 response["menu"].append(menu_result)
+            menu_result["components"].append(component_info)
+        return response
+
+    def _pool_size(self, file_paths) -> int:
+        return min(self.max_workers, len(file_paths))
+
+    def _create_pool(self, max_workers: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=max_workers, mp_context=_get_mp_context())
+
+    def _worker_discover_component(self):
+        return partial(
+            _discover_component, directory_path=self.directory_path, compress_code_field=self.compress_code_field
+        )
+
+    def build_component_menu_list(self, file_paths):
+        """Build a list of menus with their components from the .py files in the directory."""
+        logger.debug("-------------------- Building component menu list --------------------")
+        pool_size = self._pool_size(file_paths)
+        if pool_size > 1:
+            with self._create_pool(pool_size) as executor:
+                discover = self._worker_discover_component()
+                futures = [executor.submit(discover, file_path) for file_path in file_paths]
+                component_infos = [
+                    self._future_result(future, file_path)
+                    for future, file_path in zip(futures, file_paths, strict=True)
+                ]
+        else:
+            component_infos = [self.discover_component(file_path) for file_path in file_paths]
+        response = self._menu_list(file_paths, component_infos)
         logger.debug("-------------------- Component menu list built --------------------")
         return response
 
-    async def process_file_async(self, file_path):
+    def _future_result(self, future, file_path) -> dict:
         try:
-            file_content = self.read_file_content(file_path)
+            return future.result()
         except Exception:  # noqa: BLE001
-            logger.exception(f"Error while reading file {file_path}")
-            return False, f"Could not read {file_path}"
+            # The worker process died, process the file here instead
+            logger.opt(exception=True).warning(f"Error while processing file {file_path} in a worker process")
+            return self.discover_component(file_path, build=True)
 
-        if file_content is None:
-            return False, f"Could not read {file_path}"
-        if self.is_empty_file(file_content):
-            return False, "Empty file"
-        if not self.validate_code(file_content):
-            return False, "Syntax error"
-        if self._is_type_hint_used_in_args("Optional", file_content) and not self._is_type_hint_imported(
-            "Optional", file_content
-        ):
-            return (
-                False,
-                "Type hint 'Optional' is used but not imported in the code.",
-            )
-        if self.compress_code_field:
-            file_content = str(StringCompressor(file_content).compress_string())
-        return True, file_content
+    async def process_file_async(self, file_path):
+        return await asyncio.to_thread(self.process_file, file_path)
 
     async def get_output_types_from_code_async(self, code: str):
         return await asyncio.to_thread(self.get_output_types_from_code, code)
 
     async def abuild_component_menu_list(self, file_paths):
-        response = {"menu": []}
         logger.debug("-------------------- Async Building component menu list --------------------")
-
-        tasks = [self.process_file_async(file_path) for file_path in file_paths]
-        results = await asyncio.gather(*tasks)
-
-        for file_path, (validation_result, result_content) in zip(file_paths, results, strict=True):
-            _file_path = Path(file_path)
-            menu_name = _file_path.parent.name
-            filename = _file_path.name
-
-            if not validation_result:
-                logger.error(f"Error while processing file {file_path}")
-
-            menu_result = self.find_menu(response, menu_name) or {
-                "name": menu_name,
-                "path": str(_file_path.parent),
-                "components": [],
-            }
-            component_name = filename.split(".")[0]
-
-            if "_" in component_name:
-                component_name_camelcase = " ".join(word.title() for word in component_name.split("_"))
-            else:
-                component_name_camelcase = component_name
-
-            if validation_result:
-                try:
-                    output_types = await self.get_output_types_from_code_async(result_content)
-                except Exception:  # noqa: BLE001
-                    logger.exception("Error while getting output types from code")
-                    output_types = [component_name_camelcase]
-            else:
-                output_types = [component_name_camelcase]
-
-            component_info = {
-                "name": component_name_camelcase,
-                "output_types": output_types,
-                "file": filename,
-                "code": result_content if validation_result else "",
-                "error": "" if validation_result else result_content,
-            }
-            menu_result["components"].append(component_info)
-
-            if menu_result not in response["menu"]:
-                response["menu"].append(menu_result)
-
+        pool_size = self._pool_size(file_paths)
+        if pool_size > 1:
+            loop = asyncio.get_running_loop()
+            with self._create_pool(pool_size) as executor:
+                discover = self._worker_discover_component()
+                futures = [loop.run_in_executor(executor, discover, file_path) for file_path in file_paths]
+                await asyncio.wait(futures)
+            component_infos = [
+                self._future_result(future, file_path) for future, file_path in zip(futures, file_paths, strict=True)
+            ]
+        else:
+            semaphore = asyncio.Semaphore(MAX_THREADS)
+
+            async def discover(file_path):
+                async with semaphore:
+                    return await asyncio.to_thread(self.discover_component, file_path)
+
+            component_infos = await asyncio.gather(*[discover(file_path) for file_path in file_paths])
+        response = self._menu_list(file_paths, component_infos)
         logger.debug("-------------------- Component menu list built --------------------")
         return response
 
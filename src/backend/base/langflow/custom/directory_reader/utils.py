@@ -1,8 +1,16 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 from loguru import logger
 
 from langflow.custom.directory_reader import DirectoryReader
 from langflow.template.frontend_node.custom_components import CustomComponentFrontendNode
 
+if TYPE_CHECKING:
+    from langflow.custom.directory_reader.component_index import ComponentIndex
+
 
 def merge_nested_dicts_with_renaming(dict1, dict2):
     for key, value in dict2.items():
@@ -81,16 +89,49 @@ def build_custom_component_list_from_path(path: str):
     return merge_nested_dicts_with_renaming(valid_menu, invalid_menu)
 
 
-async def abuild_custom_component_list_from_path(path: str):
-    """Build a list of custom components for the langchain from a given path."""
-    file_list = load_files_from_path(path)
-    reader = DirectoryReader(path, compress_code_field=False)
-
-    valid_components, invalid_components = await abuild_and_validate_all_files(reader, file_list)
-
-    valid_menu = build_valid_menu(valid_components)
-    invalid_menu = build_invalid_menu(invalid_components)
+async def abuild_custom_component_list_from_path(
+    path: str, index: ComponentIndex | None = None, *, max_workers: int = 1
+):
+    """Build a list of custom components for the langchain from a given path.
 
+    If an index is given, the files it holds an up to date template for aren't built, and the
+    templates of the files that are built are added to it. The files are built in up to
+    `max_workers` processes.
+    """
+    file_list = load_files_from_path(path)
+    reader = DirectoryReader(path, compress_code_field=False, max_workers=max_workers)
+    if index is None:
+        valid_components, invalid_components = await abuild_and_validate_all_files(reader, file_list)
+        return merge_nested_dicts_with_renaming(
+            build_valid_menu(valid_components), build_invalid_menu(invalid_components)
+        )
+
+    indexed = {file_path: entry for file_path in file_list if (entry := index.get(file_path)) is not None}
+    files_to_build = [file_path for file_path in file_list if file_path not in indexed]
+    logger.debug(f"Component index has {len(indexed)} of {len(file_list)} files from {path}")
+    built: dict[str, tuple[str, str, dict]] = {}
+    invalid_menu = {}
+    if files_to_build:
+        valid_components, invalid_components = await abuild_and_validate_all_files(reader, files_to_build)
+        for menu_item in valid_components["menu"]:
+            for component_name, component_template, component in menu_item["components"]:
+                file_path = str(Path(menu_item["path"]) / component["file"])
+                built[file_path] = (menu_item["name"], component_name, component_template)
+                index.add(file_path, menu_item["name"], component_name, component_template)
+        invalid_menu = build_invalid_menu(invalid_components)
+    index.retain(path, file_list)
+
+    # Keep the order the components would have if they were all built
+    valid_menu: dict[str, dict] = {}
+    for file_path in file_list:
+        if file_path in indexed:
+            entry = indexed[file_path]
+            menu_name, component_name, component_template = entry.menu_name, entry.component_name, entry.template
+        elif file_path in built:
+            menu_name, component_name, component_template = built[file_path]
+        else:
+            continue
+        valid_menu.setdefault(menu_name, {})[component_name] = component_template
     return merge_nested_dicts_with_renaming(valid_menu, invalid_menu)
 
 
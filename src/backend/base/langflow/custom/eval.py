@@ -1,12 +1,100 @@
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+from langflow.services.telemetry import metrics
 from langflow.utils import validate
 
 if TYPE_CHECKING:
     from langflow.custom import CustomComponent
 
 
+class ComponentClassCache:
+    """A thread-safe LRU cache of classes compiled from custom component code.
+
+    Entries are keyed by a hash of the code string, so identical code is parsed,
+    imported and executed only once per process.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._classes: OrderedDict[str, type] = OrderedDict()
+
+    @staticmethod
+    def hash_code(code: str) -> str:
+        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+    def get(self, code: str) -> type | None:
+        key = self.hash_code(code)
+        with self._lock:
+            class_object = self._classes.get(key)
+            if class_object is None:
+                self.misses += 1
+                metrics.record_cache_request("component_class", hit=False)
+                return None
+            self._classes.move_to_end(key)
+            self.hits += 1
+            metrics.record_cache_request("component_class", hit=True)
+            return class_object
+
+    def set(self, code: str, class_object: type) -> None:
+        if self.maxsize <= 0:
+            return
+        key = self.hash_code(code)
+        with self._lock:
+            self._classes[key] = class_object
+            self._classes.move_to_end(key)
+            while len(self._classes) > self.maxsize:
+                self._classes.popitem(last=False)
+
+    def invalidate(self, code: str | None = None) -> None:
+        """Remove the class compiled from `code`, or every class if no code is given."""
+        with self._lock:
+            if code is None:
+                self._classes.clear()
+            else:
+                self._classes.pop(self.hash_code(code), None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._classes), "maxsize": self.maxsize}
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+
+_component_class_cache: ComponentClassCache | None = None
+
+
+def get_component_class_cache() -> ComponentClassCache:
+    global _component_class_cache  # noqa: PLW0603
+    if _component_class_cache is None:
+        from langflow.services.deps import get_settings_service
+
+        maxsize = get_settings_service().settings.component_class_cache_size
+        _component_class_cache = ComponentClassCache(maxsize=maxsize)
+    return _component_class_cache
+
+
+def invalidate_component_class_cache(code: str | None = None) -> None:
+    """Drop cached classes so the next evaluation re-executes the component code."""
+    get_component_class_cache().invalidate(code)
+
+
 def eval_custom_component_code(code: str) -> type["CustomComponent"]:
-    """Evaluate custom component code."""
-    class_name = validate.extract_class_name(code)
-    return validate.create_class(code, class_name)
+    """Evaluate custom component code.
+
+    The resulting class is cached by code hash, so evaluating the same code again
+    returns the same class without re-parsing or re-executing it.
+    """
+    cache = get_component_class_cache()
+    class_object = cache.get(code)
+    if class_object is None:
+        class_name = validate.extract_class_name(code)
+        class_object = validate.create_class(code, class_name)
+        cache.set(code, class_object)
+    return class_object
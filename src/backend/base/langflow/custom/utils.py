@@ -1,8 +1,9 @@
 import ast
+import asyncio
 import contextlib
 import re
 import traceback
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from fastapi import HTTPException
@@ -27,6 +28,9 @@ from langflow.type_extraction.type_extraction import extract_inner_type
 from langflow.utils import validate
 from langflow.utils.util import get_base_classes
 
+if TYPE_CHECKING:
+    from langflow.custom.directory_reader.component_index import ComponentIndex
+
 
 class UpdateBuildConfigError(Exception):
     pass
@@ -145,7 +149,9 @@ def add_new_custom_field(
     field_config: dict,
 ):
     # Check field_config if any of the keys are in it
-    # if it is, update the value
+    # if it is, update the value. It can be the field_config of the component class,
+    # which is shared by every build of the class
+    field_config = field_config.copy()
     display_name = field_config.pop("display_name", None)
     if not field_type:
         if "type" in field_config and field_config["type"] is not None:
@@ -317,7 +323,7 @@ def run_build_config(
 
         try:
             custom_instance = custom_class(_user_id=user_id)
-            build_config: dict = custom_instance.build_config()
+            build_config: dict = dict(custom_instance.build_config())
 
             for field_name, field in build_config.copy().items():
                 # Allow user to build Input as well
@@ -481,8 +487,14 @@ def build_custom_components(components_paths: list[str]):
     return custom_components_from_file
 
 
-async def abuild_custom_components(components_paths: list[str]):
-    """Build custom components from the specified paths."""
+async def abuild_custom_components(
+    components_paths: list[str], index: "ComponentIndex | None" = None, *, max_workers: int = 1
+):
+    """Build custom components from the specified paths.
+
+    If a component index is given, only the files that changed since it was saved are built.
+    The files are built in up to `max_workers` processes.
+    """
     if not components_paths:
         return {}
 
@@ -494,7 +506,7 @@ async def abuild_custom_components(components_paths: list[str]):
         if path_str in processed_paths:
             continue
 
-        custom_component_dict = await abuild_custom_component_list_from_path(path_str)
+        custom_component_dict = await abuild_custom_component_list_from_path(path_str, index, max_workers=max_workers)
         if custom_component_dict:
             category = next(iter(custom_component_dict))
             logger.info(f"Loading {len(custom_component_dict[category])} component(s) from category {category}")
@@ -503,6 +515,8 @@ async def abuild_custom_components(components_paths: list[str]):
             )
         processed_paths.add(path_str)
 
+    if index is not None:
+        await asyncio.to_thread(index.save)
     return custom_components_from_file
 
 
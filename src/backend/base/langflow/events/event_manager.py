@@ -1,10 +1,13 @@
 import asyncio
 import inspect
 import json
+import threading
 import time
 import uuid
+from collections import deque
 from functools import partial
 
+import orjson
 from fastapi.encoders import jsonable_encoder
 from typing_extensions import Protocol
 
@@ -20,9 +23,26 @@ class PartialEventCallback(Protocol):
 
 
 class EventManager:
-    def __init__(self, queue: asyncio.Queue):
+    """Serializes events and hands them to the queue of the loop that consumes them.
+
+    Events can be sent from any thread: when the sender runs outside the consumer's loop,
+    events are buffered and drained into the queue in batches on that loop. Consecutive
+    `token` events of the same message can optionally be coalesced over a short window.
+    """
+
+    def __init__(self, queue: asyncio.Queue, *, token_coalesce_window: float = 0.0):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        self.token_coalesce_window = token_coalesce_window
+        try:
+            self._loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        # Reentrant, since coalesced tokens are put while holding it to keep their order
+        self._lock = threading.RLock()
+        self._buffer: deque = deque()
+        self._drain_scheduled = False
+        self._pending_token: dict | None = None
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -52,12 +72,83 @@ class EventManager:
             _callback = partial(callback, manager=self, event_type=event_type)
         self.events[name] = _callback
 
+    @staticmethod
+    def _serialize(event_type: str, data: LoggableType) -> bytes:
+        json_data = {"event": event_type, "data": data}
+        try:
+            return orjson.dumps(json_data, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
+        except (TypeError, orjson.JSONEncodeError):
+            json_data["data"] = jsonable_encoder(data)
+            return (json.dumps(json_data) + "\n\n").encode("utf-8")
+
     def send_event(self, *, event_type: str, data: LoggableType) -> None:
-        jsonable_data = jsonable_encoder(data)
-        json_data = {"event": event_type, "data": jsonable_data}
-        event_id = uuid.uuid4()
-        str_data = json.dumps(json_data) + "\n\n"
-        self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+        if event_type == "token" and self._coalesce_token(data):
+            return
+        self.flush_tokens()
+        self._put(self._serialize(event_type, data))
+
+    def _coalesce_token(self, data: LoggableType) -> bool:
+        """Merges a token into the pending one. Returns False if the token should be sent right away."""
+        if self.token_coalesce_window <= 0 or self._loop is None or not isinstance(data, dict):
+            return False
+        with self._lock:
+            pending = self._pending_token
+            if pending is not None and pending.get("id") == data.get("id"):
+                chunk = pending.get("chunk", "") + data.get("chunk", "")
+                pending.update(data)
+                pending["chunk"] = chunk
+                return True
+            self._pending_token = dict(data)
+            if pending is not None:
+                self._put(self._serialize("token", pending))
+        self._call_in_loop(self._loop, self._loop.call_later, self.token_coalesce_window, self.flush_tokens)
+        return True
+
+    def flush_tokens(self) -> None:
+        """Sends the pending coalesced token, if any."""
+        with self._lock:
+            pending, self._pending_token = self._pending_token, None
+            if pending is not None:
+                self._put(self._serialize("token", pending))
+
+    def _put(self, str_data: bytes) -> None:
+        item = (uuid.uuid4(), str_data, time.time())
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            self.queue.put_nowait(item)
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            # Keep the order of events buffered by other threads
+            self._drain()
+            self.queue.put_nowait(item)
+            return
+        with self._lock:
+            self._buffer.append(item)
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        self._call_in_loop(loop, self._drain)
+
+    def _call_in_loop(self, loop: asyncio.AbstractEventLoop, callback, *args) -> None:
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            # The consumer loop is closed, nobody is listening anymore
+            with self._lock:
+                self._buffer.clear()
+                self._drain_scheduled = False
+
+    def _drain(self) -> None:
+        with self._lock:
+            items = list(self._buffer)
+            self._buffer.clear()
+            self._drain_scheduled = False
+        for item in items:
+            self.queue.put_nowait(item)
 
     def noop(self, *, data: LoggableType) -> None:
         pass
@@ -66,8 +157,8 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
-def create_default_event_manager(queue):
-    manager = EventManager(queue)
+def create_default_event_manager(queue, *, token_coalesce_window: float = 0.0):
+    manager = EventManager(queue, token_coalesce_window=token_coalesce_window)
     manager.register_event("on_token", "token")
     manager.register_event("on_vertices_sorted", "vertices_sorted")
     manager.register_event("on_error", "error")
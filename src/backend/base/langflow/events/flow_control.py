@@ -0,0 +1,52 @@
+import asyncio
+
+
+class FlowControlQueue(asyncio.Queue):
+    """An event queue that grants producers credits based on what the client has not consumed yet.
+
+    In windowed mode a producer may continue while fewer than `window` events are waiting to be
+    sent to the client. In detached mode producers never wait for the client, but events are only
+    buffered until they take up `max_buffer_bytes`, after which producers wait as well.
+    """
+
+    def __init__(self, window: int = 1, *, detached: bool = False, max_buffer_bytes: int = 64 * 1024 * 1024) -> None:
+        super().__init__()
+        if window < 1:
+            msg = "The flow control window must be at least 1"
+            raise ValueError(msg)
+        self.window = window
+        self.detached = detached
+        self.max_buffer_bytes = max_buffer_bytes
+        self.buffered_bytes = 0
+        self._consumed = asyncio.Condition()
+
+    @staticmethod
+    def _item_size(item) -> int:
+        _, value, _ = item
+        return len(value) if isinstance(value, bytes | bytearray) else 0
+
+    def _put(self, item) -> None:
+        super()._put(item)
+        self.buffered_bytes += self._item_size(item)
+
+    def _get(self):
+        item = super()._get()
+        self.buffered_bytes -= self._item_size(item)
+        return item
+
+    def has_credit(self) -> bool:
+        if self.buffered_bytes >= self.max_buffer_bytes:
+            return False
+        return self.detached or self.qsize() < self.window
+
+    async def wait_for_credit(self) -> None:
+        """Waits until the client has consumed enough events for the producer to continue."""
+        if self.has_credit():
+            return
+        async with self._consumed:
+            await self._consumed.wait_for(self.has_credit)
+
+    async def mark_consumed(self) -> None:
+        """Signals that the client has consumed an event."""
+        async with self._consumed:
+            self._consumed.notify_all()
@@ -4,11 +4,11 @@ import asyncio
 import contextlib
 import copy
 import json
+import time
 import uuid
 from collections import defaultdict, deque
 from collections.abc import Generator, Iterable
 from datetime import datetime, timezone
-from functools import partial
 from itertools import chain
 from typing import TYPE_CHECKING, Any, cast
 
@@ -35,10 +35,17 @@ from langflow.graph.schema import InterfaceComponentTypes, RunOutputs
 from langflow.graph.vertex.base import Vertex, VertexStates
 from langflow.graph.vertex.schema import NodeData, NodeTypeEnum
 from langflow.graph.vertex.types import ComponentVertex, InterfaceVertex, StateVertex
+from langflow.interface.initialize.loading import prefetch_load_from_db_variables
 from langflow.logging.logger import LogConfig, configure
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType
 from langflow.services.cache.utils import CacheMiss
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import (
+    get_chat_service,
+    get_executor_service,
+    get_settings_service,
+    get_tracing_service,
+)
+from langflow.services.telemetry import metrics
 from langflow.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -122,6 +129,7 @@ class Graph:
         self._cycle_vertices: set[str] | None = None
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
+        self.checkpointed_vertices: set[str] = set()
         self._end_trace_tasks: set[asyncio.Task] = set()
         try:
             self.tracing_service: TracingService | None = get_tracing_service()
@@ -135,6 +143,30 @@ class Graph:
             msg = "You must provide both input and output components"
             raise ValueError(msg)
 
+    @property
+    def edges(self) -> list[CycleEdge]:
+        return self._built_edges
+
+    @edges.setter
+    def edges(self, edges: list[CycleEdge]) -> None:
+        self._built_edges = edges
+        self._build_edge_index()
+
+    def _build_edge_index(self) -> None:
+        """Indexes the edges by the vertices they connect, keeping the order of `self.edges`."""
+        self._vertex_edges: dict[str, list[CycleEdge]] = defaultdict(list)
+        for edge in self._built_edges:
+            self._index_edge(edge)
+
+    def _index_edge(self, edge: CycleEdge) -> None:
+        self._vertex_edges[edge.source_id].append(edge)
+        if edge.target_id != edge.source_id:
+            self._vertex_edges[edge.target_id].append(edge)
+
+    def _append_edge(self, edge: CycleEdge) -> None:
+        self._built_edges.append(edge)
+        self._index_edge(edge)
+
     @property
     def state_model(self):
         if not self._state_model:
@@ -560,9 +592,11 @@ class Graph:
         run_id_str = str(run_id)
         for vertex in self.vertices:
             self.state_manager.subscribe(run_id_str, vertex.update_graph_state)
-        self._run_id = run_id_str
         if self.tracing_service:
+            if self._run_id and self._run_id != run_id_str:
+                self.tracing_service.discard_run(self._run_id)
             self.tracing_service.set_run_id(run_id)
+        self._run_id = run_id_str
 
     def set_run_name(self) -> None:
         # Given a flow name, flow_id
@@ -571,11 +605,12 @@ class Graph:
         name = f"{self.flow_name} - {self.flow_id}"
 
         self.set_run_id()
-        self.tracing_service.set_run_name(name)
+        self.tracing_service.set_run_name(name, run_id=self._run_id)
 
     async def initialize_run(self) -> None:
         if self.tracing_service:
-            await self.tracing_service.initialize_tracers()
+            await self.tracing_service.initialize_tracers(run_id=self._run_id)
+        prefetch_load_from_db_variables(self.vertices, self.user_id)
 
     def _end_all_traces_async(self, outputs: dict[str, Any] | None = None, error: Exception | None = None) -> None:
         task = asyncio.create_task(self.end_all_traces(outputs, error))
@@ -589,7 +624,7 @@ class Graph:
         if outputs is None:
             outputs = {}
         outputs |= self.metadata
-        await self.tracing_service.end(outputs, error)
+        await self.tracing_service.end(outputs, error, run_id=self._run_id)
 
     @property
     def sorted_vertices_layers(self) -> list[list[str]]:
@@ -639,6 +674,7 @@ class Graph:
         stream: bool,
         session_id: str,
         fallback_to_env_vars: bool,
+        cache_graph: bool = True,
     ) -> list[ResultData | None]:
         """Runs the graph with the given inputs.
 
@@ -650,6 +686,7 @@ class Graph:
             stream (bool): Whether to stream the results or not.
             session_id (str): The session ID for the graph.
             fallback_to_env_vars (bool): Whether to fallback to environment variables.
+            cache_graph (bool): Whether to store the graph in the chat cache before running it.
 
         Returns:
             List[Optional["ResultData"]]: The outputs of the graph.
@@ -675,7 +712,7 @@ class Graph:
         # Process the graph
         try:
             cache_service = get_chat_service()
-            if self.flow_id:
+            if self.flow_id and cache_graph:
                 await cache_service.set_cache(self.flow_id, self)
         except Exception:  # noqa: BLE001
             logger.exception("Error setting cache")
@@ -769,6 +806,7 @@ class Graph:
         session_id: str | None = None,
         stream: bool = False,
         fallback_to_env_vars: bool = False,
+        max_concurrency: int = 1,
     ) -> list[RunOutputs]:
         """Runs the graph with the given inputs.
 
@@ -780,6 +818,9 @@ class Graph:
             session_id (Optional[str], optional): The session ID for the graph. Defaults to None.
             stream (bool, optional): Whether to stream the results or not. Defaults to False.
             fallback_to_env_vars (bool, optional): Whether to fallback to environment variables. Defaults to False.
+            max_concurrency (int, optional): The maximum number of inputs run at the same time. Defaults to 1.
+                With several inputs, each input runs on its own clone of the graph, leaving this graph
+                untouched, and in its own session derived from `session_id`.
 
         Returns:
             List[RunOutputs]: The outputs of the graph.
@@ -803,6 +844,17 @@ class Graph:
             types = []
         for _ in range(len(inputs) - len(types)):
             types.append("chat")  # default to chat
+        if len(inputs) > 1:
+            return await self._arun_batch(
+                inputs,
+                inputs_components=inputs_components,
+                types=types,
+                outputs=outputs or [],
+                session_id=session_id or "",
+                stream=stream,
+                fallback_to_env_vars=fallback_to_env_vars,
+                max_concurrency=max(max_concurrency, 1),
+            )
         for run_inputs, components, input_type in zip(inputs, inputs_components, types, strict=True):
             run_outputs = await self._run(
                 inputs=run_inputs,
@@ -818,6 +870,55 @@ class Graph:
             vertex_outputs.append(run_output_object)
         return vertex_outputs
 
+    async def _arun_batch(
+        self,
+        inputs: list[dict[str, str]],
+        *,
+        inputs_components: list[list[str]],
+        types: list[InputType | None],
+        outputs: list[str],
+        session_id: str,
+        stream: bool,
+        fallback_to_env_vars: bool,
+        max_concurrency: int,
+    ) -> list[RunOutputs]:
+        """Runs each input on its own clone of the graph, up to `max_concurrency` at a time.
+
+        Each input runs in its own session, `<session_id>-<index>`, so runs that happen at the same
+        time don't interleave their messages in one chat history.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_input(
+            index: int, run_inputs: dict[str, str], components: list[str], input_type: InputType | None
+        ):
+            async with semaphore:
+                graph = await self.clone()
+                run_outputs = await graph._run(
+                    inputs=run_inputs,
+                    input_components=components,
+                    input_type=input_type,
+                    outputs=outputs,
+                    stream=stream,
+                    session_id=f"{session_id}-{index}",
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    cache_graph=False,
+                )
+            return RunOutputs(inputs=run_inputs, outputs=run_outputs)
+
+        tasks = [
+            asyncio.create_task(run_input(index, run_inputs, components, input_type))
+            for index, (run_inputs, components, input_type) in enumerate(
+                zip(inputs, inputs_components, types, strict=True)
+            )
+        ]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
     def next_vertex_to_build(self):
         """Returns the next vertex to be built.
 
@@ -905,7 +1006,7 @@ class Graph:
 
     def get_edge(self, source_id: str, target_id: str) -> CycleEdge | None:
         """Returns the edge between two vertices."""
-        for edge in self.edges:
+        for edge in self._vertex_edges.get(source_id, []):
             if edge.source_id == source_id and edge.target_id == target_id:
                 return edge
         return None
@@ -989,13 +1090,36 @@ class Graph:
 
         return new_graph
 
+    async def clone(self) -> Graph:
+        """Returns a copy of the graph with fresh run state.
+
+        Unlike `copy.deepcopy`, the parsed vertices, edges and graph maps are copied as they are
+        instead of being rebuilt from the raw payload. Each vertex of the copy gets a new component
+        instance, so the copy can run independently of the original.
+        """
+        graph = type(self)(
+            flow_id=self.flow_id, flow_name=self.flow_name, description=self.description, user_id=self.user_id
+        )
+        memo: dict[int, Any] = {id(self): graph}
+        for vertex in self.vertices:
+            # Components hold per-run state, so they are instantiated again below
+            memo[id(vertex.custom_component)] = None
+        graph.__setstate__(copy.deepcopy(self.__getstate__(), memo))
+        graph._is_state_vertices = list(self._is_state_vertices)
+        await graph._instantiate_components_in_vertices()
+        graph._set_cache_to_vertices_in_cycle()
+        return graph
+
     def __setstate__(self, state):
         run_manager = state["run_manager"]
         if isinstance(run_manager, RunnableVerticesManager):
             state["run_manager"] = run_manager
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
+        edges = state.pop("edges")
+        self.checkpointed_vertices = set()
         self.__dict__.update(state)
+        self.edges = edges
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         self.state_manager = GraphStateManager()
         self.tracing_service = get_tracing_service()
@@ -1167,7 +1291,7 @@ class Graph:
         # Vertex has edges, so we need to update the edges
         for edge in vertex.edges:
             if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
-                self.edges.append(edge)
+                self._append_edge(edge)
 
     def _build_graph(self) -> None:
         """Builds the graph from the vertices and edges."""
@@ -1258,11 +1382,13 @@ class Graph:
         if not self._prepared:
             msg = "Graph not prepared. Call prepare() first."
             raise ValueError(msg)
+        chat_service = get_chat_service()
+        cache_key = str(self.flow_id or self._run_id)
         if not self._run_queue:
             self._end_all_traces_async()
+            await chat_service.set_cache(cache_key, self)
             return Finish()
         vertex_id = self.get_next_in_queue()
-        chat_service = get_chat_service()
         vertex_build_result = await self.build_vertex(
             vertex_id=vertex_id,
             user_id=user_id,
@@ -1282,7 +1408,7 @@ class Graph:
         self.reset_inactivated_vertices()
         self.reset_activated_vertices()
 
-        await chat_service.set_cache(str(self.flow_id or self._run_id), self)
+        await chat_service.checkpoint_graph(cache_key, self, vertex_ids=[vertex_id])
         self._record_snapshot(vertex_id)
         return vertex_build_result
 
@@ -1298,6 +1424,24 @@ class Graph:
             }
         )
 
+    def get_run_state(self) -> dict[str, Any]:
+        """Returns the scheduling state of the current run, without any vertex results."""
+        return {
+            "run_manager": self.run_manager.to_dict(),
+            "run_queue": list(self._run_queue),
+            "vertices_to_run": self.vertices_to_run,
+            "inactivated_vertices": self.inactivated_vertices,
+            "activated_vertices": self.activated_vertices,
+        }
+
+    def apply_run_state(self, state: dict[str, Any]) -> None:
+        """Restores the scheduling state returned by `get_run_state`."""
+        self.run_manager = RunnableVerticesManager.from_dict(state["run_manager"])
+        self._run_queue = deque(state["run_queue"])
+        self.vertices_to_run = self.run_manager.vertices_to_run = state["vertices_to_run"]
+        self.inactivated_vertices = state["inactivated_vertices"]
+        self.activated_vertices = state["activated_vertices"]
+
     def _record_snapshot(self, vertex_id: str | None = None) -> None:
         self._snapshots.append(self.get_snapshot())
         if vertex_id:
@@ -1324,6 +1468,7 @@ class Graph:
         user_id: str | None = None,
         fallback_to_env_vars: bool = False,
         event_manager: EventManager | None = None,
+        queued_at: float | None = None,
     ) -> VertexBuildResult:
         """Builds a vertex in the graph.
 
@@ -1336,6 +1481,8 @@ class Graph:
             user_id (Optional[str]): Optional user ID. Defaults to None.
             fallback_to_env_vars (bool): Whether to fallback to environment variables. Defaults to False.
             event_manager (Optional[EventManager]): Optional event manager. Defaults to None.
+            queued_at (Optional[float]): The `time.perf_counter()` at which the vertex became ready to build,
+                to record how long it waited. Defaults to None.
 
         Returns:
             Tuple: A tuple containing the next runnable vertices, top level vertices, result dictionary,
@@ -1346,6 +1493,10 @@ class Graph:
         """
         vertex = self.get_vertex(vertex_id)
         self.run_manager.add_to_vertices_being_run(vertex_id)
+        start_time = time.perf_counter()
+        metric_labels = {"flow_id": str(self.flow_id), "component_type": vertex.vertex_type}
+        if queued_at is not None:
+            metrics.observe("component_queue_wait", start_time - queued_at, metric_labels)
         try:
             params = ""
             should_build = False
@@ -1402,7 +1553,15 @@ class Graph:
         except Exception as exc:
             if not isinstance(exc, ComponentBuildError):
                 logger.exception("Error building Component")
+            metrics.observe(
+                "component_build_duration", time.perf_counter() - start_time, {**metric_labels, "status": "error"}
+            )
             raise
+        metrics.observe(
+            "component_build_duration",
+            time.perf_counter() - start_time,
+            {**metric_labels, "status": "success" if should_build else "cached"},
+        )
 
         if vertex.result is not None:
             params = f"{vertex.built_object_repr()}{params}"
@@ -1429,7 +1588,7 @@ class Graph:
         # or both
         return [
             edge
-            for edge in self.edges
+            for edge in self._vertex_edges.get(vertex_id, [])
             if (edge.source_id == vertex_id and is_source is not False)
             or (edge.target_id == vertex_id and is_target is not False)
         ]
@@ -1437,57 +1596,104 @@ class Graph:
     def get_vertices_with_target(self, vertex_id: str) -> list[Vertex]:
         """Returns the vertices connected to a vertex."""
         vertices: list[Vertex] = []
-        for edge in self.edges:
-            if edge.target_id == vertex_id:
-                vertex = self.get_vertex(edge.source_id)
-                if vertex is None:
-                    continue
-                vertices.append(vertex)
+        for edge in self.get_vertex_edges(vertex_id, is_source=False):
+            vertex = self.get_vertex(edge.source_id)
+            if vertex is None:
+                continue
+            vertices.append(vertex)
         return vertices
 
-    async def process(self, *, fallback_to_env_vars: bool, start_component_id: str | None = None) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+    async def process(
+        self,
+        *,
+        fallback_to_env_vars: bool,
+        start_component_id: str | None = None,
+        max_parallelism: int | None = None,
+    ) -> Graph:
+        """Processes the graph, building each vertex as soon as the vertices it depends on are built.
+
+        Vertices are not run in layer batches: whenever a build finishes, the successors it unlocks
+        are started right away, so independent branches don't wait for the slowest vertex of a layer.
+
+        Args:
+            fallback_to_env_vars: Whether to fall back to environment variables for global variables.
+            start_component_id: The ID of the component to start the run from.
+            max_parallelism: The maximum number of vertices built at the same time. Defaults to the
+                `graph_max_parallel_vertices` setting, where 0 means no limit.
+        """
         first_layer = self.sort_vertices(start_component_id=start_component_id)
+        if max_parallelism is None:
+            max_parallelism = get_settings_service().settings.graph_max_parallel_vertices
         vertex_task_run_count: dict[str, int] = {}
         to_process = deque(first_layer)
-        layer_index = 0
+        start_time = time.perf_counter()
+        ready_at = dict.fromkeys(first_layer, start_time)
+        running: dict[asyncio.Task, str] = {}
         chat_service = get_chat_service()
+        executor_service = get_executor_service()
         run_id = uuid.uuid4()
         self.set_run_id(run_id)
         self.set_run_name()
         await self.initialize_run()
         lock = chat_service.async_cache_locks[self.run_id]
-        while to_process:
-            current_batch = list(to_process)  # Copy current deque items to a list
-            to_process.clear()  # Clear the deque for new items
-            tasks = []
-            for vertex_id in current_batch:
+
+        def start_ready_vertices() -> None:
+            deferred: list[str] = []
+            while to_process and (max_parallelism <= 0 or len(running) < max_parallelism):
+                vertex_id = to_process.popleft()
+                if vertex_id in running.values():
+                    # A vertex in a cycle can become runnable again before its previous build finished
+                    deferred.append(vertex_id)
+                    continue
                 vertex = self.get_vertex(vertex_id)
                 task = asyncio.create_task(
-                    self.build_vertex(
-                        vertex_id=vertex_id,
-                        user_id=self.user_id,
-                        inputs_dict={},
-                        fallback_to_env_vars=fallback_to_env_vars,
-                        get_cache=chat_service.get_cache,
-                        set_cache=chat_service.set_cache,
+                    executor_service.run(
+                        self.build_vertex(
+                            vertex_id=vertex_id,
+                            user_id=self.user_id,
+                            inputs_dict={},
+                            fallback_to_env_vars=fallback_to_env_vars,
+                            get_cache=chat_service.get_cache,
+                            set_cache=chat_service.set_cache,
+                            queued_at=ready_at.pop(vertex_id, None),
+                        ),
+                        flow_id=self.flow_id or self.run_id,
                     ),
                     name=f"{vertex.display_name} Run {vertex_task_run_count.get(vertex_id, 0)}",
                 )
-                tasks.append(task)
+                running[task] = vertex_id
                 vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
+            to_process.extendleft(reversed(deferred))
 
-            logger.debug(f"Running layer {layer_index} with {len(tasks)} tasks, {current_batch}")
-            try:
-                next_runnable_vertices = await self._execute_tasks(tasks, lock=lock)
-            except Exception:
-                logger.exception(f"Error executing tasks in layer {layer_index}")
-                raise
-            if not next_runnable_vertices:
-                break
-            to_process.extend(next_runnable_vertices)
-            layer_index += 1
+        try:
+            start_ready_vertices()
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    running.pop(task)
+                    next_runnable_vertices = await self._complete_task(task, lock=lock)
+                    logger.debug(f"Task {task.get_name()} finished, next runnable vertices: {next_runnable_vertices}")
+                    now = time.perf_counter()
+                    for vertex_id in next_runnable_vertices:
+                        if vertex_id not in to_process:
+                            to_process.append(vertex_id)
+                            ready_at.setdefault(vertex_id, now)
+                start_ready_vertices()
+        except BaseException:
+            for task in running:
+                task.cancel()
+            metrics.observe(
+                "graph_build_duration",
+                time.perf_counter() - start_time,
+                {"flow_id": str(self.flow_id), "source": "run", "status": "error"},
+            )
+            raise
 
+        metrics.observe(
+            "graph_build_duration",
+            time.perf_counter() - start_time,
+            {"flow_id": str(self.flow_id), "source": "run", "status": "success"},
+        )
         logger.debug("Graph processing complete")
         return self
 
@@ -1514,42 +1720,30 @@ class Graph:
                 else:
                     self.run_manager.add_to_vertices_being_run(next_v_id)
             if cache and self.flow_id is not None:
-                set_cache_coro = partial(get_chat_service().set_cache, key=self.flow_id)
-                await set_cache_coro(data=self, lock=lock)
+                await get_chat_service().checkpoint_graph(self.flow_id, self, vertex_ids=[v_id], lock=lock)
         return next_runnable_vertices
 
-    async def _execute_tasks(self, tasks: list[asyncio.Task], lock: asyncio.Lock) -> list[str]:
-        """Executes tasks in parallel, handling exceptions for each task."""
-        results = []
-        completed_tasks = await asyncio.gather(*tasks, return_exceptions=True)
-        vertices: list[Vertex] = []
-
-        for i, result in enumerate(completed_tasks):
-            task_name = tasks[i].get_name()
-            if isinstance(result, Exception):
-                logger.error(f"Task {task_name} failed with exception: {result}")
-                # Cancel all remaining tasks
-                for t in tasks[i + 1 :]:
-                    t.cancel()
-                raise result
-            if isinstance(result, VertexBuildResult):
-                vertices.append(result.vertex)
-            else:
-                msg = f"Invalid result from task {task_name}: {result}"
-                raise TypeError(msg)
-
-        for v in vertices:
-            # set all executed vertices as non-runnable to not run them again.
-            # they could be calculated as predecessor or successors of parallel vertices
-            # This could usually happen with input vertices like ChatInput
-            self.run_manager.remove_vertex_from_runnables(v.id)
-
-            logger.debug(f"Vertex {v.id}, result: {v.built_result}, object: {v.built_object}")
+    async def _complete_task(self, task: asyncio.Task, lock: asyncio.Lock) -> list[str]:
+        """Handles the result of a finished vertex build and returns the vertices it made runnable."""
+        task_name = task.get_name()
+        if task.cancelled():
+            msg = f"Task {task_name} was cancelled"
+            raise asyncio.CancelledError(msg)
+        exception = task.exception()
+        if exception is not None:
+            logger.error(f"Task {task_name} failed with exception: {exception}")
+            raise exception
+        result = task.result()
+        if not isinstance(result, VertexBuildResult):
+            msg = f"Invalid result from task {task_name}: {result}"
+            raise TypeError(msg)
 
-        for v in vertices:
-            next_runnable_vertices = await self.get_next_runnable_vertices(lock, vertex=v, cache=False)
-            results.extend(next_runnable_vertices)
-        return list(set(results))
+        vertex = result.vertex
+        # Set the executed vertex as non-runnable to not run it again. It could be calculated as a
+        # predecessor or successor of a parallel vertex, which usually happens with input vertices
+        self.run_manager.remove_vertex_from_runnables(vertex.id)
+        logger.debug(f"Vertex {vertex.id}, result: {vertex.built_result}, object: {vertex.built_object}")
+        return await self.get_next_runnable_vertices(lock, vertex=vertex, cache=False)
 
     def topological_sort(self) -> list[Vertex]:
         """Performs a topological sort of the vertices in the graph.
@@ -1571,9 +1765,8 @@ class Graph:
                 raise ValueError(msg)
             if state[vertex] == 0:
                 state[vertex] = 1
-                for edge in vertex.edges:
-                    if edge.source_id == vertex.id:
-                        dfs(self.get_vertex(edge.target_id))
+                for edge in self.get_vertex_edges(vertex.id, is_target=False):
+                    dfs(self.get_vertex(edge.target_id))
                 state[vertex] = 2
                 sorted_vertices.append(vertex)
 
@@ -1634,7 +1827,7 @@ class Graph:
     def get_vertex_neighbors(self, vertex: Vertex) -> dict[Vertex, int]:
         """Returns the neighbors of a vertex."""
         neighbors: dict[Vertex, int] = {}
-        for edge in self.edges:
+        for edge in self.get_vertex_edges(vertex.id):
             if edge.source_id == vertex.id:
                 neighbor = self.get_vertex(edge.target_id)
                 if neighbor is None:
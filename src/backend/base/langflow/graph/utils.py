@@ -14,12 +14,9 @@ from pydantic.v1 import BaseModel as V1BaseModel
 from langflow.interface.utils import extract_input_variables_from_prompt
 from langflow.schema.data import Data
 from langflow.schema.message import Message
-from langflow.services.database.models.transactions.crud import log_transaction as crud_log_transaction
-from langflow.services.database.models.transactions.model import TransactionBase
-from langflow.services.database.models.vertex_builds.crud import log_vertex_build as crud_log_vertex_build
-from langflow.services.database.models.vertex_builds.model import VertexBuildBase
-from langflow.services.database.utils import session_getter
-from langflow.services.deps import get_db_service, get_settings_service
+from langflow.services.database.models.transactions.model import TransactionBase, TransactionTable
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
+from langflow.services.deps import get_log_writer_service, get_settings_service
 
 if TYPE_CHECKING:
     from langflow.api.v1.schemas import ResultDataResponse
@@ -151,15 +148,12 @@ async def log_transaction(
             vertex_id=source.id,
             target_id=target.id if target else None,
             inputs=inputs,
-            # ugly hack to get the model dump with weird datatypes
-            outputs=json.loads(source.result.model_dump_json()) if source.result else None,
+            outputs=source.result.model_dump(mode="json") if source.result else None,
             status=status,
             error=error,
             flow_id=flow_id if isinstance(flow_id, UUID) else UUID(flow_id),
         )
-        with session_getter(get_db_service()) as session:
-            inserted = crud_log_transaction(session, transaction)
-            logger.debug(f"Logged transaction: {inserted.id}")
+        await get_log_writer_service().aadd(TransactionTable(**transaction.model_dump()))
     except Exception:  # noqa: BLE001
         logger.exception("Error logging transaction")
 
@@ -181,14 +175,11 @@ def log_vertex_build(
             id=vertex_id,
             valid=valid,
             params=str(params) if params else None,
-            # ugly hack to get the model dump with weird datatypes
-            data=json.loads(data.model_dump_json()),
+            data=data.model_dump(mode="json"),
             # ugly hack to get the model dump with weird datatypes
             artifacts=json.loads(json.dumps(artifacts, default=str)),
         )
-        with session_getter(get_db_service()) as session:
-            inserted = crud_log_vertex_build(session, vertex_build)
-            logger.debug(f"Logged vertex build: {inserted.build_id}")
+        get_log_writer_service().add(VertexBuildTable(**vertex_build.model_dump()))
     except Exception:  # noqa: BLE001
         logger.exception("Error logging vertex build")
 
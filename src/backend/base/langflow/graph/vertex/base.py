@@ -38,6 +38,23 @@ if TYPE_CHECKING:
     from langflow.services.tracing.schema import Log
 
 
+# Attributes of a vertex that are updated by a build and persisted in graph checkpoints
+CHECKPOINT_ATTRIBUTES = (
+    "built",
+    "built_object",
+    "built_result",
+    "artifacts",
+    "artifacts_raw",
+    "artifacts_type",
+    "result",
+    "results",
+    "outputs_logs",
+    "logs",
+    "state",
+    "use_result",
+)
+
+
 class VertexStates(str, Enum):
     """Vertex are related to it being active, inactive, or in an error state."""
 
@@ -177,11 +194,11 @@ class Vertex:
 
     @property
     def outgoing_edges(self) -> list[CycleEdge]:
-        return [edge for edge in self.edges if edge.source_id == self.id]
+        return self.graph.get_vertex_edges(self.id, is_target=False)
 
     @property
     def incoming_edges(self) -> list[CycleEdge]:
-        return [edge for edge in self.edges if edge.target_id == self.id]
+        return self.graph.get_vertex_edges(self.id, is_source=False)
 
     @property
     def edges_source_names(self) -> set[str | None]:
@@ -212,6 +229,25 @@ class Vertex:
         self.built_object = state.get("built_object") or UnbuiltObject()
         self.built_result = state.get("built_result") or UnbuiltResult()
 
+    def get_checkpoint_state(self) -> dict[str, Any]:
+        """Returns the attributes that change when the vertex is built.
+
+        Unlike `__getstate__`, this leaves out the graph and the static definition of the vertex,
+        so it can be persisted on its own after each build.
+        """
+        state = {attribute: getattr(self, attribute) for attribute in CHECKPOINT_ATTRIBUTES}
+        state["built_object"] = None if isinstance(self.built_object, UnbuiltObject) else self.built_object
+        state["built_result"] = None if isinstance(self.built_result, UnbuiltResult) else self.built_result
+        if self.will_stream:
+            # Streaming vertices are consumed later from their built params
+            state["params"] = self.params
+        return state
+
+    def apply_checkpoint_state(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.built_object = state.get("built_object") or UnbuiltObject()
+        self.built_result = state.get("built_result") or UnbuiltResult()
+
     def set_top_level(self, top_level_vertices: list[str]) -> None:
         self.parent_is_top_level = self.parent_node_id in top_level_vertices
 
@@ -12,9 +12,12 @@ from pydantic import PydanticDeprecatedSince20
 from langflow.custom.eval import eval_custom_component_code
 from langflow.schema import Data
 from langflow.schema.artifact import get_artifact_type, post_process_raw
-from langflow.services.deps import get_tracing_service
+from langflow.services.deps import get_settings_service, get_tracing_service, get_variable_service, session_scope
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
     from langflow.custom import Component, CustomComponent
     from langflow.events.event_manager import EventManager
     from langflow.graph.vertex.base import Vertex
@@ -102,6 +105,30 @@ def convert_kwargs(params):
     return params
 
 
+def prefetch_load_from_db_variables(vertices: Iterable[Vertex], user_id: UUID | str | None) -> None:
+    """Loads the variables the load_from_db fields of `vertices` refer to, in a single query.
+
+    The variables are kept by the variable service, so building the vertices doesn't load
+    them one field at a time.
+    """
+    # Without a cache the prefetched variables wouldn't be kept
+    if not user_id or get_settings_service().settings.variable_cache_ttl <= 0:
+        return
+    names = {
+        vertex.params[field]
+        for vertex in vertices
+        for field in vertex.load_from_db_fields
+        if isinstance(vertex.params.get(field), str) and vertex.params[field]
+    }
+    if not names:
+        return
+    try:
+        with session_scope() as session:
+            get_variable_service().prefetch_variables(user_id=user_id, names=names, session=session)
+    except Exception:  # noqa: BLE001
+        logger.opt(exception=True).debug("Error prefetching the variables of the graph")
+
+
 def update_params_with_load_from_db_fields(
     custom_component: CustomComponent,
     params,
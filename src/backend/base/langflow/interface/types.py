@@ -1,19 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import TYPE_CHECKING
 
 from loguru import logger
 
+from langflow.custom.directory_reader.component_index import ComponentIndex
 from langflow.custom.utils import abuild_custom_components, build_custom_components
 
 if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
 
 
-async def aget_all_types_dict(components_paths):
+async def aget_all_types_dict(components_paths, index: ComponentIndex | None = None, *, max_workers: int = 1):
     """Get all types dictionary combining native and custom components."""
-    return await abuild_custom_components(components_paths=components_paths)
+    return await abuild_custom_components(components_paths=components_paths, index=index, max_workers=max_workers)
 
 
 def get_all_types_dict(components_paths):
@@ -64,6 +66,11 @@ async def get_and_cache_all_types_dict(
     global all_types_dict_cache  # noqa: PLW0603
     if all_types_dict_cache is None:
         logger.debug("Building langchain types dict")
-        all_types_dict_cache = await aget_all_types_dict(settings_service.settings.components_path)
+        index = await asyncio.to_thread(ComponentIndex.from_settings, settings_service.settings)
+        all_types_dict_cache = await aget_all_types_dict(
+            settings_service.settings.components_path,
+            index,
+            max_workers=settings_service.settings.component_discovery_workers,
+        )
 
     return all_types_dict_cache
@@ -29,7 +29,7 @@ from langflow.initial_setup.setup import (
 from langflow.interface.types import get_and_cache_all_types_dict
 from langflow.interface.utils import setup_llm_caching
 from langflow.logging.logger import configure
-from langflow.services.deps import get_settings_service, get_telemetry_service
+from langflow.services.deps import get_settings_service, get_task_service, get_telemetry_service
 from langflow.services.utils import initialize_services, teardown_services
 
 # Ignore Pydantic deprecation warnings from Langchain
@@ -109,6 +109,7 @@ def get_lifespan(*, fix_migration=False, version=None):
             telemetry_service_tasks.add(telemetry_service_task)
             telemetry_service_task.add_done_callback(telemetry_service_tasks.discard)
             load_flows_from_directory()
+            await get_task_service().start()
             yield
         except Exception as exc:
             if "langflow migration --fix" not in str(exc):
@@ -1,10 +1,11 @@
-from collections.abc import Sequence
+from collections.abc import Generator, Sequence
 from uuid import UUID
 
 from langchain_core.messages import BaseMessage
 from loguru import logger
-from sqlalchemy import delete
+from sqlalchemy import and_, delete, or_
 from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import SelectOfScalar
 
 from langflow.field_typing import BaseChatMessageHistory
 from langflow.schema.message import Message
@@ -12,6 +13,24 @@ from langflow.services.database.models.message.model import MessageRead, Message
 from langflow.services.deps import session_scope
 
 
+def _messages_statement(
+    sender: str | None = None,
+    sender_name: str | None = None,
+    session_id: str | None = None,
+    flow_id: UUID | None = None,
+) -> SelectOfScalar[MessageTable]:
+    stmt = select(MessageTable).where(MessageTable.error == False)  # noqa: E712
+    if sender:
+        stmt = stmt.where(MessageTable.sender == sender)
+    if sender_name:
+        stmt = stmt.where(MessageTable.sender_name == sender_name)
+    if session_id:
+        stmt = stmt.where(MessageTable.session_id == session_id)
+    if flow_id:
+        stmt = stmt.where(MessageTable.flow_id == flow_id)
+    return stmt
+
+
 def get_messages(
     sender: str | None = None,
     sender_name: str | None = None,
@@ -36,15 +55,7 @@ def get_messages(
         List[Data]: A list of Data objects representing the retrieved messages.
     """
     with session_scope() as session:
-        stmt = select(MessageTable).where(MessageTable.error == False)  # noqa: E712
-        if sender:
-            stmt = stmt.where(MessageTable.sender == sender)
-        if sender_name:
-            stmt = stmt.where(MessageTable.sender_name == sender_name)
-        if session_id:
-            stmt = stmt.where(MessageTable.session_id == session_id)
-        if flow_id:
-            stmt = stmt.where(MessageTable.flow_id == flow_id)
+        stmt = _messages_statement(sender, sender_name, session_id, flow_id)
         if order_by:
             col = getattr(MessageTable, order_by).desc() if order == "DESC" else getattr(MessageTable, order_by).asc()
             stmt = stmt.order_by(col)
@@ -54,6 +65,56 @@ def get_messages(
         return [Message(**d.model_dump()) for d in messages]
 
 
+def iter_messages(
+    sender: str | None = None,
+    sender_name: str | None = None,
+    session_id: str | None = None,
+    order: str | None = "ASC",
+    flow_id: UUID | None = None,
+    batch_size: int = 100,
+) -> Generator[Message, None, None]:
+    """Lazily yields messages ordered by timestamp, loading them in batches.
+
+    Batches are fetched with keyset pagination on (timestamp, id), so each query stays
+    cheap however far into a long session it is, and no database session is held open
+    while the caller processes a batch.
+
+    Args:
+        sender (Optional[str]): The sender of the messages (e.g., "Machine" or "User")
+        sender_name (Optional[str]): The name of the sender.
+        session_id (Optional[str]): The session ID associated with the messages.
+        order (Optional[str]): The order in which to retrieve the messages. Defaults to "ASC".
+        flow_id (Optional[UUID]): The flow ID associated with the messages.
+        batch_size (int): The number of messages to load per query. Defaults to 100.
+
+    Yields:
+        Message: The retrieved messages.
+    """
+    timestamp, id_ = col(MessageTable.timestamp), col(MessageTable.id)
+    descending = order == "DESC"
+    cursor = None
+    while True:
+        with session_scope() as session:
+            stmt = _messages_statement(sender, sender_name, session_id, flow_id)
+            if cursor is not None:
+                last_timestamp, last_id = cursor
+                if descending:
+                    stmt = stmt.where(or_(timestamp < last_timestamp, and_(timestamp == last_timestamp, id_ < last_id)))
+                else:
+                    stmt = stmt.where(or_(timestamp > last_timestamp, and_(timestamp == last_timestamp, id_ > last_id)))
+            if descending:
+                stmt = stmt.order_by(timestamp.desc(), id_.desc())
+            else:
+                stmt = stmt.order_by(timestamp.asc(), id_.asc())
+            rows = session.exec(stmt.limit(batch_size)).all()
+            if rows:
+                cursor = (rows[-1].timestamp, rows[-1].id)
+            messages = [Message(**row.model_dump()) for row in rows]
+        yield from messages
+        if len(rows) < batch_size:
+            return
+
+
 def add_messages(messages: Message | list[Message], flow_id: str | None = None):
     """Add a message to the monitor service."""
     if not isinstance(messages, list):
@@ -75,15 +136,21 @@ def add_messages(messages: Message | list[Message], flow_id: str | None = None):
 
 
 def add_messagetables(messages: list[MessageTable], session: Session):
-    for message in messages:
-        try:
-            session.add(message)
-            session.commit()
-            session.refresh(message)
-        except Exception as e:
-            logger.exception(e)
-            raise
-    return [MessageRead.model_validate(message, from_attributes=True) for message in messages]
+    """Insert messages in a single transaction.
+
+    All values are generated client side, so the rows are read back before the commit
+    instead of being refreshed one by one after it.
+    """
+    try:
+        session.add_all(messages)
+        session.flush()
+        messages_read = [MessageRead.model_validate(message, from_attributes=True) for message in messages]
+        session.commit()
+    except Exception as e:
+        logger.exception(e)
+        session.rollback()
+        raise
+    return messages_read
 
 
 def delete_messages(session_id: str) -> None:
@@ -100,6 +167,12 @@ def delete_messages(session_id: str) -> None:
         )
 
 
+def _validate_message(message: Message) -> None:
+    if not message.session_id or not message.sender or not message.sender_name:
+        msg = "All of session_id, sender, and sender_name must be provided."
+        raise ValueError(msg)
+
+
 def store_message(
     message: Message,
     flow_id: str | None = None,
@@ -121,10 +194,7 @@ def store_message(
         logger.warning("No message provided.")
         return []
 
-    if not message.session_id or not message.sender or not message.sender_name:
-        msg = "All of session_id, sender, and sender_name must be provided."
-        raise ValueError(msg)
-
+    _validate_message(message)
     return add_messages([message], flow_id=flow_id)
 
 
@@ -145,10 +215,14 @@ class LCBuiltinChatMemory(BaseChatMessageHistory):
         return [m.to_lc_message() for m in messages if not m.error]  # Exclude error messages
 
     def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        messages_to_store = []
         for lc_message in messages:
             message = Message.from_lc_message(lc_message)
             message.session_id = self.session_id
-            store_message(message, flow_id=self.flow_id)
+            _validate_message(message)
+            messages_to_store.append(message)
+        if messages_to_store:
+            add_messages(messages_to_store, flow_id=self.flow_id)
 
     def clear(self) -> None:
         delete_messages(self.session_id)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from langflow.graph.graph.base import Graph
+from langflow.processing.process import process_tweaks
+from langflow.services.telemetry import metrics
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.schema.graph import Tweaks
+    from langflow.services.database.models.flow import Flow
+
+PreparedGraphKey = tuple[str, str, str, str]
+
+
+class PreparedGraphCache:
+    """A thread-safe LRU cache of graphs built from flows, used as templates for runs.
+
+    Entries are keyed by the flow id, the flow's last update time, the user and a hash of the
+    tweaks, so a saved change to the flow or different tweaks produce a new template. Templates
+    are never run themselves; each run gets a clone with fresh run state.
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._graphs: OrderedDict[PreparedGraphKey, Graph] = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        flow: Flow, tweaks: dict[str, Any], *, stream: bool, user_id: UUID | str | None
+    ) -> PreparedGraphKey | None:
+        """Builds the cache key of a flow, or returns None if the tweaks can't be hashed."""
+        try:
+            tweaks_bytes = orjson.dumps(
+                {"tweaks": tweaks, "stream": stream}, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            return None
+        updated_at = flow.updated_at.isoformat() if flow.updated_at else ""
+        return str(flow.id), updated_at, str(user_id), hashlib.sha256(tweaks_bytes).hexdigest()
+
+    def get(self, key: PreparedGraphKey) -> Graph | None:
+        with self._lock:
+            graph = self._graphs.get(key)
+            if graph is None:
+                self.misses += 1
+                metrics.record_cache_request("prepared_graph", hit=False)
+                return None
+            self._graphs.move_to_end(key)
+            self.hits += 1
+            metrics.record_cache_request("prepared_graph", hit=True)
+            return graph
+
+    def set(self, key: PreparedGraphKey, graph: Graph) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._graphs[key] = graph
+            self._graphs.move_to_end(key)
+            while len(self._graphs) > self.maxsize:
+                self._graphs.popitem(last=False)
+
+    def invalidate(self, flow_id: str | None = None) -> None:
+        """Remove the templates of `flow_id`, or every template if no flow id is given."""
+        with self._lock:
+            if flow_id is None:
+                self._graphs.clear()
+                return
+            for key in [key for key in self._graphs if key[0] == str(flow_id)]:
+                del self._graphs[key]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._graphs), "maxsize": self.maxsize}
+
+    def __len__(self) -> int:
+        return len(self._graphs)
+
+
+_prepared_graph_cache: PreparedGraphCache | None = None
+
+
+def get_prepared_graph_cache() -> PreparedGraphCache:
+    global _prepared_graph_cache  # noqa: PLW0603
+    if _prepared_graph_cache is None:
+        from langflow.services.deps import get_settings_service
+
+        maxsize = get_settings_service().settings.prepared_graph_cache_size
+        _prepared_graph_cache = PreparedGraphCache(maxsize=maxsize)
+    return _prepared_graph_cache
+
+
+async def get_prepared_graph(
+    flow: Flow,
+    tweaks: Tweaks | dict[str, Any] | None = None,
+    *,
+    stream: bool = False,
+    user_id: UUID | str | None = None,
+) -> Graph:
+    """Returns a graph of the flow with the tweaks applied, ready to be run.
+
+    The first request for a flow builds the graph from its data and keeps it as a template.
+    Later requests with the same flow version and tweaks get a clone of the template, which
+    skips parsing the payload, building the vertices and edges and computing the graph maps.
+    """
+    if flow.data is None:
+        msg = f"Flow {flow.id} has no data"
+        raise ValueError(msg)
+    tweaks_dict = tweaks.model_dump() if tweaks is not None and not isinstance(tweaks, dict) else dict(tweaks or {})
+    cache = get_prepared_graph_cache()
+    key = cache.make_key(flow, tweaks_dict, stream=stream, user_id=user_id) if cache.maxsize > 0 else None
+    if key is not None and (template := cache.get(key)) is not None:
+        return await template.clone()
+
+    # The template outlives the request, so it must not share nodes with the flow object
+    graph_data = process_tweaks(copy.deepcopy(flow.data), tweaks_dict, stream=stream)
+    graph = Graph.from_payload(graph_data, flow_id=str(flow.id), user_id=str(user_id), flow_name=flow.name)
+    if key is None:
+        return graph
+    cache.set(key, graph)
+    return await graph.clone()
@@ -29,8 +29,12 @@ async def run_graph_internal(
     session_id: str | None = None,
     inputs: list[InputValueRequest] | None = None,
     outputs: list[str] | None = None,
+    max_concurrency: int = 1,
 ) -> tuple[list[RunOutputs], str]:
-    """Run the graph and generate the result."""
+    """Run the graph and generate the result.
+
+    Several inputs run as a batch on isolated clones of the graph, up to `max_concurrency` at a time.
+    """
     inputs = inputs or []
     session_id_str = flow_id if session_id is None else session_id
     components = []
@@ -54,6 +58,7 @@ async def run_graph_internal(
         stream=stream,
         session_id=session_id_str or "",
         fallback_to_env_vars=fallback_to_env_vars,
+        max_concurrency=max_concurrency,
     )
     return run_outputs, session_id_str
 
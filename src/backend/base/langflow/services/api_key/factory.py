@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.services.api_key.service import ApiKeyService
+from langflow.services.factory import ServiceFactory
+
+if TYPE_CHECKING:
+    from langflow.services.database.service import DatabaseService
+    from langflow.services.settings.service import SettingsService
+
+
+class ApiKeyServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(ApiKeyService)
+
+    def create(self, settings_service: SettingsService, database_service: DatabaseService):
+        return ApiKeyService(settings_service, database_service)
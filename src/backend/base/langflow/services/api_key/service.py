@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, NamedTuple
+
+from loguru import logger
+from sqlalchemy import bindparam, update
+
+from langflow.services.base import Service
+from langflow.services.database.models.api_key.model import ApiKey
+from langflow.services.database.utils import session_getter
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.services.database.models.user.model import UserRead
+    from langflow.services.database.service import DatabaseService
+    from langflow.services.settings.service import SettingsService
+
+
+class _VerifiedKey(NamedTuple):
+    api_key_id: UUID
+    user: UserRead
+    expires_at: float
+
+
+class _Usage(NamedTuple):
+    uses: int
+    last_used_at: datetime
+
+
+class ApiKeyService(Service):
+    """Caches verified API keys and aggregates their usage counters.
+
+    Keys that were found in the database are remembered for `api_key_cache_ttl` seconds, so
+    requests authenticated with the same key skip the lookup. Uses are counted in memory and
+    written by a background thread every `api_key_usage_flush_interval` seconds with a single
+    bulk update, instead of one thread and one commit per request.
+
+    The cache is kept per process and `invalidate` only clears the cache of the calling process,
+    so when several workers serve requests, a deleted key is still accepted by the other workers
+    until their entry expires. The TTL bounds that window and is kept short for this reason.
+    """
+
+    name = "api_key_service"
+
+    def __init__(self, settings_service: SettingsService, database_service: DatabaseService):
+        self.settings_service = settings_service
+        self.database_service = database_service
+        settings = settings_service.settings
+        self.ttl = settings.api_key_cache_ttl
+        self.maxsize = settings.api_key_cache_size
+        self.flush_interval = settings.api_key_usage_flush_interval
+        self._lock = threading.Lock()
+        self._verified: OrderedDict[str, _VerifiedKey] = OrderedDict()
+        self._usage: dict[UUID, _Usage] = {}
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @staticmethod
+    def _hash_key(api_key: str) -> str:
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+    def get_user(self, api_key: str) -> UserRead | None:
+        """Returns the user of a recently verified key, counting the use, or None if it isn't cached."""
+        key_hash = self._hash_key(api_key)
+        with self._lock:
+            verified = self._verified.get(key_hash)
+            if verified is None:
+                return None
+            if verified.expires_at <= time.monotonic():
+                del self._verified[key_hash]
+                return None
+            self._verified.move_to_end(key_hash)
+        self.record_use(verified.api_key_id)
+        return verified.user
+
+    def set_user(self, api_key: str, api_key_id: UUID, user: UserRead) -> None:
+        """Remembers that `api_key` is valid and belongs to `user`."""
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            key_hash = self._hash_key(api_key)
+            self._verified[key_hash] = _VerifiedKey(api_key_id, user, time.monotonic() + self.ttl)
+            self._verified.move_to_end(key_hash)
+            while len(self._verified) > self.maxsize:
+                self._verified.popitem(last=False)
+
+    def invalidate(self, *, api_key_id: UUID | None = None, user_id: UUID | None = None) -> None:
+        """Forgets the verified keys with `api_key_id` or of `user_id`, or every key, in this process only."""
+        with self._lock:
+            if api_key_id is None and user_id is None:
+                self._verified.clear()
+                return
+            for key_hash, verified in list(self._verified.items()):
+                if verified.api_key_id == api_key_id or verified.user.id == user_id:
+                    del self._verified[key_hash]
+
+    def record_use(self, api_key_id: UUID) -> None:
+        """Counts a use of the key, to be written on the next flush."""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            usage = self._usage.get(api_key_id)
+            self._usage[api_key_id] = _Usage(usage.uses + 1 if usage else 1, now)
+        self._ensure_started()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None or self._stop_event.is_set():
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="langflow-api-key-usage", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the pending usage counters to the database in one bulk update."""
+        with self._lock:
+            usage, self._usage = self._usage, {}
+        if not usage:
+            return
+        statement = (
+            update(ApiKey)
+            .where(ApiKey.id == bindparam("api_key_id"))
+            .values(total_uses=ApiKey.total_uses + bindparam("uses"), last_used_at=bindparam("used_at"))
+        )
+        rows = [
+            {"api_key_id": api_key_id, "uses": key_usage.uses, "used_at": key_usage.last_used_at}
+            for api_key_id, key_usage in usage.items()
+        ]
+        try:
+            with session_getter(self.database_service) as session:
+                session.connection().execute(statement, rows)
+                session.commit()
+        except Exception:  # noqa: BLE001
+            logger.exception("Error updating API key usage")
+            with self._lock:
+                # Keep the counts so they are written on the next flush
+                for api_key_id, key_usage in usage.items():
+                    pending = self._usage.get(api_key_id)
+                    self._usage[api_key_id] = _Usage(
+                        key_usage.uses + (pending.uses if pending else 0),
+                        pending.last_used_at if pending else key_usage.last_used_at,
+                    )
+
+    async def teardown(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            await asyncio.to_thread(self._thread.join)
+        await asyncio.to_thread(self.flush)
@@ -1,6 +1,13 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from langflow.services.auth.service import AuthService
 from langflow.services.factory import ServiceFactory
 
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
 
 class AuthServiceFactory(ServiceFactory):
     name = "auth_service"
@@ -8,5 +15,5 @@ class AuthServiceFactory(ServiceFactory):
     def __init__(self) -> None:
         super().__init__(AuthService)
 
-    def create(self, settings_service):
+    def create(self, settings_service: SettingsService):
         return AuthService(settings_service)
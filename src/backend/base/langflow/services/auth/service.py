@@ -1,15 +1,84 @@
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+from sqlalchemy.orm import make_transient_to_detached
+
 from langflow.services.base import Service
+from langflow.services.database.models.user.model import User
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from langflow.services.settings.service import SettingsService
 
+UserCacheKey = tuple[str, int | None]
+
 
 class AuthService(Service):
+    """Holds authentication state shared across requests.
+
+    Active users resolved from access tokens are cached for `jwt_user_cache_ttl` seconds, keyed
+    by the token subject and expiry, so authenticated requests don't load the user on every call.
+    Each request gets its own detached copy of the cached user, which isn't part of the request
+    session: code that changes the user must load it from the session.
+
+    The cache is kept per process and `invalidate_user` only clears the cache of the calling
+    process, so when several workers serve requests, a user that was deactivated or demoted keeps
+    its access on the other workers until their entry expires. The TTL bounds that window and is
+    kept short for this reason.
+    """
+
     name = "auth_service"
 
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        settings = settings_service.settings
+        self.ttl = settings.jwt_user_cache_ttl
+        self.maxsize = settings.jwt_user_cache_size
+        self._lock = threading.Lock()
+        self._users: OrderedDict[UserCacheKey, tuple[float, User]] = OrderedDict()
+
+    def get_user(self, user_id: UUID | str, expires: int | None) -> User | None:
+        """Returns a detached copy of the cached user of a token, or None if it isn't cached."""
+        key = (str(user_id), expires)
+        with self._lock:
+            cached = self._users.get(key)
+            if cached is None:
+                return None
+            expires_at, user = cached
+            if expires_at <= time.monotonic():
+                del self._users[key]
+                return None
+            self._users.move_to_end(key)
+        return self._copy(user)
+
+    @staticmethod
+    def _copy(user: User) -> User:
+        user_copy = User(**user.model_dump())
+        make_transient_to_detached(user_copy)
+        return user_copy
+
+    def set_user(self, user_id: UUID | str, expires: int | None, user: User) -> None:
+        """Caches a detached copy of the active user a token resolved to."""
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        key = (str(user_id), expires)
+        user_copy = self._copy(user)
+        with self._lock:
+            self._users[key] = (time.monotonic() + self.ttl, user_copy)
+            self._users.move_to_end(key)
+            while len(self._users) > self.maxsize:
+                self._users.popitem(last=False)
+
+    def invalidate_user(self, user_id: UUID | str | None = None) -> None:
+        """Forgets the cached tokens of `user_id`, or of every user if no id is given."""
+        with self._lock:
+            if user_id is None:
+                self._users.clear()
+                return
+            for key in [key for key in self._users if key[0] == str(user_id)]:
+                del self._users[key]
@@ -15,10 +15,9 @@ from sqlmodel import Session
 from starlette.websockets import WebSocket
 
 from langflow.services.database.models.api_key.crud import check_key
-from langflow.services.database.models.api_key.model import ApiKey
 from langflow.services.database.models.user.crud import get_user_by_id, get_user_by_username, update_user_last_login_at
 from langflow.services.database.models.user.model import User, UserRead
-from langflow.services.deps import get_session, get_settings_service
+from langflow.services.deps import get_api_key_service, get_auth_service, get_session, get_settings_service
 from langflow.services.settings.service import SettingsService
 
 oauth2_login = OAuth2PasswordBearer(tokenUrl="api/v1/login", auto_error=False)
@@ -32,13 +31,29 @@ MINIMUM_KEY_LENGTH = 32
 
 
 # Source: https://github.com/mrtolkien/fastapi_simple_security/blob/master/fastapi_simple_security/security_api_key.py
+def get_user_by_api_key(db: Session, api_key: str) -> UserRead | None:
+    """Returns the user an API key belongs to, or None if the key is invalid.
+
+    Recently verified keys are served from the API key service without querying the database.
+    """
+    api_key_service = get_api_key_service()
+    if (user := api_key_service.get_user(api_key)) is not None:
+        return user
+    api_key_object = check_key(db, api_key)
+    if api_key_object is None:
+        return None
+    user = UserRead.model_validate(api_key_object.user, from_attributes=True)
+    api_key_service.set_user(api_key, api_key_object.id, user)
+    return user
+
+
 async def api_key_security(
     query_param: Annotated[str, Security(api_key_query)],
     header_param: Annotated[str, Security(api_key_header)],
     db: Annotated[Session, Depends(get_session)],
 ) -> UserRead | None:
     settings_service = get_settings_service()
-    result: ApiKey | User | None = None
+    result: UserRead | User | None = None
     if settings_service.auth_settings.AUTO_LOGIN:
         # Get the first user
         if not settings_service.auth_settings.SUPERUSER:
@@ -55,19 +70,16 @@ async def api_key_security(
             detail="An API key must be passed as query or header",
         )
 
-    elif query_param:
-        result = check_key(db, query_param)
-
     else:
-        result = check_key(db, header_param)
+        result = get_user_by_api_key(db, query_param or header_param)
 
     if not result:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid or missing API key",
         )
-    if isinstance(result, ApiKey):
-        return UserRead.model_validate(result.user, from_attributes=True)
+    if isinstance(result, UserRead):
+        return result
     if isinstance(result, User):
         return UserRead.model_validate(result, from_attributes=True)
     msg = "Invalid result type"
@@ -142,6 +154,9 @@ async def get_current_user_by_jwt(
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
 
+    auth_service = get_auth_service()
+    if (user := auth_service.get_user(user_id, expires)) is not None:
+        return user
     user = get_user_by_id(db, user_id)
     if user is None or not user.is_active:
         logger.info("User not found or inactive.")
@@ -150,9 +165,16 @@ async def get_current_user_by_jwt(
             detail="User not found or is inactive.",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    auth_service.set_user(user_id, expires, user)
     return user
 
 
+def invalidate_user_caches(user_id: UUID) -> None:
+    """Drops the cached authentication state of a user that was changed or deleted."""
+    get_auth_service().invalidate_user(user_id)
+    get_api_key_service().invalidate(user_id=user_id)
+
+
 async def get_current_user_for_websocket(
     websocket: WebSocket,
     db: Annotated[Session, Depends(get_session)],
@@ -167,3 +167,15 @@ class AsyncBaseCacheService(Service, Generic[AsyncLockType]):
         Returns:
             True if the key is in the cache, False otherwise.
         """
+
+    async def get_many(self, keys, lock: AsyncLockType | None = None) -> list:
+        """Retrieve several items from the cache.
+
+        Args:
+            keys: The keys of the items to retrieve.
+            lock: A lock to use for the operation.
+
+        Returns:
+            The values associated with the keys, in the same order.
+        """
+        return [await self.get(key, lock=lock) for key in keys]
@@ -27,6 +27,8 @@ class CacheServiceFactory(ServiceFactory):
                 db=settings_service.settings.redis_db,
                 url=settings_service.settings.redis_url,
                 expiration_time=settings_service.settings.redis_cache_expire,
+                compression=settings_service.settings.redis_cache_compression,
+                compression_threshold=settings_service.settings.redis_cache_compression_threshold,
             )
             if redis_cache.is_connected():
                 logger.debug("Redis cache is connected")
@@ -36,7 +38,11 @@ class CacheServiceFactory(ServiceFactory):
             raise ConnectionError(msg)
 
         if settings_service.settings.cache_type == "memory":
-            return ThreadingInMemoryCache(expiration_time=settings_service.settings.cache_expire)
+            return ThreadingInMemoryCache(
+                expiration_time=settings_service.settings.cache_expire,
+                max_bytes=settings_service.settings.cache_max_memory_mb * 1024 * 1024 or None,
+                sweep_interval=settings_service.settings.cache_sweep_interval or None,
+            )
         if settings_service.settings.cache_type == "async":
             return AsyncInMemoryCache(expiration_time=settings_service.settings.cache_expire)
         if settings_service.settings.cache_type == "disk":
@@ -2,26 +2,32 @@ import asyncio
 import pickle
 import threading
 import time
+import weakref
 from collections import OrderedDict
+from contextlib import nullcontext
 from typing import Generic, Union
 
 from loguru import logger
 from typing_extensions import override
 
 from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType, CacheService, LockType
-from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.cache.utils import CACHE_MISS, approximate_size
+from langflow.services.telemetry import metrics
 
 
 class ThreadingInMemoryCache(CacheService, Generic[LockType]):
     """A simple in-memory cache using an OrderedDict.
 
-    This cache supports setting a maximum size and expiration time for cached items.
+    This cache supports setting a maximum size, a maximum memory usage and expiration time for cached items.
     When the cache is full, it uses a Least Recently Used (LRU) eviction policy.
-    Thread-safe using a threading Lock.
+    Thread-safe using a threading Lock. The lock passed to an operation guards the caller's
+    critical section, and the cache's own lock is always held while the items are accessed.
 
     Attributes:
         max_size (int, optional): Maximum number of items to store in the cache.
         expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+        max_bytes (int, optional): Maximum approximate size in bytes of the items stored in the cache.
+        sweep_interval (float, optional): Time in seconds between background purges of expired items.
 
     Example:
         cache = InMemoryCache(max_size=3, expiration_time=5)
@@ -36,17 +42,37 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         b = cache["b"]
     """
 
-    def __init__(self, max_size=None, expiration_time=60 * 60) -> None:
+    def __init__(self, max_size=None, expiration_time=60 * 60, max_bytes=None, sweep_interval=None) -> None:
         """Initialize a new InMemoryCache instance.
 
         Args:
             max_size (int, optional): Maximum number of items to store in the cache.
             expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+            max_bytes (int, optional): Maximum approximate size in bytes of the items stored in the cache.
+                Sizes are only measured when this is set.
+            sweep_interval (float, optional): Time in seconds between background purges of expired items.
+                Expired items are otherwise only purged when they are read.
         """
         self._cache: OrderedDict = OrderedDict()
         self._lock = threading.RLock()
         self.max_size = max_size
         self.expiration_time = expiration_time
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.bytes = 0
+        self._stop_sweeper = threading.Event()
+        if sweep_interval and expiration_time is not None:
+            # The sweeper only holds a weak reference so it doesn't keep the cache alive
+            threading.Thread(
+                target=self._sweep_periodically,
+                args=(weakref.ref(self), sweep_interval, self._stop_sweeper),
+                name="langflow-cache-sweeper",
+                daemon=True,
+            ).start()
 
     def get(self, key, lock: Union[threading.Lock, None] = None):  # noqa: UP007
         """Retrieve an item from the cache.
@@ -58,52 +84,98 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         Returns:
             The value associated with the key, or None if the key is not found or the item has expired.
         """
-        with lock or self._lock:
+        with lock or nullcontext(), self._lock:
             return self._get_without_lock(key)
 
+    def _is_expired(self, item: dict, now: float) -> bool:
+        return self.expiration_time is not None and now - item["time"] >= self.expiration_time
+
     def _get_without_lock(self, key):
         """Retrieve an item from the cache without acquiring the lock."""
         if item := self._cache.get(key):
-            if self.expiration_time is None or time.time() - item["time"] < self.expiration_time:
+            if not self._is_expired(item, time.time()):
                 # Move the key to the end to make it recently used
                 self._cache.move_to_end(key)
+                self.hits += 1
+                metrics.record_cache_request("memory", hit=True)
                 # Check if the value is pickled
                 return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
+            self.expirations += 1
             self.delete(key)
+        self.misses += 1
+        metrics.record_cache_request("memory", hit=False)
         return None
 
+    def _measure(self, value) -> int:
+        return approximate_size(value) if self.max_bytes else 0
+
+    def _evict(self) -> None:
+        """Evict least recently used items until the cache is within its limits.
+
+        The most recent item is always kept, even if it is larger than `max_bytes` on its own.
+        """
+        while len(self._cache) > 1 and (
+            (self.max_size and len(self._cache) > self.max_size) or (self.max_bytes and self.bytes > self.max_bytes)
+        ):
+            _, item = self._cache.popitem(last=False)
+            self.bytes -= item["size"]
+            self.evictions += 1
+
     def set(self, key, value, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Add an item to the cache.
 
-        If the cache is full, the least recently used item is evicted.
+        If the cache is full, the least recently used items are evicted.
 
         Args:
             key: The key of the item.
             value: The value to cache.
             lock: A lock to use for the operation.
         """
-        with lock or self._lock:
+        size = self._measure(value)
+        with lock or nullcontext(), self._lock:
             if key in self._cache:
                 # Remove existing key before re-inserting to update order
                 self.delete(key)
-            elif self.max_size and len(self._cache) >= self.max_size:
-                # Remove least recently used item
-                self._cache.popitem(last=False)
-            # pickle locally to mimic Redis
-
-            self._cache[key] = {"value": value, "time": time.time()}
+            self._cache[key] = {"value": value, "time": time.time(), "size": size}
+            self.bytes += size
+            self._evict()
 
     def upsert(self, key, value, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Inserts or updates a value in the cache.
 
-        If the existing value and the new value are both dictionaries, they are merged.
+        If the existing value and the new value are both dictionaries, they are merged in place,
+        so only the new values are measured.
 
         Args:
             key: The key of the item.
             value: The value to insert or update.
             lock: A lock to use for the operation.
         """
-        with lock or self._lock:
+        with lock or nullcontext(), self._lock:
+            item = self._cache.get(key)
+            now = time.time()
+            if (
+                item is not None
+                and not self._is_expired(item, now)
+                and isinstance(item["value"], dict)
+                and isinstance(value, dict)
+            ):
+                existing_value = item["value"]
+                if self.max_bytes:
+                    size_delta = sum(
+                        approximate_size(v) - approximate_size(existing_value[k])
+                        if k in existing_value
+                        else approximate_size(k) + approximate_size(v)
+                        for k, v in value.items()
+                    )
+                    item["size"] += size_delta
+                    self.bytes += size_delta
+                existing_value.update(value)
+                item["time"] = now
+                self._cache.move_to_end(key)
+                self._evict()
+                return
+
             existing_value = self._get_without_lock(key)
             if existing_value is not None and isinstance(existing_value, dict) and isinstance(value, dict):
                 existing_value.update(value)
@@ -124,20 +196,68 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         Returns:
             The cached value associated with the key.
         """
-        with lock or self._lock:
+        with lock or nullcontext(), self._lock:
             if key in self._cache:
                 return self.get(key)
             self.set(key, value)
             return value
 
     def delete(self, key, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
-        with lock or self._lock:
-            self._cache.pop(key, None)
+        with lock or nullcontext(), self._lock:
+            item = self._cache.pop(key, None)
+            if item is not None:
+                self.bytes -= item["size"]
 
     def clear(self, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Clear all items from the cache."""
-        with lock or self._lock:
+        with lock or nullcontext(), self._lock:
             self._cache.clear()
+            self.bytes = 0
+
+    def purge_expired(self) -> int:
+        """Remove all expired items from the cache.
+
+        Returns:
+            int: The number of items removed.
+        """
+        if self.expiration_time is None:
+            return 0
+        with self._lock:
+            now = time.time()
+            expired_keys = [key for key, item in self._cache.items() if self._is_expired(item, now)]
+            for key in expired_keys:
+                self.delete(key)
+            self.expirations += len(expired_keys)
+        return len(expired_keys)
+
+    @staticmethod
+    def _sweep_periodically(cache_ref: weakref.ref, interval: float, stop: threading.Event) -> None:
+        while not stop.wait(interval):
+            cache = cache_ref()
+            if cache is None:
+                return
+            try:
+                cache.purge_expired()
+            except Exception:  # noqa: BLE001
+                logger.exception("Error purging expired cache items")
+            del cache
+
+    def stats(self) -> dict[str, int | None]:
+        """Return the hit, miss, eviction and expiration counts and the current size of the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._cache),
+                "bytes": self.bytes,
+                "max_size": self.max_size,
+                "max_bytes": self.max_bytes,
+            }
+
+    async def teardown(self) -> None:
+        self._stop_sweeper.set()
 
     def contains(self, key) -> bool:
         """Check if the key is in the cache."""
@@ -172,9 +292,14 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):
     """A Redis-based cache implementation.
 
     This cache supports setting an expiration time for cached items.
+    Dictionaries with string keys are stored as Redis hashes, one field per key, so upserts
+    only send the updated fields. Pickled values larger than `compression_threshold` bytes
+    can be compressed with zstd or lz4.
 
     Attributes:
         expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+        compression (str, optional): The compression to use for large values: "zstd", "lz4" or None.
+        compression_threshold (int, optional): The size in bytes above which values are compressed.
 
     Example:
         cache = RedisCache(expiration_time=5)
@@ -189,7 +314,20 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):
         b = cache["b"]
     """
 
-    def __init__(self, host="localhost", port=6379, db=0, url=None, expiration_time=60 * 60) -> None:
+    # Prefixes of compressed values. Uncompressed pickles always start with the PROTO opcode (0x80).
+    _ZSTD_PREFIX = b"LFZ\x01"
+    _LZ4_PREFIX = b"LFL\x01"
+
+    def __init__(
+        self,
+        host="localhost",
+        port=6379,
+        db=0,
+        url=None,
+        expiration_time=60 * 60,
+        compression=None,
+        compression_threshold=64 * 1024,
+    ) -> None:
         """Initialize a new RedisCache instance.
 
         Args:
@@ -199,6 +337,8 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):
             url (str, optional): Redis URL.
             expiration_time (int, optional): Time in seconds after which a
                 cached item expires. Default is 1 hour.
+            compression (str, optional): The compression to use for large values: "zstd", "lz4" or None.
+            compression_threshold (int, optional): The size in bytes above which values are compressed.
         """
         try:
             from redis.asyncio import StrictRedis
@@ -217,6 +357,18 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):
         else:
             self._client = StrictRedis(host=host, port=port, db=db)
         self.expiration_time = expiration_time
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self._compressor = None
+        if compression == "zstd":
+            import zstandard
+
+            self._compressor = zstandard.ZstdCompressor()
+        elif compression == "lz4":
+            import lz4.frame  # noqa: F401
+        elif compression is not None:
+            msg = f"Unsupported RedisCache compression: {compression}"
+            raise ValueError(msg)
 
     # check connection
     def is_connected(self) -> bool:
@@ -230,30 +382,89 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):
             return False
         return True
 
+    def _dumps(self, value) -> bytes:
+        try:
+            pickled = pickle.dumps(value)
+        except TypeError as exc:
+            msg = "RedisCache only accepts values that can be pickled. "
+            raise TypeError(msg) from exc
+        if self.compression is None or len(pickled) < self.compression_threshold:
+            return pickled
+        if self._compressor is not None:
+            return self._ZSTD_PREFIX + self._compressor.compress(pickled)
+        import lz4.frame
+
+        return self._LZ4_PREFIX + lz4.frame.compress(pickled)
+
+    def _loads(self, data: bytes):
+        # Compressed values are decoded whatever the current setting, so it can be changed safely
+        if data.startswith(self._ZSTD_PREFIX):
+            import zstandard
+
+            data = zstandard.ZstdDecompressor().decompress(data[len(self._ZSTD_PREFIX) :])
+        elif data.startswith(self._LZ4_PREFIX):
+            import lz4.frame
+
+            data = lz4.frame.decompress(data[len(self._LZ4_PREFIX) :])
+        return pickle.loads(data)
+
+    @staticmethod
+    def _is_hashable_dict(value) -> bool:
+        return isinstance(value, dict) and bool(value) and all(isinstance(field, str) for field in value)
+
+    def _decode(self, value, fields):
+        """Decode the results of the GET and HGETALL sent for a key, only one of which matches its type."""
+        if isinstance(value, bytes):
+            return self._loads(value)
+        if isinstance(fields, dict) and fields:
+            return {field.decode(): self._loads(data) for field, data in fields.items()}
+        return None
+
+    def _queue_set(self, pipe, key: str, value) -> None:
+        if self._is_hashable_dict(value):
+            pipe.delete(key)
+            pipe.hset(key, mapping={field: self._dumps(field_value) for field, field_value in value.items()})
+            pipe.expire(key, self.expiration_time)
+        else:
+            pipe.setex(key, self.expiration_time, self._dumps(value))
+
     @override
     async def get(self, key, lock=None):
         if key is None:
             return None
-        value = await self._client.get(str(key))
-        return pickle.loads(value) if value else None
+        return (await self.get_many([key]))[0]
+
+    @override
+    async def get_many(self, keys, lock=None) -> list:
+        """Retrieve several items from the cache in a single round trip."""
+        keys = [str(key) for key in keys]
+        if not keys:
+            return []
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.get(key)
+                pipe.hgetall(key)
+            results = await pipe.execute(raise_on_error=False)
+        values = [self._decode(results[i], results[i + 1]) for i in range(0, len(results), 2)]
+        for value in values:
+            metrics.record_cache_request("redis", hit=value is not None)
+        return values
 
     @override
     async def set(self, key, value, lock=None) -> None:
-        try:
-            if pickled := pickle.dumps(value):
-                result = await self._client.setex(str(key), self.expiration_time, pickled)
-                if not result:
-                    msg = "RedisCache could not set the value."
-                    raise ValueError(msg)
-        except TypeError as exc:
-            msg = "RedisCache only accepts values that can be pickled. "
-            raise TypeError(msg) from exc
+        async with self._client.pipeline(transaction=True) as pipe:
+            self._queue_set(pipe, str(key), value)
+            results = await pipe.execute()
+        if not all(result is not False for result in results):
+            msg = "RedisCache could not set the value."
+            raise ValueError(msg)
 
     @override
     async def upsert(self, key, value, lock=None) -> None:
         """Inserts or updates a value in the cache.
 
         If the existing value and the new value are both dictionaries, they are merged.
+        Dictionaries stored as hashes are updated in place, one field per key.
 
         Args:
             key: The key of the item.
@@ -262,6 +473,21 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):
         """
         if key is None:
             return
+        key = str(key)
+        if self._is_hashable_dict(value):
+            from redis.exceptions import ResponseError
+
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping={field: self._dumps(field_value) for field, field_value in value.items()})
+                pipe.expire(key, self.expiration_time)
+                try:
+                    await pipe.execute()
+                except ResponseError as exc:
+                    # The key holds a plain value, merge it below
+                    if "WRONGTYPE" not in str(exc):
+                        raise
+                else:
+                    return
         existing_value = await self.get(key)
         if existing_value is not None and isinstance(existing_value, dict) and isinstance(value, dict):
             existing_value.update(value)
@@ -309,9 +535,11 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         if item:
             if time.time() - item["time"] < self.expiration_time:
                 self.cache.move_to_end(key)
+                metrics.record_cache_request("async_memory", hit=True)
                 return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
             logger.info(f"Cache item for key '{key}' has expired and will be deleted.")
             await self._delete(key)  # Log before deleting the expired item
+        metrics.record_cache_request("async_memory", hit=False)
         return CACHE_MISS
 
     async def set(self, key, value, lock: asyncio.Lock | None = None) -> None:
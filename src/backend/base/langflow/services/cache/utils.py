@@ -1,7 +1,9 @@
 import base64
 import contextlib
 import hashlib
+import sys
 import tempfile
+from collections import deque
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -167,3 +169,43 @@ def update_build_status(cache_service, flow_id: str, status: "BuildStatus") -> N
 
 
 CACHE_MISS = CacheMiss()
+
+
+def approximate_size(value: Any, max_objects: int = 10_000) -> int:
+    """Approximates the memory used by an object and the objects it references, in bytes.
+
+    Containers, `__dict__` and `__slots__` are walked breadth first. Objects shared between
+    references are counted once, and the walk stops after `max_objects` objects, so the
+    result is a lower bound for very large objects.
+
+    Args:
+        value: The object to measure.
+        max_objects: The maximum number of objects to visit.
+
+    Returns:
+        int: The approximate size in bytes.
+    """
+    if isinstance(value, bytes | bytearray | str):
+        return sys.getsizeof(value)
+    seen: set[int] = set()
+    pending = deque([value])
+    size = 0
+    while pending and len(seen) < max_objects:
+        obj = pending.popleft()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj, 0)
+        if isinstance(obj, str | bytes | bytearray | int | float | bool):
+            continue
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, list | tuple | set | frozenset | deque):
+            pending.extend(obj)
+        if hasattr(obj, "__dict__") and not isinstance(obj, type):
+            pending.append(vars(obj))
+        for slot in getattr(type(obj), "__slots__", ()):
+            if isinstance(slot, str) and hasattr(obj, slot):
+                pending.append(getattr(obj, slot))
+    return size
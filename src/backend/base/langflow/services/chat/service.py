@@ -1,12 +1,19 @@
+from __future__ import annotations
+
 import asyncio
 from collections import defaultdict
 from threading import RLock
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService, CacheService
 from langflow.services.deps import get_cache_service
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from langflow.graph.graph.base import Graph
+
 
 class ChatService(Service):
     """Service class for managing chat-related operations."""
@@ -17,6 +24,46 @@ class ChatService(Service):
         self.async_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._sync_cache_locks: dict[str, RLock] = defaultdict(RLock)
         self.cache_service: CacheService | AsyncBaseCacheService = get_cache_service()
+        # Maps cache keys to the run whose full graph snapshot is stored under them
+        self._snapshot_runs: dict[str, str] = {}
+        # Maps cache keys to the vertex checkpoint keys written for them
+        self._checkpoint_keys: dict[str, set[str]] = defaultdict(set)
+
+    # The checkpoint entries of a graph are guarded by the locks of the graph's key, so the
+    # locks don't grow with the number of runs and vertices
+    async def _upsert(self, key: str, value: Any, lock_key: str, lock: asyncio.Lock | None) -> None:
+        if isinstance(self.cache_service, AsyncBaseCacheService):
+            await self.cache_service.upsert(key, value, lock=lock or self.async_cache_locks[lock_key])
+        else:
+            await asyncio.to_thread(self.cache_service.upsert, key, value, lock=self._sync_cache_locks[lock_key])
+
+    async def _get(self, key: str, lock_key: str, lock: asyncio.Lock | None) -> Any:
+        if isinstance(self.cache_service, AsyncBaseCacheService):
+            return await self.cache_service.get(key, lock=lock or self.async_cache_locks[lock_key])
+        return await asyncio.to_thread(self.cache_service.get, key, lock=self._sync_cache_locks[lock_key])
+
+    async def _delete(self, key: str, lock_key: str, lock: asyncio.Lock | None) -> None:
+        if isinstance(self.cache_service, AsyncBaseCacheService):
+            await self.cache_service.delete(key, lock=lock or self.async_cache_locks[lock_key])
+        else:
+            await asyncio.to_thread(self.cache_service.delete, key, lock=self._sync_cache_locks[lock_key])
+
+    async def _delete_checkpoints(self, key: str, lock: asyncio.Lock | None) -> None:
+        """Delete the run state and the vertex checkpoints stored for `key`.
+
+        The vertex checkpoints are found from the keys written by this process and from the
+        stored run state, which also lists those written by other processes sharing the cache.
+        """
+        checkpoint_key = self._checkpoint_key(key)
+        vertex_keys = self._checkpoint_keys.pop(key, set())
+        run_state = await self._get(checkpoint_key, key, lock)
+        if run_state:
+            vertex_keys.update(
+                self._vertex_checkpoint_key(key, run_state["run_id"], vertex_id) for vertex_id in run_state["vertices"]
+            )
+        for vertex_key in vertex_keys:
+            await self._delete(vertex_key, key, lock)
+        await self._delete(checkpoint_key, key, lock)
 
     async def set_cache(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool:
         """Set the cache for a client.
@@ -28,14 +75,21 @@ class ChatService(Service):
 
         Returns:
             bool: True if the cache was set successfully, False otherwise.
+                Async caches raise instead of failing silently, so their result isn't checked again.
         """
+        from langflow.graph.graph.base import Graph
+
         result_dict = {
             "result": data,
             "type": type(data),
         }
+        if isinstance(data, Graph):
+            # A full snapshot supersedes the checkpoints of previous runs
+            await self._delete_checkpoints(str(key), lock)
+            self._snapshot_runs[str(key)] = data._run_id
         if isinstance(self.cache_service, AsyncBaseCacheService):
             await self.cache_service.upsert(str(key), result_dict, lock=lock or self.async_cache_locks[key])
-            return await self.cache_service.contains(key)
+            return True
         await asyncio.to_thread(
             self.cache_service.upsert, str(key), result_dict, lock=lock or self._sync_cache_locks[key]
         )
@@ -62,6 +116,78 @@ class ChatService(Service):
             key (str): The cache key.
             lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
         """
+        self._snapshot_runs.pop(str(key), None)
+        await self._delete_checkpoints(str(key), lock)
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
+            return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
         return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
+
+    @staticmethod
+    def _checkpoint_key(key: str) -> str:
+        return f"{key}:checkpoint"
+
+    @staticmethod
+    def _vertex_checkpoint_key(key: str, run_id: str, vertex_id: str) -> str:
+        return f"{key}:checkpoint:{run_id}:{vertex_id}"
+
+    async def checkpoint_graph(
+        self, key: str, graph: Graph, vertex_ids: Iterable[str] = (), lock: asyncio.Lock | None = None
+    ) -> None:
+        """Persist the progress of a graph run without serializing the whole graph.
+
+        Only the scheduling state of the run and the build results of `vertex_ids` are
+        written. A full snapshot of the graph is written the first time a run is
+        checkpointed, so `get_graph` has a base to apply the checkpoints to.
+
+        Args:
+            key (str): The cache key of the graph.
+            graph (Graph): The graph being run.
+            vertex_ids (Iterable[str]): The vertices built since the last checkpoint.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operations. Defaults to None.
+        """
+        key = str(key)
+        run_id = graph._run_id
+        if self._snapshot_runs.get(key) != run_id:
+            await self.set_cache(key, graph, lock=lock)
+            return
+        for vertex_id in vertex_ids:
+            vertex = graph.get_vertex(vertex_id)
+            vertex_key = self._vertex_checkpoint_key(key, run_id, vertex_id)
+            self._checkpoint_keys[key].add(vertex_key)
+            await self._upsert(vertex_key, vertex.get_checkpoint_state(), key, lock)
+            graph.checkpointed_vertices.add(vertex_id)
+        run_state = {"run_id": run_id, "vertices": list(graph.checkpointed_vertices), **graph.get_run_state()}
+        await self._upsert(self._checkpoint_key(key), run_state, key, lock)
+
+    async def get_graph(self, key: str, lock: asyncio.Lock | None = None) -> Graph | None:
+        """Get a cached graph with the checkpoints of its latest run applied.
+
+        Args:
+            key (str): The cache key of the graph.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operations. Defaults to None.
+
+        Returns:
+            Optional[Graph]: The graph, or None if it is not cached.
+        """
+        key = str(key)
+        cache = await self.get_cache(key, lock=lock)
+        if not cache:
+            return None
+        graph = cache.get("result")
+        run_state = await self._get(self._checkpoint_key(key), key, lock)
+        if not run_state:
+            return graph
+        run_state = dict(run_state)
+        run_id = run_state.pop("run_id")
+        vertex_ids = run_state.pop("vertices")
+        vertex_keys = [self._vertex_checkpoint_key(key, run_id, vertex_id) for vertex_id in vertex_ids]
+        if isinstance(self.cache_service, AsyncBaseCacheService):
+            vertex_states = await self.cache_service.get_many(vertex_keys, lock=lock or self.async_cache_locks[key])
+        else:
+            vertex_states = [await self._get(vertex_key, key, lock) for vertex_key in vertex_keys]
+        for vertex_id, vertex_state in zip(vertex_ids, vertex_states, strict=True):
+            if vertex_state:
+                graph.get_vertex(vertex_id).apply_checkpoint_state(vertex_state)
+                graph.checkpointed_vertices.add(vertex_id)
+        graph.apply_run_state(run_state)
+        return graph
@@ -1,12 +1,12 @@
 import datetime
 import secrets
-import threading
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 from sqlmodel import Session, select
 
 from langflow.services.database.models.api_key import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
+from langflow.services.deps import get_api_key_service
 
 if TYPE_CHECKING:
     from sqlmodel.sql.expression import SelectOfScalar
@@ -44,35 +44,16 @@ def delete_api_key(session: Session, api_key_id: UUID) -> None:
         raise ValueError(msg)
     session.delete(api_key)
     session.commit()
+    get_api_key_service().invalidate(api_key_id=api_key_id)
 
 
 def check_key(session: Session, api_key: str) -> ApiKey | None:
-    """Check if the API key is valid."""
+    """Check if the API key is valid.
+
+    The use is counted by the API key service, which writes usage counts in bulk.
+    """
     query: SelectOfScalar = select(ApiKey).where(ApiKey.api_key == api_key)
     api_key_object: ApiKey | None = session.exec(query).first()
     if api_key_object is not None:
-        threading.Thread(
-            target=update_total_uses,
-            args=(
-                session,
-                api_key_object,
-            ),
-        ).start()
+        get_api_key_service().record_use(api_key_object.id)
     return api_key_object
-
-
-def update_total_uses(session, api_key: ApiKey):
-    """Update the total uses and last used at."""
-    # This is running in a separate thread to avoid slowing down the request
-    # but session is not thread safe so we need to create a new session
-
-    with Session(session.get_bind()) as new_session:
-        new_api_key = new_session.get(ApiKey, api_key.id)
-        if new_api_key is None:
-            msg = "API Key not found"
-            raise ValueError(msg)
-        new_api_key.total_uses += 1
-        new_api_key.last_used_at = datetime.datetime.now(datetime.timezone.utc)
-        new_session.add(new_api_key)
-        new_session.commit()
-    return new_api_key
@@ -1,9 +1,8 @@
 from uuid import UUID
 
-from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, col, select
 
-from langflow.services.database.models.transactions.model import TransactionBase, TransactionTable
+from langflow.services.database.models.transactions.model import TransactionTable
 
 
 def get_transactions_by_flow_id(db: Session, flow_id: UUID, limit: int | None = 1000) -> list[TransactionTable]:
@@ -16,14 +15,3 @@ def get_transactions_by_flow_id(db: Session, flow_id: UUID, limit: int | None =
 
     transactions = db.exec(stmt)
     return list(transactions)
-
-
-def log_transaction(db: Session, transaction: TransactionBase) -> TransactionTable:
-    table = TransactionTable(**transaction.model_dump())
-    db.add(table)
-    try:
-        db.commit()
-    except IntegrityError:
-        db.rollback()
-        raise
-    return table
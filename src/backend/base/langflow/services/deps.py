@@ -12,9 +12,13 @@ if TYPE_CHECKING:
 
     from sqlmodel import Session
 
+    from langflow.services.api_key.service import ApiKeyService
+    from langflow.services.auth.service import AuthService
     from langflow.services.cache.service import AsyncBaseCacheService, CacheService
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
+    from langflow.services.executor.service import ExecutorService
+    from langflow.services.log_writer.service import LogWriterService
     from langflow.services.plugins.service import PluginService
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
@@ -71,6 +75,50 @@ def get_tracing_service() -> TracingService:
     return get_service(ServiceType.TRACING_SERVICE, TracingServiceFactory())
 
 
+def get_executor_service() -> ExecutorService:
+    """Retrieves the ExecutorService instance from the service manager.
+
+    Returns:
+        ExecutorService: The ExecutorService instance.
+    """
+    from langflow.services.executor.factory import ExecutorServiceFactory
+
+    return get_service(ServiceType.EXECUTOR_SERVICE, ExecutorServiceFactory())
+
+
+def get_log_writer_service() -> LogWriterService:
+    """Retrieves the LogWriterService instance from the service manager.
+
+    Returns:
+        LogWriterService: The LogWriterService instance.
+    """
+    from langflow.services.log_writer.factory import LogWriterServiceFactory
+
+    return get_service(ServiceType.LOG_WRITER_SERVICE, LogWriterServiceFactory())
+
+
+def get_api_key_service() -> ApiKeyService:
+    """Retrieves the ApiKeyService instance from the service manager.
+
+    Returns:
+        ApiKeyService: The ApiKeyService instance.
+    """
+    from langflow.services.api_key.factory import ApiKeyServiceFactory
+
+    return get_service(ServiceType.API_KEY_SERVICE, ApiKeyServiceFactory())
+
+
+def get_auth_service() -> AuthService:
+    """Retrieves the AuthService instance from the service manager.
+
+    Returns:
+        AuthService: The AuthService instance.
+    """
+    from langflow.services.auth.factory import AuthServiceFactory
+
+    return get_service(ServiceType.AUTH_SERVICE, AuthServiceFactory())
+
+
 def get_state_service() -> StateService:
     """Retrieves the StateService instance from the service manager.
 
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.services.executor.service import ExecutorService
+from langflow.services.factory import ServiceFactory
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+
+class ExecutorServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(ExecutorService)
+
+    def create(self, settings_service: SettingsService):
+        return ExecutorService(settings_service)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.utils.concurrency import ThreadSafeSemaphore
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    from langflow.services.settings.service import SettingsService
+
+T = TypeVar("T")
+
+# Set while a coroutine runs on one of the executor loops, so nested submissions run inline
+_inside_executor: ContextVar[bool] = ContextVar("inside_executor", default=False)
+
+
+class _LoopWorker:
+    """A daemon thread running a long-lived event loop."""
+
+    def __init__(self, name: str) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.in_flight = 0
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
+
+    def stop(self) -> None:
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+
+
+class ExecutorService(Service):
+    """Runs vertex builds on a pool of long-lived event loops.
+
+    Each submitted coroutine is dispatched to the least busy worker loop, so blocking
+    components don't stall the caller's loop and loop-bound resources (e.g. pooled HTTP
+    clients) can be reused across vertices. Concurrency is bounded per process and per flow.
+
+    The coroutines of a flow all run on the same worker loop while the flow has any in flight,
+    because its vertices share asyncio locks (the vertex locks and the chat service cache locks)
+    that can't be awaited from several loops. Coroutines run with a copy of the caller's context.
+    """
+
+    name = "executor_service"
+
+    def __init__(self, settings_service: SettingsService):
+        self.settings_service = settings_service
+        settings = settings_service.settings
+        self.num_workers = settings.vertex_executor_workers
+        self.max_concurrency = settings.vertex_executor_max_concurrency
+        self.max_concurrency_per_flow = settings.vertex_executor_max_concurrency_per_flow
+        self._workers: list[_LoopWorker] = []
+        self._workers_lock = threading.Lock()
+        self._process_semaphore = ThreadSafeSemaphore(self.max_concurrency)
+        self._flow_semaphores: dict[str, ThreadSafeSemaphore] = defaultdict(
+            lambda: ThreadSafeSemaphore(self.max_concurrency_per_flow)
+        )
+        self._flow_in_flight: dict[str, int] = defaultdict(int)
+        self._flow_workers: dict[str, _LoopWorker] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.num_workers > 0
+
+    def _start_workers(self) -> None:
+        with self._workers_lock:
+            if not self._workers:
+                self._workers = [_LoopWorker(f"langflow-executor-{i}") for i in range(self.num_workers)]
+
+    def _pick_worker(self, flow_id: str | None) -> _LoopWorker:
+        if not self._workers:
+            self._start_workers()
+        with self._workers_lock:
+            if flow_id is not None and flow_id in self._flow_workers:
+                return self._flow_workers[flow_id]
+            worker = min(self._workers, key=lambda worker: worker.in_flight)
+            if flow_id is not None:
+                self._flow_workers[flow_id] = worker
+            return worker
+
+    def _acquire_flow_semaphore(self, flow_id: str) -> ThreadSafeSemaphore:
+        with self._workers_lock:
+            self._flow_in_flight[flow_id] += 1
+            return self._flow_semaphores[flow_id]
+
+    def _release_flow_semaphore(self, flow_id: str) -> None:
+        with self._workers_lock:
+            self._flow_in_flight[flow_id] -= 1
+            if self._flow_in_flight[flow_id] <= 0:
+                # Drop the bookkeeping of flows that are no longer running
+                self._flow_in_flight.pop(flow_id, None)
+                self._flow_semaphores.pop(flow_id, None)
+                self._flow_workers.pop(flow_id, None)
+
+    async def run(self, coro: Coroutine[Any, Any, T], *, flow_id: str | None = None) -> T:
+        """Runs a coroutine on one of the executor loops and waits for its result.
+
+        Args:
+            coro: The coroutine to run.
+            flow_id: The flow the coroutine belongs to, used for the per-flow concurrency limit.
+
+        Returns:
+            The result of the coroutine.
+        """
+        if not self.enabled or _inside_executor.get():
+            # Nested submissions run inline to avoid waiting on slots held by their parent
+            return await coro
+
+        flow_key = str(flow_id) if flow_id is not None else None
+        flow_semaphore = self._acquire_flow_semaphore(flow_key) if flow_key else None
+        dispatched = False
+        try:
+            if flow_semaphore:
+                await flow_semaphore.acquire()
+            try:
+                async with self._process_semaphore.hold():
+                    dispatched = True
+                    return await self._dispatch(coro, flow_key)
+            finally:
+                if flow_semaphore:
+                    flow_semaphore.release()
+        finally:
+            if flow_key:
+                self._release_flow_semaphore(flow_key)
+            if not dispatched:
+                # Cancelled while waiting for a slot
+                coro.close()
+
+    async def _dispatch(self, coro: Coroutine[Any, Any, T], flow_id: str | None) -> T:
+        worker = self._pick_worker(flow_id)
+        worker.in_flight += 1
+        context = contextvars.copy_context()
+
+        async def _run_in_worker() -> T:
+            # Run with the caller's context variables (e.g. the trace context and request state)
+            for var, value in context.items():
+                var.set(value)
+            _inside_executor.set(True)
+            return await coro
+
+        try:
+            future = asyncio.run_coroutine_threadsafe(_run_in_worker(), worker.loop)
+            return await asyncio.wrap_future(future)
+        finally:
+            worker.in_flight -= 1
+
+    async def teardown(self) -> None:
+        with self._workers_lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            try:
+                await asyncio.to_thread(worker.stop)
+            except Exception:  # noqa: BLE001
+                logger.exception("Error stopping executor worker")
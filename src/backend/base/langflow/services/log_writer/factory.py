@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.services.factory import ServiceFactory
+from langflow.services.log_writer.service import LogWriterService
+
+if TYPE_CHECKING:
+    from langflow.services.database.service import DatabaseService
+    from langflow.services.settings.service import SettingsService
+
+
+class LogWriterServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(LogWriterService)
+
+    def create(self, settings_service: SettingsService, database_service: DatabaseService):
+        return LogWriterService(settings_service, database_service)
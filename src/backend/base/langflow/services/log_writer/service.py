@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.database.utils import session_getter
+from langflow.services.telemetry import metrics
+
+if TYPE_CHECKING:
+    from sqlmodel import SQLModel
+
+    from langflow.services.database.service import DatabaseService
+    from langflow.services.settings.service import SettingsService
+
+
+class LogWriterService(Service):
+    """Writes transaction and vertex build logs to the database in batches.
+
+    Rows are queued in memory and bulk inserted by a background thread once `batch_size`
+    rows are pending or `flush_interval` seconds have passed since the oldest one was
+    queued, so a flow run commits once per batch instead of once per row.
+    """
+
+    name = "log_writer_service"
+
+    def __init__(self, settings_service: SettingsService, database_service: DatabaseService):
+        self.settings_service = settings_service
+        self.database_service = database_service
+        settings = settings_service.settings
+        self.batch_size = settings.log_writer_batch_size
+        self.flush_interval = settings.log_writer_flush_interval
+        self.overflow_policy = settings.log_writer_overflow_policy
+        self.dropped = 0
+        # Rows are queued with the time they were added. Flushes queue an event the writer sets once
+        # the rows before it are written, and None is queued on teardown to wake the writer up
+        self._queue: queue.Queue[tuple[float, SQLModel] | threading.Event | None] = queue.Queue(
+            maxsize=settings.log_writer_queue_size
+        )
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="langflow-log-writer", daemon=True)
+                self._thread.start()
+
+    def add(self, row: SQLModel) -> None:
+        """Queues a row to be inserted.
+
+        If the queue is full the row is dropped, or the caller waits for room when the
+        overflow policy is "block". Rows added after teardown are written immediately.
+        """
+        if self._stop_event.is_set():
+            self._write([row])
+            return
+        self._ensure_started()
+        try:
+            self._queue.put((time.monotonic(), row), block=self.overflow_policy == "block")
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(f"Log writer queue is full, {self.dropped} rows dropped so far")
+
+    async def aadd(self, row: SQLModel) -> None:
+        """Queues a row to be inserted without blocking the event loop."""
+        if self.overflow_policy == "block" and self._queue.full():
+            await asyncio.to_thread(self.add, row)
+        else:
+            self.add(row)
+
+    def flush(self) -> None:
+        """Waits until the rows queued before the call have been written.
+
+        Rows added while waiting aren't waited for.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return
+        marker = threading.Event()
+        self._queue.put(marker)
+        self._wait_for(marker)
+
+    async def aflush(self) -> None:
+        """Waits until the rows queued before the call have been written without blocking the event loop."""
+        if self._thread is None or not self._queue.unfinished_tasks:
+            return
+        marker = threading.Event()
+        try:
+            self._queue.put_nowait(marker)
+        except queue.Full:
+            await asyncio.to_thread(self._queue.put, marker)
+        await asyncio.to_thread(self._wait_for, marker)
+
+    def _wait_for(self, marker: threading.Event) -> None:
+        # The writer stops after teardown, so a marker queued too late is never set
+        while not marker.wait(self.flush_interval):
+            if self._thread is None or not self._thread.is_alive():
+                return
+
+    def _collect_batch(self) -> list[tuple[float, SQLModel] | threading.Event | None]:
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        # A flush is waiting for the rows before a marker, so they are written right away
+        while len(batch) < self.batch_size and not isinstance(batch[-1], threading.Event):
+            remaining = 0 if self._stop_event.is_set() else deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect_batch()
+            items = [item for item in batch if isinstance(item, tuple)]
+            try:
+                if items:
+                    self._write([row for _, row in items])
+                    self._record_metrics(items)
+            finally:
+                for item in batch:
+                    if isinstance(item, threading.Event):
+                        item.set()
+                    self._queue.task_done()
+            if self._stop_event.is_set() and self._queue.empty():
+                return
+
+    def _record_metrics(self, items: list[tuple[float, SQLModel]]) -> None:
+        written_at = time.monotonic()
+        for queued_at, row in items:
+            metrics.observe("log_writer_lag", written_at - queued_at, {"table": type(row).__name__})
+        metrics.set_gauge("log_writer_backlog", self._queue.qsize(), {"service": self.name})
+
+    def _write(self, rows: list[SQLModel]) -> None:
+        try:
+            with session_getter(self.database_service) as session:
+                session.add_all(rows)
+                session.commit()
+        except Exception:  # noqa: BLE001
+            # Fall back to one row at a time so a single bad row doesn't lose the whole batch
+            for row in rows:
+                try:
+                    with session_getter(self.database_service) as session:
+                        session.add(row)
+                        session.commit()
+                except Exception:  # noqa: BLE001
+                    logger.exception(f"Error writing {type(row).__name__} log")
+        else:
+            logger.debug(f"Logged {len(rows)} rows")
+
+    async def teardown(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            await asyncio.to_thread(self._queue.put, None)
+            await asyncio.to_thread(self._thread.join)
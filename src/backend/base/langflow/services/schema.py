@@ -20,3 +20,6 @@ class ServiceType(str, Enum):
     STATE_SERVICE = "state_service"
     TRACING_SERVICE = "tracing_service"
     TELEMETRY_SERVICE = "telemetry_service"
+    EXECUTOR_SERVICE = "executor_service"
+    LOG_WRITER_SERVICE = "log_writer_service"
+    API_KEY_SERVICE = "api_key_service"
@@ -1,4 +1,5 @@
 import contextlib
+import importlib.util
 import json
 import os
 from pathlib import Path
@@ -86,6 +87,16 @@ class Settings(BaseSettings):
     """The cache type can be 'async' or 'redis'."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    cache_max_memory_mb: int = 0
+    """The approximate memory limit in MB of the 'memory' cache, evicting least recently used items beyond it.
+    Set to 0 for no limit."""
+    cache_sweep_interval: int = 60
+    """The interval in seconds at which expired items are purged from the 'memory' cache. Set to 0 to disable."""
+    component_class_cache_size: int = 256
+    """The maximum number of compiled component classes to keep in memory. Set to 0 to disable the cache."""
+    prepared_graph_cache_size: int = 64
+    """The maximum number of flow graphs kept as templates for the run and webhook endpoints.
+    Set to 0 to disable the cache."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
 
@@ -96,6 +107,14 @@ class Settings(BaseSettings):
 
     remove_api_keys: bool = False
     components_path: list[str] = []
+    component_index_enabled: bool = True
+    """If set to True, the components built at startup are saved to an index on disk, and only the component
+    files that changed since are built again."""
+    component_index_path: str | None = None
+    """The path of the component index. Defaults to a file in the config directory."""
+    component_discovery_workers: int = 1
+    """The number of processes the component files are built in at startup. With 1, they are built in the
+    server process."""
     langchain_cache: str = "InMemoryCache"
     load_flows_path: str | None = None
 
@@ -105,6 +124,11 @@ class Settings(BaseSettings):
     redis_db: int = 0
     redis_url: str | None = None
     redis_cache_expire: int = 3600
+    redis_cache_compression: Literal["zstd", "lz4"] | None = None
+    """The compression to use for large values stored in the Redis cache. Requires the zstandard package for "zstd"
+    and the lz4 package for "lz4"."""
+    redis_cache_compression_threshold: int = 64 * 1024
+    """The size in bytes above which values stored in the Redis cache are compressed."""
 
     # Sentry
     sentry_dsn: str | None = None
@@ -120,6 +144,18 @@ class Settings(BaseSettings):
 
     celery_enabled: bool = False
 
+    task_backend: Literal["anyio", "local"] = "anyio"
+    """The backend that runs tasks when Celery isn't enabled. `local` keeps them in a durable queue
+    in a SQLite database, which lets the run and webhook endpoints run flows in the background."""
+    task_queue_path: str | None = None
+    """Path of the database of the local task queue. Defaults to `task_queue.db` in the config directory."""
+    task_queue_workers: int = 4
+    """The maximum number of tasks the local task queue runs at the same time."""
+    task_max_retries: int = 0
+    """How many times the local task queue retries a failed task."""
+    task_result_ttl: int = 3600
+    """Seconds the local task queue keeps finished tasks and their results."""
+
     fallback_to_env_var: bool = True
     """If set to True, Global Variables set in the UI will fallback to a environment variable
     with the same name in case Langflow fails to retrieve the variable value."""
@@ -137,6 +173,30 @@ class Settings(BaseSettings):
     backend_only: bool = False
     """If set to True, Langflow will not serve the frontend."""
 
+    # Vertex execution
+    vertex_executor_workers: int = 8
+    """The number of long-lived event loops used to build vertices. Set to 0 to build vertices on the caller's loop."""
+    vertex_executor_max_concurrency: int = 64
+    """The maximum number of vertices built at the same time across all flows in this process."""
+    vertex_executor_max_concurrency_per_flow: int = 16
+    """The maximum number of vertices of a single flow built at the same time."""
+    graph_max_parallel_vertices: int = 0
+    """The maximum number of vertices a single graph run starts at the same time. Set to 0 for no limit."""
+    run_batch_max_concurrency: int = 4
+    """The maximum number of inputs of a batch sent to the run endpoint that are run at the same time."""
+    run_batch_max_inputs: int = 100
+    """The maximum number of inputs of a batch sent to the run endpoint."""
+    event_token_coalesce_ms: int = 0
+    """Coalesce consecutive token events of a message streamed within this many milliseconds. 0 disables it."""
+    build_events_window: int = 1
+    """The number of build events that may wait to be sent to the client before a flow build pauses scheduling
+    the next vertices."""
+    build_events_detached: bool = False
+    """If set to True, flow builds run at full speed regardless of the client and events are buffered
+    up to `build_events_max_buffer_mb`."""
+    build_events_max_buffer_mb: int = 64
+    """The maximum size in MB of build events buffered for a client before a flow build pauses."""
+
     # Telemetry
     do_not_track: bool = False
     """If set to True, Langflow will not track telemetry."""
@@ -145,6 +205,31 @@ class Settings(BaseSettings):
     """If set to True, Langflow will track transactions between flows."""
     vertex_builds_storage_enabled: bool = True
     """If set to True, Langflow will keep track of each vertex builds (outputs) in the UI for any flow."""
+    log_writer_queue_size: int = 10000
+    """The maximum number of transaction and vertex build logs waiting to be written to the database."""
+    log_writer_batch_size: int = 100
+    """The maximum number of logs written to the database in a single commit."""
+    log_writer_flush_interval: float = 1.0
+    """The maximum time in seconds a log waits in the queue before it is written to the database."""
+    log_writer_overflow_policy: Literal["drop", "block"] = "drop"
+    """What to do with new logs when the queue is full: drop them, or block until there is room."""
+    api_key_cache_ttl: int = 5
+    """How long in seconds a verified API key is trusted without looking it up again. Set to 0 to disable the cache.
+    Deleting a key only clears the cache of the worker handling the request, so other workers keep accepting the
+    key for up to this long."""
+    api_key_cache_size: int = 1024
+    """The maximum number of verified API keys kept in memory."""
+    api_key_usage_flush_interval: float = 10.0
+    """The interval in seconds at which API key usage counts are written to the database."""
+    jwt_user_cache_ttl: int = 5
+    """How long in seconds the user an access token resolved to is reused without loading it again.
+    Set to 0 to disable the cache. Deactivating or demoting a user only clears the cache of the worker handling the
+    request, so other workers keep the previous state of the user for up to this long."""
+    jwt_user_cache_size: int = 1024
+    """The maximum number of access tokens whose users are kept in memory."""
+    variable_cache_ttl: int = 30
+    """How long in seconds the decrypted value of a global variable is reused without loading it again.
+    Set to 0 to disable the cache."""
 
     # Config
     host: str = "127.0.0.1"
@@ -189,6 +274,15 @@ class Settings(BaseSettings):
         logger.debug(f"Setting user agent to {value}")
         return value
 
+    @field_validator("redis_cache_compression", mode="after")
+    @classmethod
+    def check_redis_cache_compression(cls, value):
+        package = {"zstd": "zstandard", "lz4": "lz4"}.get(value) if value else None
+        if package and importlib.util.find_spec(package) is None:
+            msg = f"redis_cache_compression is set to {value}, but the {package} package is not installed"
+            raise ValueError(msg)
+        return value
+
     @field_validator("variables_to_get_from_environment", mode="before")
     @classmethod
     def set_variables_to_get_from_environment(cls, value):
@@ -12,4 +12,7 @@ class SharedComponentCacheServiceFactory(ServiceFactory):
         super().__init__(SharedComponentCacheService)
 
     def create(self, settings_service: "SettingsService"):
-        return SharedComponentCacheService(expiration_time=settings_service.settings.cache_expire)
+        return SharedComponentCacheService(
+            expiration_time=settings_service.settings.cache_expire,
+            sweep_interval=settings_service.settings.cache_sweep_interval or None,
+        )
@@ -1,9 +1,12 @@
 import asyncio
+import hashlib
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator
 from pathlib import Path
 
 from loguru import logger
 
-from .service import StorageService
+from .service import CHUNK_SIZE, StorageService, StoredFile
 
 
 class LocalStorageService(StorageService):
@@ -43,6 +46,83 @@ class LocalStorageService(StorageService):
             logger.exception(f"Error saving file {file_name} in flow {flow_id}")
             raise
 
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> StoredFile:
+        """Save a file in the local storage from chunks of bytes.
+
+        The chunks are hashed as they are written to a temporary file, which replaces
+        the file once it's complete.
+
+        :param flow_id: The identifier for the flow.
+        :param file_name: The name of the file to be saved.
+        :param chunks: The byte content of the file.
+        :return: The size and SHA-256 hash of the file.
+        """
+        folder_path = self.data_dir / flow_id
+        folder_path.mkdir(parents=True, exist_ok=True)
+        file_path = folder_path / file_name
+        temp_path = folder_path / f".{file_name}.{uuid.uuid4().hex}.tmp"
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            file = await asyncio.to_thread(temp_path.open, "wb")
+            try:
+                async for chunk in chunks:
+                    digest.update(chunk)
+                    size += len(chunk)
+                    await asyncio.to_thread(file.write, chunk)
+            finally:
+                await asyncio.to_thread(file.close)
+            await asyncio.to_thread(temp_path.replace, file_path)
+        except Exception:
+            logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            temp_path.unlink(missing_ok=True)
+            raise
+        logger.info(f"File {file_name} saved successfully in flow {flow_id}.")
+        return StoredFile(size, digest.hexdigest())
+
+    def _existing_file_path(self, flow_id: str, file_name: str) -> Path:
+        file_path = self.data_dir / flow_id / file_name
+        if not file_path.is_file():
+            logger.warning(f"File {file_name} not found in flow {flow_id}.")
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+        return file_path
+
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
+        """Return the size in bytes of a file of the local storage.
+
+        :raises FileNotFoundError: If the file does not exist.
+        """
+        return self._existing_file_path(flow_id, file_name).stat().st_size
+
+    async def get_file_stream(
+        self, flow_id: str, file_name: str, start: int = 0, length: int | None = None, chunk_size: int = CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Read a file from the local storage in chunks.
+
+        :param flow_id: The identifier for the flow.
+        :param file_name: The name of the file to be read.
+        :param start: The offset of the first byte to read.
+        :param length: The number of bytes to read. Defaults to reading up to the end of the file.
+        :param chunk_size: The maximum size of the chunks.
+        :raises FileNotFoundError: If the file does not exist.
+        """
+        file_path = self._existing_file_path(flow_id, file_name)
+        file = await asyncio.to_thread(file_path.open, "rb")
+        try:
+            await asyncio.to_thread(file.seek, start)
+            remaining = length
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk = await asyncio.to_thread(file.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            await asyncio.to_thread(file.close)
+
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         """Retrieve a file from the local storage.
 
@@ -1,8 +1,15 @@
+import asyncio
+import hashlib
+from collections.abc import AsyncIterable, AsyncIterator
+
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from loguru import logger
 
-from .service import StorageService
+from .service import CHUNK_SIZE, StorageService, StoredFile
+
+# S3 requires the parts of a multipart upload, except the last one, to be at least 5 MiB
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
 
 
 class S3StorageService(StorageService):
@@ -15,69 +22,179 @@ class S3StorageService(StorageService):
         self.s3_client = boto3.client("s3")
         self.set_ready()
 
-    async def save_file(self, folder: str, file_name: str, data) -> None:
+    async def save_file(self, flow_id: str, file_name: str, data) -> None:
         """Save a file to the S3 bucket.
 
-        :param folder: The folder in the bucket to save the file.
+        :param flow_id: The identifier for the flow, used as the folder of its files in the bucket.
         :param file_name: The name of the file to be saved.
         :param data: The byte content of the file.
         :raises Exception: If an error occurs during file saving.
         """
         try:
-            self.s3_client.put_object(Bucket=self.bucket, Key=f"{folder}/{file_name}", Body=data)
-            logger.info(f"File {file_name} saved successfully in folder {folder}.")
+            self.s3_client.put_object(Bucket=self.bucket, Key=f"{flow_id}/{file_name}", Body=data)
+            logger.info(f"File {file_name} saved successfully in flow {flow_id}.")
         except NoCredentialsError:
             logger.exception("Credentials not available for AWS S3.")
             raise
         except ClientError:
-            logger.exception(f"Error saving file {file_name} in folder {folder}")
+            logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            raise
+
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> StoredFile:
+        """Save a file to the S3 bucket from chunks of bytes.
+
+        Files larger than a part are sent with a multipart upload, so only one part is kept in memory.
+
+        :param flow_id: The identifier for the flow, used as the folder of its files in the bucket.
+        :param file_name: The name of the file to be saved.
+        :param chunks: The byte content of the file.
+        :return: The size and SHA-256 hash of the file.
+        :raises Exception: If an error occurs during file saving.
+        """
+        key = f"{flow_id}/{file_name}"
+        digest = hashlib.sha256()
+        size = 0
+        buffer = bytearray()
+        upload_id = None
+        parts: list[dict] = []
+        try:
+            async for chunk in chunks:
+                digest.update(chunk)
+                size += len(chunk)
+                buffer.extend(chunk)
+                if len(buffer) < MULTIPART_PART_SIZE:
+                    continue
+                if upload_id is None:
+                    upload = await asyncio.to_thread(
+                        self.s3_client.create_multipart_upload, Bucket=self.bucket, Key=key
+                    )
+                    upload_id = upload["UploadId"]
+                parts.append(await self._upload_part(key, upload_id, len(parts) + 1, bytes(buffer)))
+                buffer.clear()
+
+            if upload_id is None:
+                await asyncio.to_thread(self.s3_client.put_object, Bucket=self.bucket, Key=key, Body=bytes(buffer))
+            else:
+                if buffer:
+                    parts.append(await self._upload_part(key, upload_id, len(parts) + 1, bytes(buffer)))
+                await asyncio.to_thread(
+                    self.s3_client.complete_multipart_upload,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except Exception:
+            logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            if upload_id is not None:
+                await asyncio.to_thread(
+                    self.s3_client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id
+                )
+            raise
+        logger.info(f"File {file_name} saved successfully in flow {flow_id}.")
+        return StoredFile(size, digest.hexdigest())
+
+    async def _upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> dict:
+        response = await asyncio.to_thread(
+            self.s3_client.upload_part,
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
+        """Return the size in bytes of a file of the S3 bucket.
+
+        :raises Exception: If an error occurs while reading the metadata of the file.
+        """
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=self.bucket, Key=f"{flow_id}/{file_name}"
+            )
+        except ClientError:
+            logger.exception(f"Error retrieving file {file_name} from flow {flow_id}")
             raise
+        return response["ContentLength"]
+
+    async def get_file_stream(
+        self, flow_id: str, file_name: str, start: int = 0, length: int | None = None, chunk_size: int = CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Read a file from the S3 bucket in chunks.
+
+        :param flow_id: The identifier for the flow, used as the folder of its files in the bucket.
+        :param file_name: The name of the file to be read.
+        :param start: The offset of the first byte to read.
+        :param length: The number of bytes to read. Defaults to reading up to the end of the file.
+        :param chunk_size: The maximum size of the chunks.
+        :raises Exception: If an error occurs during file retrieval.
+        """
+        if length == 0:
+            return
+        request = {"Bucket": self.bucket, "Key": f"{flow_id}/{file_name}"}
+        if length is not None:
+            request["Range"] = f"bytes={start}-{start + length - 1}"
+        elif start:
+            request["Range"] = f"bytes={start}-"
+        try:
+            response = await asyncio.to_thread(self.s3_client.get_object, **request)
+        except ClientError:
+            logger.exception(f"Error retrieving file {file_name} from flow {flow_id}")
+            raise
+        body = response["Body"]
+        try:
+            while chunk := await asyncio.to_thread(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
 
-    async def get_file(self, folder: str, file_name: str):
+    async def get_file(self, flow_id: str, file_name: str):
         """Retrieve a file from the S3 bucket.
 
-        :param folder: The folder in the bucket where the file is stored.
+        :param flow_id: The identifier for the flow, used as the folder of its files in the bucket.
         :param file_name: The name of the file to be retrieved.
         :return: The byte content of the file.
         :raises Exception: If an error occurs during file retrieval.
         """
         try:
-            response = self.s3_client.get_object(Bucket=self.bucket, Key=f"{folder}/{file_name}")
-            logger.info(f"File {file_name} retrieved successfully from folder {folder}.")
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=f"{flow_id}/{file_name}")
+            logger.info(f"File {file_name} retrieved successfully from flow {flow_id}.")
             return response["Body"].read()
         except ClientError:
-            logger.exception(f"Error retrieving file {file_name} from folder {folder}")
+            logger.exception(f"Error retrieving file {file_name} from flow {flow_id}")
             raise
 
-    async def list_files(self, folder: str):
-        """List all files in a specified folder of the S3 bucket.
+    async def list_files(self, flow_id: str):
+        """List all files of a flow in the S3 bucket.
 
-        :param folder: The folder in the bucket to list files from.
+        :param flow_id: The identifier for the flow, used as the folder of its files in the bucket.
         :return: A list of file names.
         :raises Exception: If an error occurs during file listing.
         """
         try:
-            response = self.s3_client.list_objects_v2(Bucket=self.bucket, Prefix=folder)
+            response = self.s3_client.list_objects_v2(Bucket=self.bucket, Prefix=flow_id)
         except ClientError:
-            logger.exception(f"Error listing files in folder {folder}")
+            logger.exception(f"Error listing files in flow {flow_id}")
             raise
 
-        files = [item["Key"] for item in response.get("Contents", []) if "/" not in item["Key"][len(folder) :]]
-        logger.info(f"{len(files)} files listed in folder {folder}.")
+        files = [item["Key"] for item in response.get("Contents", []) if "/" not in item["Key"][len(flow_id) :]]
+        logger.info(f"{len(files)} files listed in flow {flow_id}.")
         return files
 
-    async def delete_file(self, folder: str, file_name: str) -> None:
+    async def delete_file(self, flow_id: str, file_name: str) -> None:
         """Delete a file from the S3 bucket.
 
-        :param folder: The folder in the bucket where the file is stored.
+        :param flow_id: The identifier for the flow, used as the folder of its files in the bucket.
         :param file_name: The name of the file to be deleted.
         :raises Exception: If an error occurs during file deletion.
         """
         try:
-            self.s3_client.delete_object(Bucket=self.bucket, Key=f"{folder}/{file_name}")
-            logger.info(f"File {file_name} deleted successfully from folder {folder}.")
+            self.s3_client.delete_object(Bucket=self.bucket, Key=f"{flow_id}/{file_name}")
+            logger.info(f"File {file_name} deleted successfully from flow {flow_id}.")
         except ClientError:
-            logger.exception(f"Error deleting file {file_name} from folder {folder}")
+            logger.exception(f"Error deleting file {file_name} from flow {flow_id}")
             raise
 
     async def teardown(self) -> None:
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+import hashlib
 from abc import abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from langflow.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
 
+CHUNK_SIZE = 1024 * 1024
+
+
+class StoredFile(NamedTuple):
+    size: int
+    sha256: str
+
 
 class StorageService(Service):
     name = "storage_service"
@@ -32,6 +42,36 @@ class StorageService(Service):
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         raise NotImplementedError
 
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> StoredFile:
+        """Save a file from chunks of bytes, returning its size and SHA-256 hash.
+
+        Storages that can write a file in parts should override this, as this default
+        keeps the whole file in memory.
+        """
+        digest = hashlib.sha256()
+        data = bytearray()
+        async for chunk in chunks:
+            digest.update(chunk)
+            data.extend(chunk)
+        await self.save_file(flow_id, file_name, bytes(data))
+        return StoredFile(len(data), digest.hexdigest())
+
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
+        return len(await self.get_file(flow_id, file_name))
+
+    async def get_file_stream(
+        self, flow_id: str, file_name: str, start: int = 0, length: int | None = None, chunk_size: int = CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Read `length` bytes of a file from `start`, or up to its end, in chunks of `chunk_size` bytes.
+
+        Storages that can read a part of a file should override this, as this default
+        reads the whole file in memory.
+        """
+        content = await self.get_file(flow_id, file_name)
+        end = len(content) if length is None else min(start + length, len(content))
+        for offset in range(start, end, chunk_size):
+            yield content[offset : min(offset + chunk_size, end)]
+
     @abstractmethod
     async def list_files(self, flow_id: str) -> list[str]:
         raise NotImplementedError
@@ -13,3 +13,10 @@ class TaskBackend(ABC):
     @abstractmethod
     def get_task(self, task_id: str) -> Any:
         pass
+
+    async def start(self) -> None:
+        """Starts running queued tasks, for backends that run them in this process."""
+        return
+
+    async def teardown(self) -> None:
+        return
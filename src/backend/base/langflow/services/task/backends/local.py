@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib
+import inspect
+import os
+import pickle
+import socket
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from loguru import logger
+
+from langflow.services.task.backends.base import TaskBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PENDING = "PENDING"
+STARTED = "STARTED"
+SUCCESS = "SUCCESS"
+FAILURE = "FAILURE"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS task (
+    id TEXT PRIMARY KEY,
+    func TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result BLOB,
+    traceback TEXT,
+    owner TEXT,
+    run_after REAL NOT NULL,
+    lease_expires_at REAL,
+    created_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS ix_task_status_run_after ON task (status, run_after);
+CREATE INDEX IF NOT EXISTS ix_task_finished_at ON task (finished_at);
+"""
+
+
+class _Job(NamedTuple):
+    id: str
+    func: str
+    payload: bytes
+    attempts: int
+
+
+def _task_path(task_func: Callable[..., Any]) -> str:
+    qualname = getattr(task_func, "__qualname__", "")
+    module = getattr(task_func, "__module__", None)
+    if not module or not qualname or "<" in qualname:
+        msg = f"Task function {task_func} must be defined at the top level of a module"
+        raise ValueError(msg)
+    return f"{module}:{qualname}"
+
+
+def _import_task(path: str) -> Callable[..., Any]:
+    module_name, qualname = path.split(":", 1)
+    obj: Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _dumps(value: Any) -> bytes:
+    try:
+        return pickle.dumps(value)
+    except Exception:  # noqa: BLE001
+        logger.opt(exception=True).debug("Task value can't be pickled, storing its representation")
+        if isinstance(value, BaseException):
+            return pickle.dumps(RuntimeError(repr(value)))
+        return pickle.dumps(repr(value))
+
+
+class LocalTaskResult:
+    """Snapshot of a task of the local queue, with the interface of Celery's AsyncResult."""
+
+    def __init__(self, task_id: str, status: str, result: bytes | None = None, traceback: str | None = None) -> None:
+        self.id = task_id
+        self._status = status
+        self._result = result
+        self._traceback = traceback
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @property
+    def traceback(self) -> str:
+        return self._traceback or ""
+
+    @property
+    def result(self) -> Any:
+        if self._result is None:
+            return None
+        # The queue database is only written by this backend
+        return pickle.loads(self._result)  # noqa: S301
+
+    def ready(self) -> bool:
+        return self._status in {SUCCESS, FAILURE}
+
+
+class LocalQueueBackend(TaskBackend):
+    """Runs tasks from a durable queue kept in a local SQLite database.
+
+    Tasks are stored with their arguments before they run, so tasks that were pending, or running
+    in a process that stopped, are picked up again once the queue starts. Up to `workers` tasks run
+    at the same time on the event loop of the process that started the queue. Failed tasks are
+    retried `max_retries` times with an exponential backoff, and finished tasks are kept for
+    `result_ttl` seconds so their status can be queried.
+
+    Several processes can share the same database: a running task holds a lease that its process
+    renews, and tasks whose lease expired are claimed again by any process.
+    """
+
+    name = "local"
+
+    lease_seconds = 30.0
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        workers: int = 4,
+        max_retries: int = 0,
+        retry_delay: float = 1.0,
+        result_ttl: float = 3600,
+        poll_interval: float = 1.0,
+    ) -> None:
+        self.path = Path(path)
+        self.workers = max(workers, 1)
+        self.max_retries = max(max_retries, 0)
+        self.retry_delay = retry_delay
+        self.result_ttl = result_ttl
+        self.poll_interval = poll_interval
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._connection = self._connect()
+        self._wakeup: asyncio.Queue[None] | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def _execute(self, sql: str, parameters: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    @property
+    def started(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """Starts the workers that run the queued tasks on the running event loop."""
+        if self.started:
+            return
+        self._wakeup = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._work(self._wakeup)) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._maintain()))
+        logger.debug(f"Local task queue started with {self.workers} workers at {self.path}")
+
+    async def teardown(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Give the tasks that were interrupted back to the queue
+        await asyncio.to_thread(
+            self._execute,
+            "UPDATE task SET status = ?, owner = NULL, lease_expires_at = NULL, attempts = attempts - 1 "
+            "WHERE status = ? AND owner = ?",
+            (PENDING, STARTED, self.owner),
+        )
+        with self._lock:
+            self._connection.close()
+
+    async def launch_task(
+        self, task_func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> tuple[str, LocalTaskResult]:
+        """Queue a task to run in the background.
+
+        Parameters:
+            task_func: A function defined at the top level of a module. Coroutine functions are awaited.
+            *args: Positional arguments to pass to task_func. They must be picklable.
+            **kwargs: Keyword arguments to pass to task_func. They must be picklable.
+
+        Returns:
+            A tuple containing the task ID and the task result object.
+        """
+        func = _task_path(task_func)
+        payload = pickle.dumps((args, kwargs))
+        task_id = str(uuid.uuid4())
+        now = time.time()
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT INTO task (id, func, payload, status, run_after, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (task_id, func, payload, PENDING, now, now),
+        )
+        await self.start()
+        if self._wakeup is not None:
+            self._wakeup.put_nowait(None)
+        logger.info(f"Task {task_id} queued.")
+        return task_id, LocalTaskResult(task_id, PENDING)
+
+    def get_task(self, task_id: str) -> LocalTaskResult | None:
+        rows = self._execute("SELECT status, result, traceback FROM task WHERE id = ?", (task_id,))
+        if not rows:
+            return None
+        return LocalTaskResult(task_id, *rows[0])
+
+    def _claim(self) -> _Job | None:
+        now = time.time()
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT id, func, payload, attempts FROM task "
+                    "WHERE (status = ? AND run_after <= ?) OR (status = ? AND lease_expires_at < ?) "
+                    "ORDER BY run_after LIMIT 1",
+                    (PENDING, now, STARTED, now),
+                ).fetchone()
+                if row is not None:
+                    connection.execute(
+                        "UPDATE task SET status = ?, owner = ?, lease_expires_at = ?, attempts = attempts + 1 "
+                        "WHERE id = ?",
+                        (STARTED, self.owner, now + self.lease_seconds, row[0]),
+                    )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        job = _Job(*row)
+        return job._replace(attempts=job.attempts + 1)
+
+    async def _work(self, wakeup: asyncio.Queue[None]) -> None:
+        while True:
+            try:
+                job = await asyncio.to_thread(self._claim)
+            except sqlite3.Error:
+                logger.exception("Error claiming a task from the local task queue")
+                job = None
+            if job is None:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(wakeup.get(), self.poll_interval)
+                continue
+            await self._run_job(job)
+
+    async def _run_job(self, job: _Job) -> None:
+        try:
+            task_func = _import_task(job.func)
+            args, kwargs = pickle.loads(job.payload)  # noqa: S301
+            if inspect.iscoroutinefunction(task_func):
+                result = await task_func(*args, **kwargs)
+            else:
+                result = await asyncio.to_thread(task_func, *args, **kwargs)
+        except Exception as exc:  # noqa: BLE001
+            error_traceback = traceback.format_exc()
+            if job.attempts <= self.max_retries:
+                delay = self.retry_delay * 2 ** (job.attempts - 1)
+                logger.warning(f"Task {job.id} failed, retrying in {delay}s: {exc}")
+                await asyncio.to_thread(
+                    self._execute,
+                    "UPDATE task SET status = ?, owner = NULL, lease_expires_at = NULL, run_after = ?, traceback = ? "
+                    "WHERE id = ? AND owner = ?",
+                    (PENDING, time.time() + delay, error_traceback, job.id, self.owner),
+                )
+                return
+            logger.error(f"Task {job.id} failed: {exc}")
+            await self._finish(job, FAILURE, _dumps(exc), error_traceback)
+        else:
+            await self._finish(job, SUCCESS, _dumps(result), None)
+
+    async def _finish(self, job: _Job, status: str, result: bytes, error_traceback: str | None) -> None:
+        await asyncio.to_thread(
+            self._execute,
+            "UPDATE task SET status = ?, result = ?, traceback = ?, payload = ?, owner = NULL, "
+            "lease_expires_at = NULL, finished_at = ? WHERE id = ? AND owner = ?",
+            (status, result, error_traceback, b"", time.time(), job.id, self.owner),
+        )
+
+    async def _maintain(self) -> None:
+        """Renews the leases of the running tasks and removes the expired results."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            now = time.time()
+            try:
+                await asyncio.to_thread(
+                    self._execute,
+                    "UPDATE task SET lease_expires_at = ? WHERE status = ? AND owner = ?",
+                    (now + self.lease_seconds, STARTED, self.owner),
+                )
+                await asyncio.to_thread(
+                    self._execute,
+                    "DELETE FROM task WHERE status IN (?, ?) AND finished_at < ?",
+                    (SUCCESS, FAILURE, now - self.result_ttl),
+                )
+            except sqlite3.Error:
+                logger.exception("Error maintaining the local task queue")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable, Coroutine
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
@@ -54,9 +56,33 @@ class TaskService(Service):
 
             logger.debug("Using Celery backend")
             return CeleryBackend()
+        settings = self.settings_service.settings
+        if settings.task_backend == "local":
+            from langflow.services.task.backends.local import LocalQueueBackend
+
+            queue_path: str | Path | None = settings.task_queue_path
+            if not queue_path:
+                if not settings.config_dir:
+                    msg = "The local task backend needs task_queue_path or config_dir to be set"
+                    raise ValueError(msg)
+                queue_path = Path(settings.config_dir) / "task_queue.db"
+            logger.debug("Using local queue backend")
+            return LocalQueueBackend(
+                queue_path,
+                workers=settings.task_queue_workers,
+                max_retries=settings.task_max_retries,
+                result_ttl=settings.task_result_ttl,
+            )
         logger.debug("Using AnyIO backend")
         return AnyIOBackend()
 
+    async def start(self) -> None:
+        """Starts running the tasks queued by the backend, including those left from a previous run."""
+        await self.backend.start()
+
+    async def teardown(self) -> None:
+        await self.backend.teardown()
+
     # In your TaskService class
     async def launch_and_await_task(
         self,
@@ -85,3 +111,7 @@ class TaskService(Service):
 
     def get_task(self, task_id: str) -> Any:
         return self.backend.get_task(task_id)
+
+    async def aget_task(self, task_id: str) -> Any:
+        """Looks up a task on a thread, since backends can query a database to find it."""
+        return await asyncio.to_thread(self.backend.get_task, task_id)
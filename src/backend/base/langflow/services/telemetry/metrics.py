@@ -0,0 +1,65 @@
+"""Helpers to record Langflow's OpenTelemetry metrics.
+
+The metrics are registered in `OpenTelemetry._register_metric` and exported through the Prometheus
+reader when `prometheus_enabled` is set. Recording a metric never raises: an error is logged at the
+debug level and the measurement is dropped, so instrumented code paths behave the same either way.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+_open_telemetry: OpenTelemetry | None = None
+
+
+def _get_open_telemetry() -> OpenTelemetry:
+    global _open_telemetry  # noqa: PLW0603
+    if _open_telemetry is None:
+        from langflow.services.deps import get_telemetry_service
+
+        _open_telemetry = get_telemetry_service().ot
+    return _open_telemetry
+
+
+def observe(metric_name: str, value: float, labels: Mapping[str, str]) -> None:
+    """Records a value of a histogram."""
+    try:
+        _get_open_telemetry().observe_histogram(metric_name, value, labels)
+    except Exception:  # noqa: BLE001
+        logger.opt(exception=True).debug(f"Error recording metric {metric_name}")
+
+
+def increment(metric_name: str, labels: Mapping[str, str], value: float = 1.0) -> None:
+    """Adds `value` to a counter."""
+    try:
+        _get_open_telemetry().increment_counter(metric_name, labels, value)
+    except Exception:  # noqa: BLE001
+        logger.opt(exception=True).debug(f"Error recording metric {metric_name}")
+
+
+def set_gauge(metric_name: str, value: float, labels: Mapping[str, str]) -> None:
+    """Sets the current value of a gauge."""
+    try:
+        _get_open_telemetry().update_gauge(metric_name, value, labels)
+    except Exception:  # noqa: BLE001
+        logger.opt(exception=True).debug(f"Error recording metric {metric_name}")
+
+
+def remove_gauge(metric_name: str, labels: Mapping[str, str]) -> None:
+    """Stops reporting the value of a gauge for `labels`."""
+    try:
+        _get_open_telemetry().remove_gauge(metric_name, labels)
+    except Exception:  # noqa: BLE001
+        logger.opt(exception=True).debug(f"Error removing metric {metric_name}")
+
+
+def record_cache_request(cache: str, *, hit: bool) -> None:
+    """Counts a cache lookup as a hit or a miss."""
+    increment("cache_requests", {"cache": cache, "result": "hit" if hit else "miss"})
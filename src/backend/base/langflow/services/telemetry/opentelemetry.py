@@ -58,6 +58,9 @@ class ObservableGaugeWrapper:
     def set_value(self, value: float, labels: Mapping[str, str]) -> None:
         self._values[tuple(sorted(labels.items()))] = value
 
+    def remove_value(self, labels: Mapping[str, str]) -> None:
+        self._values.pop(tuple(sorted(labels.items())), None)
+
 
 class Metric:
     def __init__(
@@ -139,6 +142,62 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             metric_type=MetricType.COUNTER,
             labels={"flow_id": mandatory_label},
         )
+        self._add_metric(
+            name="graph_build_duration",
+            description="The time it takes to build all the vertices of a graph",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"flow_id": mandatory_label, "source": mandatory_label, "status": optional_label},
+        )
+        self._add_metric(
+            name="component_build_duration",
+            description="The time it takes to build a component",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"flow_id": mandatory_label, "component_type": mandatory_label, "status": optional_label},
+        )
+        self._add_metric(
+            name="component_queue_wait",
+            description="The time a component waits from being ready to build until its build starts",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"flow_id": mandatory_label, "component_type": mandatory_label},
+        )
+        self._add_metric(
+            name="cache_requests",
+            description="The number of cache lookups, by result",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"cache": mandatory_label, "result": mandatory_label},
+        )
+        self._add_metric(
+            name="event_queue_backlog",
+            description="The number of build events waiting to be sent to the client",
+            unit="",
+            metric_type=MetricType.OBSERVABLE_GAUGE,
+            labels={"flow_id": mandatory_label},
+        )
+        self._add_metric(
+            name="event_queue_wait",
+            description="The time a build event waits before it's sent to the client",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"flow_id": mandatory_label},
+        )
+        self._add_metric(
+            name="log_writer_backlog",
+            description="The number of log rows waiting to be written to the database",
+            unit="",
+            metric_type=MetricType.OBSERVABLE_GAUGE,
+            labels={"service": mandatory_label},
+        )
+        self._add_metric(
+            name="log_writer_lag",
+            description="The time from queueing a log row to writing it to the database",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"table": mandatory_label},
+        )
 
     def __init__(self, *, prometheus_enabled: bool = True):
         if not self._metrics_registry:
@@ -232,6 +291,16 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             msg = f"Metric '{metric_name}' is not a gauge"
             raise TypeError(msg)
 
+    def remove_gauge(self, metric_name: str, labels: Mapping[str, str]) -> None:
+        """Stops reporting the value of a gauge for `labels`, e.g. once what it measures is gone."""
+        self.validate_labels(metric_name, labels)
+        gauge = self._metrics.get(metric_name)
+        if isinstance(gauge, ObservableGaugeWrapper):
+            gauge.remove_value(labels)
+        else:
+            msg = f"Metric '{metric_name}' is not a gauge"
+            raise TypeError(msg)
+
     def observe_histogram(self, metric_name: str, value: float, labels: Mapping[str, str]) -> None:
         self.validate_labels(metric_name, labels)
         histogram = self._metrics.get(metric_name)
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import os
-from collections import defaultdict
+import queue
+import threading
+from collections import OrderedDict, defaultdict
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
@@ -40,118 +44,217 @@ def _get_langfuse_tracer():
     return LangFuseTracer
 
 
+@dataclass
+class TraceContext:
+    """The trace state of a single graph run."""
+
+    run_id: UUID | str
+    run_name: str | None = None
+    project_name: str | None = None
+    tracers: dict[str, BaseTracer] = field(default_factory=dict)
+    inputs: dict[str, dict] = field(default_factory=lambda: defaultdict(dict))
+    inputs_metadata: dict[str, dict] = field(default_factory=lambda: defaultdict(dict))
+    outputs: dict[str, dict] = field(default_factory=lambda: defaultdict(dict))
+    outputs_metadata: dict[str, dict] = field(default_factory=lambda: defaultdict(dict))
+    logs: dict[str, list[Log | dict[Any, Any]]] = field(default_factory=lambda: defaultdict(list))
+
+
+trace_context_var: ContextVar[TraceContext | None] = ContextVar("trace_context", default=None)
+
+
 class TracingService(Service):
+    """Traces graph runs with the configured tracers.
+
+    The trace state of each run lives in its own `TraceContext`, registered by run ID and set as the
+    current context while the run's components are traced, so concurrent runs don't share inputs,
+    outputs or tracers. Traces end on whichever thread or event loop built the component, so finished
+    traces go through a thread-safe queue and are exported in batches by a single export thread.
+    """
+
     name = "tracing_service"
 
+    max_runs = 1024
+    """The maximum number of unfinished runs kept. The oldest are dropped first."""
+    export_batch_size = 100
+
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
-        self.inputs: dict[str, dict] = defaultdict(dict)
-        self.inputs_metadata: dict[str, dict] = defaultdict(dict)
-        self.outputs: dict[str, dict] = defaultdict(dict)
-        self.outputs_metadata: dict[str, dict] = defaultdict(dict)
-        self.run_name: str | None = None
-        self.run_id: UUID | None = None
-        self.project_name: str | None = None
-        self._tracers: dict[str, BaseTracer] = {}
-        self._logs: dict[str, list[Log | dict[Any, Any]]] = defaultdict(list)
-        self.logs_queue: asyncio.Queue = asyncio.Queue()
-        self.running = False
-        self.worker_task: asyncio.Task | None = None
-        self.end_trace_tasks: set[asyncio.Task] = set()
-
-    async def log_worker(self) -> None:
-        while self.running or not self.logs_queue.empty():
-            log_func, args = await self.logs_queue.get()
-            try:
-                await log_func(*args)
-            except Exception:  # noqa: BLE001
-                logger.exception("Error processing log")
-            finally:
-                self.logs_queue.task_done()
+        self._contexts: OrderedDict[str, TraceContext] = OrderedDict()
+        self._contexts_lock = threading.Lock()
+        self.logs_queue: queue.Queue[tuple[Any, tuple] | threading.Event | None] = queue.Queue()
+        self._worker_lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    def _get_context(self, run_id: UUID | str | None = None) -> TraceContext | None:
+        if run_id is None:
+            return trace_context_var.get()
+        with self._contexts_lock:
+            return self._contexts.get(str(run_id))
+
+    @property
+    def run_id(self) -> UUID | str | None:
+        context = self._get_context()
+        return context.run_id if context else None
+
+    @property
+    def run_name(self) -> str | None:
+        context = self._get_context()
+        return context.run_name if context else None
+
+    @property
+    def project_name(self) -> str | None:
+        context = self._get_context()
+        return context.project_name if context else None
+
+    def log_worker(self) -> None:
+        """Exports the queued traces in batches, until it gets None.
+
+        Flush markers are set once the traces queued before them are exported.
+        """
+        while True:
+            batch = [self.logs_queue.get()]
+            while len(batch) < self.export_batch_size:
+                try:
+                    batch.append(self.logs_queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            for item in batch:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    item.set()
+                else:
+                    self._export(*item)
+            if stop:
+                return
+
+    @staticmethod
+    def _export(log_func, args: tuple) -> None:
+        try:
+            log_func(*args)
+        except Exception:  # noqa: BLE001
+            logger.exception("Error processing log")
+
+    def _ensure_worker(self) -> None:
+        with self._worker_lock:
+            if not self.running:
+                self._worker = threading.Thread(target=self.log_worker, name="langflow-trace-export", daemon=True)
+                self._worker.start()
 
     async def start(self) -> None:
-        if self.running:
-            return
         try:
-            self.running = True
-            self.worker_task = asyncio.create_task(self.log_worker())
+            self._ensure_worker()
         except Exception:  # noqa: BLE001
             logger.exception("Error starting tracing service")
 
+    def _enqueue(self, log_func, *args) -> None:
+        self._ensure_worker()
+        self.logs_queue.put((log_func, args))
+
     async def flush(self) -> None:
+        """Waits until the traces queued so far are exported."""
+        if not self.running:
+            return
+        marker = threading.Event()
+        self.logs_queue.put(marker)
         try:
-            await self.logs_queue.join()
+            await asyncio.to_thread(marker.wait)
         except Exception:  # noqa: BLE001
             logger.exception("Error flushing logs")
 
     async def stop(self) -> None:
         try:
-            self.running = False
-            await self.flush()
-            # check the qeue is empty
-            if not self.logs_queue.empty():
-                await self.logs_queue.join()
-            if self.worker_task:
-                self.worker_task.cancel()
-                self.worker_task = None
-
+            with self._worker_lock:
+                worker = self._worker
+                if worker is None or not worker.is_alive():
+                    return
+                # The worker exports everything queued before it stops
+                self.logs_queue.put(None)
+            await asyncio.to_thread(worker.join)
         except Exception:  # noqa: BLE001
             logger.exception("Error stopping tracing service")
 
-    def _reset_io(self) -> None:
-        self.inputs = defaultdict(dict)
-        self.inputs_metadata = defaultdict(dict)
-        self.outputs = defaultdict(dict)
-        self.outputs_metadata = defaultdict(dict)
+    async def teardown(self) -> None:
+        await self.stop()
 
-    async def initialize_tracers(self) -> None:
+    async def initialize_tracers(self, run_id: UUID | str | None = None) -> None:
+        context = self._get_context(run_id)
+        if context is None:
+            return
         try:
             await self.start()
-            self._initialize_langsmith_tracer()
-            self._initialize_langwatch_tracer()
-            self._initialize_langfuse_tracer()
+            self._initialize_langsmith_tracer(context)
+            self._initialize_langwatch_tracer(context)
+            self._initialize_langfuse_tracer(context)
         except Exception:  # noqa: BLE001
             logger.opt(exception=True).debug("Error initializing tracers")
 
-    def _initialize_langsmith_tracer(self) -> None:
+    def _initialize_langsmith_tracer(self, context: TraceContext) -> None:
         project_name = os.getenv("LANGCHAIN_PROJECT", "Langflow")
-        self.project_name = project_name
+        context.project_name = project_name
         langsmith_tracer = _get_langsmith_tracer()
-        self._tracers["langsmith"] = langsmith_tracer(
-            trace_name=self.run_name,
+        context.tracers["langsmith"] = langsmith_tracer(
+            trace_name=context.run_name,
             trace_type="chain",
-            project_name=self.project_name,
-            trace_id=self.run_id,
+            project_name=context.project_name,
+            trace_id=context.run_id,
         )
 
-    def _initialize_langwatch_tracer(self) -> None:
-        if "langwatch" not in self._tracers or self._tracers["langwatch"].trace_id != self.run_id:
+    def _initialize_langwatch_tracer(self, context: TraceContext) -> None:
+        if "langwatch" not in context.tracers or context.tracers["langwatch"].trace_id != context.run_id:
             langwatch_tracer = _get_langwatch_tracer()
-            self._tracers["langwatch"] = langwatch_tracer(
-                trace_name=self.run_name,
+            context.tracers["langwatch"] = langwatch_tracer(
+                trace_name=context.run_name,
                 trace_type="chain",
-                project_name=self.project_name,
-                trace_id=self.run_id,
+                project_name=context.project_name,
+                trace_id=context.run_id,
             )
 
-    def _initialize_langfuse_tracer(self) -> None:
-        self.project_name = os.getenv("LANGCHAIN_PROJECT", "Langflow")
+    def _initialize_langfuse_tracer(self, context: TraceContext) -> None:
+        context.project_name = os.getenv("LANGCHAIN_PROJECT", "Langflow")
         langfuse_tracer = _get_langfuse_tracer()
-        self._tracers["langfuse"] = langfuse_tracer(
-            trace_name=self.run_name,
+        context.tracers["langfuse"] = langfuse_tracer(
+            trace_name=context.run_name,
             trace_type="chain",
-            project_name=self.project_name,
-            trace_id=self.run_id,
+            project_name=context.project_name,
+            trace_id=context.run_id,
         )
 
-    def set_run_name(self, name: str) -> None:
-        self.run_name = name
-
-    def set_run_id(self, run_id: UUID) -> None:
-        self.run_id = run_id
+    def set_run_name(self, name: str, run_id: UUID | str | None = None) -> None:
+        context = self._get_context(run_id)
+        if context is not None:
+            context.run_name = name
+
+    def set_run_id(self, run_id: UUID | str) -> None:
+        """Starts the trace context of a run, or resumes it, and makes it the current one."""
+        key = str(run_id)
+        with self._contexts_lock:
+            context = self._contexts.get(key)
+            if context is None:
+                context = TraceContext(run_id=run_id)
+                self._contexts[key] = context
+                while len(self._contexts) > self.max_runs:
+                    self._contexts.popitem(last=False)
+        trace_context_var.set(context)
+
+    def discard_run(self, run_id: UUID | str) -> None:
+        """Forgets the trace context of a run that has nothing to export.
+
+        The tracers are always created, but only those configured to export (e.g. with an API key) are ready.
+        """
+        with self._contexts_lock:
+            context = self._contexts.get(str(run_id))
+            if context is not None and not any(tracer.ready for tracer in context.tracers.values()):
+                del self._contexts[str(run_id)]
 
     def _start_traces(
         self,
+        context: TraceContext,
         trace_id: str,
         trace_name: str,
         trace_type: str,
@@ -160,9 +263,9 @@ class TracingService(Service):
         vertex: Vertex | None = None,
     ) -> None:
         inputs = self._cleanup_inputs(inputs)
-        self.inputs[trace_name] = inputs
-        self.inputs_metadata[trace_name] = metadata or {}
-        for tracer in self._tracers.values():
+        context.inputs[trace_name] = inputs
+        context.inputs_metadata[trace_name] = metadata or {}
+        for tracer in context.tracers.values():
             if not tracer.ready:
                 continue
             try:
@@ -170,35 +273,50 @@ class TracingService(Service):
             except Exception:  # noqa: BLE001
                 logger.exception(f"Error starting trace {trace_name}")
 
-    def _end_traces(self, trace_id: str, trace_name: str, error: Exception | None = None) -> None:
-        for tracer in self._tracers.values():
+    @staticmethod
+    def _end_traces(
+        tracers: list[BaseTracer],
+        trace_id: str,
+        trace_name: str,
+        outputs: dict[str, Any],
+        logs: list[Log | dict[Any, Any]],
+        error: Exception | None = None,
+    ) -> None:
+        for tracer in tracers:
             if tracer.ready:
                 try:
                     tracer.end_trace(
                         trace_id=trace_id,
                         trace_name=trace_name,
-                        outputs=self.outputs[trace_name],
+                        outputs=outputs,
                         error=error,
-                        logs=self._logs[trace_name],
+                        logs=logs,
                     )
                 except Exception:  # noqa: BLE001
                     logger.exception(f"Error ending trace {trace_name}")
 
-    def _end_all_traces(self, outputs: dict, error: Exception | None = None) -> None:
-        for tracer in self._tracers.values():
+    @staticmethod
+    def _end_all_traces(context: TraceContext, outputs: dict, error: Exception | None = None) -> None:
+        for tracer in context.tracers.values():
             if tracer.ready:
                 try:
-                    tracer.end(self.inputs, outputs=self.outputs, error=error, metadata=outputs)
+                    tracer.end(context.inputs, outputs=context.outputs, error=error, metadata=outputs)
                 except Exception:  # noqa: BLE001
                     logger.exception("Error ending all traces")
 
-    async def end(self, outputs: dict, error: Exception | None = None) -> None:
-        await asyncio.to_thread(self._end_all_traces, outputs, error)
-        self._reset_io()
-        await self.stop()
+    async def end(self, outputs: dict, error: Exception | None = None, run_id: UUID | str | None = None) -> None:
+        """Ends the trace of a run. It's exported after the traces of its components."""
+        context = self._get_context(run_id)
+        if context is None:
+            return
+        with self._contexts_lock:
+            self._contexts.pop(str(context.run_id), None)
+        self._enqueue(self._end_all_traces, context, outputs, error)
 
     def add_log(self, trace_name: str, log: Log) -> None:
-        self._logs[trace_name].append(log)
+        context = self._get_context()
+        if context is not None:
+            context.logs[trace_name].append(log)
 
     @asynccontextmanager
     async def trace_context(
@@ -209,10 +327,19 @@ class TracingService(Service):
         metadata: dict[str, Any] | None = None,
     ):
         trace_id = trace_name
+        context = None
         if component._vertex:
             trace_id = component._vertex.id
+            context = self._get_context(component._vertex.graph._run_id)
+        if context is None:
+            context = self._get_context()
+        if context is None:
+            yield self
+            return
+        token = trace_context_var.set(context)
         trace_type = component.trace_type
         self._start_traces(
+            context,
             trace_id,
             trace_name,
             trace_type,
@@ -223,16 +350,23 @@ class TracingService(Service):
         try:
             yield self
         except Exception as e:
-            self._end_and_reset(trace_id, trace_name, e)
+            self._end_trace(context, trace_id, trace_name, e)
             raise
         else:
-            self._end_and_reset(trace_id, trace_name)
-
-    def _end_and_reset(self, trace_id: str, trace_name: str, error: Exception | None = None) -> None:
-        task = asyncio.create_task(asyncio.to_thread(self._end_traces, trace_id, trace_name, error))
-        self.end_trace_tasks.add(task)
-        task.add_done_callback(self.end_trace_tasks.discard)
-        self._reset_io()
+            self._end_trace(context, trace_id, trace_name)
+        finally:
+            trace_context_var.reset(token)
+
+    def _end_trace(self, context: TraceContext, trace_id: str, trace_name: str, error: Exception | None = None) -> None:
+        self._enqueue(
+            self._end_traces,
+            list(context.tracers.values()),
+            trace_id,
+            trace_name,
+            dict(context.outputs[trace_name]),
+            list(context.logs[trace_name]),
+            error,
+        )
 
     def set_outputs(
         self,
@@ -240,8 +374,11 @@ class TracingService(Service):
         outputs: dict[str, Any],
         output_metadata: dict[str, Any] | None = None,
     ) -> None:
-        self.outputs[trace_name] |= outputs or {}
-        self.outputs_metadata[trace_name] |= output_metadata or {}
+        context = self._get_context()
+        if context is None:
+            return
+        context.outputs[trace_name] |= outputs or {}
+        context.outputs_metadata[trace_name] |= output_metadata or {}
 
     def _cleanup_inputs(self, inputs: dict[str, Any]):
         inputs = inputs.copy()
@@ -251,8 +388,11 @@ class TracingService(Service):
         return inputs
 
     def get_langchain_callbacks(self) -> list[BaseCallbackHandler]:
+        context = self._get_context()
+        if context is None:
+            return []
         callbacks = []
-        for tracer in self._tracers.values():
+        for tracer in context.tracers.values():
             if not tracer.ready:  # type: ignore[truthy-function]
                 continue
             langchain_callback = tracer.get_langchain_callback()
@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Iterable
 from uuid import UUID
 
 from sqlmodel import Session
@@ -35,6 +36,28 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    def get_cached_variable(self, user_id: UUID | str, name: str, field: str) -> str | None:  # noqa: ARG002
+        """Get a variable value without loading it, if the service keeps it in memory.
+
+        Args:
+            user_id: The user ID.
+            name: The name of the variable.
+            field: The field of the variable.
+
+        Returns:
+            The value of the variable, or None if it isn't in memory.
+        """
+        return None
+
+    def prefetch_variables(self, user_id: UUID | str, names: Iterable[str], session: Session) -> None:
+        """Load several variables at once so that getting them doesn't load them one by one.
+
+        Args:
+            user_id: The user ID.
+            names: The names of the variables.
+            session: The database session.
+        """
+
     @abc.abstractmethod
     def list_variables(self, user_id: UUID | str, session: Session) -> list[str | None]:
         """List all variables.
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
@@ -14,15 +16,77 @@ from langflow.services.variable.base import VariableService
 from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
     from uuid import UUID
 
     from langflow.services.settings.service import SettingsService
 
 
 class DatabaseVariableService(VariableService, Service):
+    """Stores the variables of each user in the database, encrypted.
+
+    Decrypted values are kept in memory for `variable_cache_ttl` seconds, per user, so flows that
+    use the same variables don't load and decrypt them on every run. Changing or deleting a
+    variable through this service forgets the values cached for its user.
+    """
+
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        self.cache_ttl = settings_service.settings.variable_cache_ttl
+        self._cache_lock = threading.Lock()
+        # user id -> variable name -> (expires at, type, decrypted value)
+        self._cache: dict[str, dict[str, tuple[float, str | None, str]]] = {}
+
+    def _cache_variable(self, variable: Variable) -> str:
+        value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        if self.cache_ttl > 0:
+            with self._cache_lock:
+                user_cache = self._cache.setdefault(str(variable.user_id), {})
+                user_cache[variable.name] = (time.monotonic() + self.cache_ttl, variable.type, value)
+        return value
+
+    def invalidate_user(self, user_id: UUID | str | None = None) -> None:
+        """Forgets the cached variables of `user_id`, or of every user if no id is given."""
+        with self._cache_lock:
+            if user_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(str(user_id), None)
+
+    def get_cached_variable(self, user_id: UUID | str, name: str, field: str) -> str | None:
+        with self._cache_lock:
+            user_cache = self._cache.get(str(user_id))
+            if not user_cache or (cached := user_cache.get(name)) is None:
+                return None
+            expires_at, type_, value = cached
+            if expires_at <= time.monotonic():
+                del user_cache[name]
+                return None
+        self._check_field(name, type_, field)
+        return value
+
+    def prefetch_variables(self, user_id: UUID | str, names: Iterable[str], session: Session) -> None:
+        if self.cache_ttl <= 0:
+            return
+        with self._cache_lock:
+            user_cache = self._cache.get(str(user_id), {})
+            now = time.monotonic()
+            missing = {name for name in names if name not in user_cache or user_cache[name][0] <= now}
+        if not missing:
+            return
+        query = select(Variable).where(Variable.user_id == user_id, Variable.name.in_(missing))  # type: ignore[attr-defined]
+        for variable in session.exec(query).all():
+            if variable.value:
+                self._cache_variable(variable)
+
+    @staticmethod
+    def _check_field(name: str, type_: str | None, field: str) -> None:
+        if type_ == CREDENTIAL_TYPE and field == "session_id":
+            msg = (
+                f"variable {name} of type 'Credential' cannot be used in a Session ID field "
+                "because its purpose is to prevent the exposure of values."
+            )
+            raise TypeError(msg)
 
     def initialize_user_variables(self, user_id: UUID | str, session: Session) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -66,15 +130,10 @@ class DatabaseVariableService(VariableService, Service):
             msg = f"{name} variable not found."
             raise ValueError(msg)
 
-        if variable.type == CREDENTIAL_TYPE and field == "session_id":
-            msg = (
-                f"variable {name} of type 'Credential' cannot be used in a Session ID field "
-                "because its purpose is to prevent the exposure of values."
-            )
-            raise TypeError(msg)
+        self._check_field(name, variable.type, field)
 
         # we decrypt the value
-        return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        return self._cache_variable(variable)
 
     def get_all(self, user_id: UUID | str, session: Session) -> list[Variable | None]:
         return list(session.exec(select(Variable).where(Variable.user_id == user_id)).all())
@@ -99,6 +158,7 @@ class DatabaseVariableService(VariableService, Service):
         session.add(variable)
         session.commit()
         session.refresh(variable)
+        self.invalidate_user(user_id)
         return variable
 
     def update_variable_fields(
@@ -123,6 +183,7 @@ class DatabaseVariableService(VariableService, Service):
         session.add(db_variable)
         session.commit()
         session.refresh(db_variable)
+        self.invalidate_user(user_id)
         return db_variable
 
     def delete_variable(
@@ -138,6 +199,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         session.delete(variable)
         session.commit()
+        self.invalidate_user(user_id)
 
     def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: Session) -> None:
         variable = session.exec(select(Variable).where(Variable.user_id == user_id, Variable.id == variable_id)).first()
@@ -146,6 +208,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         session.delete(variable)
         session.commit()
+        self.invalidate_user(user_id)
 
     def create_variable(
         self,
@@ -167,4 +230,5 @@ class DatabaseVariableService(VariableService, Service):
         session.add(variable)
         session.commit()
         session.refresh(variable)
+        self.invalidate_user(user_id)
         return variable
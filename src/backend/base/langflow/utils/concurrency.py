@@ -1,6 +1,8 @@
+import asyncio
 import re
 import threading
-from contextlib import contextmanager
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
 
 from filelock import FileLock
@@ -57,3 +59,69 @@ class KeyedWorkerLockManager:
         lock = FileLock(self.locks_dir / key)
         with lock:
             yield
+
+
+class ThreadSafeSemaphore:
+    """An asyncio-style semaphore that can be shared by coroutines running on different event loops.
+
+    `asyncio.Semaphore` is bound to the loop it is first used on, so it cannot limit work that is spread
+    across several threads. Waiters park on a future of their own loop and are woken thread-safely.
+    """
+
+    def __init__(self, value: int) -> None:
+        if value < 1:
+            msg = "Semaphore value must be at least 1"
+            raise ValueError(msg)
+        self._value = value
+        self._lock = threading.Lock()
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+    @property
+    def available(self) -> int:
+        return self._value
+
+    async def acquire(self) -> None:
+        with self._lock:
+            if self._value > 0 and not self._waiters:
+                self._value -= 1
+                return
+            loop = asyncio.get_running_loop()
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                if (loop, waiter) in self._waiters:
+                    self._waiters.remove((loop, waiter))
+                    raise
+            # The slot was handed to us before the cancellation was delivered
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            if not self._waiters:
+                self._value += 1
+                return
+            loop, waiter = self._waiters.popleft()
+        try:
+            loop.call_soon_threadsafe(self._wake, waiter)
+        except RuntimeError:
+            # The waiter's loop is closed, pass the slot on
+            self.release()
+
+    def _wake(self, waiter: asyncio.Future) -> None:
+        if waiter.done():
+            self.release()
+        else:
+            waiter.set_result(None)
+
+    @asynccontextmanager
+    async def hold(self):
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
@@ -0,0 +1,121 @@
+import pytest
+from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langflow.base.vectorstores.faiss_index import faiss_index_cache
+from langflow.components.vectorstores.faiss import FaissVectorStoreComponent
+from langflow.schema import Data
+
+
+class CountingEmbeddings(DeterministicFakeEmbedding):
+    embedded: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return super().embed_documents(texts)
+
+
+@pytest.fixture
+def embeddings():
+    return CountingEmbeddings(size=8, embedded=[])
+
+
+@pytest.fixture(autouse=True)
+def _clear_index_cache():
+    faiss_index_cache.clear()
+    yield
+    faiss_index_cache.clear()
+
+
+def _build(tmp_path, embeddings, texts):
+    component = FaissVectorStoreComponent()
+    component.set_attributes(
+        {
+            "persist_directory": str(tmp_path),
+            "index_name": "test_index",
+            "embedding": embeddings,
+            "ingest_data": [Data(text=text) for text in texts],
+            "search_query": "",
+        }
+    )
+    return component, component.build_vector_store()
+
+
+def test_unchanged_documents_are_not_embedded_again(tmp_path, embeddings):
+    _build(tmp_path, embeddings, ["first", "second"])
+    assert sorted(embeddings.embedded) == ["first", "second"]
+    index_mtime = (tmp_path / "test_index.faiss").stat().st_mtime_ns
+
+    embeddings.embedded.clear()
+    _, vector_store = _build(tmp_path, embeddings, ["first", "second"])
+    assert embeddings.embedded == []
+    assert (tmp_path / "test_index.faiss").stat().st_mtime_ns == index_mtime
+
+    _, vector_store = _build(tmp_path, embeddings, ["second", "third"])
+    assert embeddings.embedded == ["third"]
+    texts = sorted(doc.page_content for doc in vector_store.docstore._dict.values())
+    assert texts == ["second", "third"]
+
+
+def test_search_uses_the_loaded_index_until_it_changes_on_disk(tmp_path, embeddings, monkeypatch):
+    component, _ = _build(tmp_path, embeddings, ["first", "second"])
+    faiss_index_cache.clear()
+
+    loads = []
+    original_load_local = FAISS.load_local
+
+    def counting_load_local(*args, **kwargs):
+        loads.append(args)
+        return original_load_local(*args, **kwargs)
+
+    monkeypatch.setattr(FAISS, "load_local", counting_load_local)
+    component.set_attributes({**component._attributes, "search_query": "first"})
+    assert component.search_documents()
+    assert component.search_documents()
+    assert len(loads) == 1
+
+    # Another process rewrites the index
+    FAISS.from_texts(["other"], embeddings).save_local(str(tmp_path), "test_index")
+    results = component.search_documents()
+    assert len(loads) == 2
+    assert [data.text for data in results] == ["other"]
+
+
+def test_callers_get_their_own_embeddings_and_a_stable_index(tmp_path, embeddings):
+    _build(tmp_path, embeddings, ["first", "second"])
+    other_embeddings = CountingEmbeddings(size=8, embedded=[])
+
+    reader = faiss_index_cache.load(tmp_path, "test_index", embeddings, allow_dangerous_deserialization=True)
+    other_reader = faiss_index_cache.load(
+        tmp_path, "test_index", other_embeddings, allow_dangerous_deserialization=True
+    )
+    assert reader.embedding_function is embeddings
+    assert other_reader.embedding_function is other_embeddings
+
+    _, updated = _build(tmp_path, embeddings, ["second", "third"])
+    # The stores loaded before the update still search the index they were given
+    assert sorted(doc.page_content for doc in reader.docstore._dict.values()) == ["first", "second"]
+    assert reader.index.ntotal == 2
+    assert sorted(doc.page_content for doc in updated.docstore._dict.values()) == ["second", "third"]
+
+
+def test_cached_index_requires_dangerous_deserialization(tmp_path, embeddings):
+    _build(tmp_path, embeddings, ["first"])
+    assert faiss_index_cache.load(tmp_path, "test_index", embeddings, allow_dangerous_deserialization=True)
+
+    with pytest.raises(ValueError, match="allow_dangerous_deserialization"):
+        faiss_index_cache.load(tmp_path, "test_index", embeddings)
+
+
+def test_switching_embeddings_embeds_every_document_again(tmp_path, embeddings):
+    _build(tmp_path, embeddings, ["first", "second"])
+
+    larger_embeddings = CountingEmbeddings(size=16, embedded=[])
+    component, vector_store = _build(tmp_path, larger_embeddings, ["first", "second"])
+    assert sorted(larger_embeddings.embedded) == ["first", "second"]
+    assert vector_store.index.d == 16
+    component.set_attributes({**component._attributes, "search_query": "first"})
+    assert component.search_documents()
+
+    larger_embeddings.embedded.clear()
+    _build(tmp_path, larger_embeddings, ["first", "second"])
+    assert larger_embeddings.embedded == []
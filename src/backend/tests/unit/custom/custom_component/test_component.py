@@ -5,6 +5,7 @@ from langflow.components.inputs import ChatInput
 from langflow.components.models import OpenAIModelComponent
 from langflow.components.outputs import ChatOutput
 from langflow.template import Output
+from langflow.template.field.base import UNDEFINED
 
 
 def test_set_invalid_output():
@@ -62,3 +63,38 @@ def test_set_required_inputs_various_components():
     assert _assert_all_outputs_have_different_required_inputs(task.outputs)
     assert _assert_all_outputs_have_different_required_inputs(tool_calling_agent.outputs)
     assert _assert_all_outputs_have_different_required_inputs(openai_component.outputs)
+
+
+def test_class_source_and_metadata_are_computed_once(monkeypatch):
+    import inspect
+
+    ChatInput()
+    calls = []
+    getsource = inspect.getsource
+
+    def counting_getsource(obj):
+        calls.append(obj)
+        return getsource(obj)
+
+    monkeypatch.setattr(inspect, "getsource", counting_getsource)
+    chatinput = ChatInput()
+
+    assert calls == []
+    assert chatinput._code == inspect.getsource(inspect.getmodule(ChatInput))
+    assert chatinput._outputs_map["message"].types == ["Message"]
+    assert chatinput._outputs_map["message"].required_inputs == chatinput.outputs[0].required_inputs
+
+
+def test_instances_do_not_share_inputs_and_outputs():
+    first = ChatInput()
+    second = ChatInput()
+
+    first._outputs_map["message"].types.append("Data")
+    first._outputs_map["message"].value = "result"
+    first._inputs["sender"].options.append("Other")
+
+    assert second._outputs_map["message"].types == ["Message"]
+    assert "Data" not in ChatInput.outputs[0].types
+    assert second._outputs_map["message"].value is UNDEFINED
+    assert "Other" not in second._inputs["sender"].options
+    assert "Other" not in ChatInput()._inputs["sender"].options
@@ -0,0 +1,115 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from langflow.custom.directory_reader import component_index, utils
+from langflow.custom.directory_reader.component_index import ComponentIndex
+from langflow.custom.utils import abuild_custom_components
+
+COMPONENT_CODE = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class {name}(Component):
+    display_name = "{name}"
+    name = "{name}"
+
+    inputs = [MessageTextInput(name="input_value", display_name="Input")]
+    outputs = [Output(display_name="Message", name="message", method="build_message")]
+
+    def build_message(self) -> Message:
+        return Message(text=self.input_value)
+"""
+
+
+@pytest.fixture
+def components_path(tmp_path):
+    category = tmp_path / "components" / "custom"
+    category.mkdir(parents=True)
+    for name in ("First", "Second"):
+        (category / f"{name.lower()}.py").write_text(COMPONENT_CODE.format(name=name))
+    return tmp_path / "components"
+
+
+@pytest.fixture
+def built_files(monkeypatch):
+    built = []
+    abuild_and_validate_all_files = utils.abuild_and_validate_all_files
+
+    async def counting_build(reader, file_list):
+        built.extend(Path(file_path).name for file_path in file_list)
+        return await abuild_and_validate_all_files(reader, file_list)
+
+    monkeypatch.setattr(utils, "abuild_and_validate_all_files", counting_build)
+    return built
+
+
+async def test_only_changed_files_are_built_again(tmp_path, components_path, built_files):
+    index_path = tmp_path / "index.json"
+    components = await abuild_custom_components([str(components_path)], ComponentIndex(index_path))
+    assert sorted(built_files) == ["first.py", "second.py"]
+    assert list(components["custom"]) == ["First", "Second"]
+
+    built_files.clear()
+    indexed_components = await abuild_custom_components([str(components_path)], ComponentIndex(index_path))
+    assert built_files == []
+    assert indexed_components == components
+
+    # Touching a file without changing it doesn't build it again
+    second = components_path / "custom" / "second.py"
+    stat = second.stat()
+    os.utime(second, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    await abuild_custom_components([str(components_path)], ComponentIndex(index_path))
+    assert built_files == []
+
+    second.write_text(COMPONENT_CODE.format(name="Renamed"))
+    components = await abuild_custom_components([str(components_path)], ComponentIndex(index_path))
+    assert built_files == ["second.py"]
+    assert list(components["custom"]) == ["First", "Renamed"]
+
+    # Removed files are dropped from the index
+    second.unlink()
+    await abuild_custom_components([str(components_path)], ComponentIndex(index_path))
+    assert len(ComponentIndex(index_path)) == 1
+
+
+async def test_index_is_discarded_when_langflow_changes(tmp_path, components_path, built_files, monkeypatch):
+    index_path = tmp_path / "index.json"
+    await abuild_custom_components([str(components_path)], ComponentIndex(index_path))
+
+    monkeypatch.setattr(component_index, "_langflow_fingerprint", lambda: "another version")
+    built_files.clear()
+    await abuild_custom_components([str(components_path)], ComponentIndex(index_path))
+    assert sorted(built_files) == ["first.py", "second.py"]
+
+
+def test_entries_depend_on_imported_components_and_environment(tmp_path, monkeypatch):
+    components_path = tmp_path / "components"
+    (components_path / "custom").mkdir(parents=True)
+    monkeypatch.setattr(component_index, "COMPONENTS_PATH", components_path)
+    monkeypatch.delenv("LANGFLOW_TEST_FLAG", raising=False)
+    util = components_path / "custom" / "util.py"
+    util.write_text("VALUE = 1\n")
+    component = components_path / "custom" / "component.py"
+    component.write_text(
+        "import os\nfrom langflow.components.custom.util import VALUE\n\nFLAG = os.getenv('LANGFLOW_TEST_FLAG')\n"
+    )
+    index_path = tmp_path / "index.json"
+    index = ComponentIndex(index_path)
+    index.add(component, "custom", "Component", {"value": 1})
+    index.save()
+
+    index = ComponentIndex(index_path)
+    assert index.get(component).template == {"value": 1}
+    assert json.loads(index_path.read_text())["entries"][str(component)]["component_name"] == "Component"
+
+    monkeypatch.setenv("LANGFLOW_TEST_FLAG", "true")
+    assert index.get(component) is None
+    monkeypatch.delenv("LANGFLOW_TEST_FLAG")
+    assert index.get(component) is not None
+
+    util.write_text("VALUE = 22\n")
+    assert index.get(component) is None
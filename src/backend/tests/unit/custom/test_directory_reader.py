@@ -0,0 +1,81 @@
+import threading
+
+import pytest
+from langflow.custom.directory_reader import DirectoryReader
+from langflow.custom.directory_reader.directory_reader import MAX_WORKERS
+from langflow.custom.directory_reader.utils import abuild_and_validate_all_files, load_files_from_path
+
+COMPONENT_CODE = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class {name}(Component):
+    display_name = "{name}"
+    name = "{name}"
+
+    inputs = [MessageTextInput(name="input_value", display_name="Input")]
+    outputs = [Output(display_name="Message", name="message", method="build_message")]
+
+    def build_message(self) -> Message:
+        return Message(text=self.input_value)
+"""
+
+
+def _summary(data: dict) -> list:
+    return [
+        (
+            menu["name"],
+            [(component["name"], component["output_types"], component["error"]) for component in menu["components"]],
+        )
+        for menu in data["menu"]
+    ]
+
+
+@pytest.fixture
+def components_path(tmp_path):
+    for category, name in [("first", "Alpha"), ("second", "Beta"), ("first", "Gamma")]:
+        (tmp_path / category).mkdir(exist_ok=True)
+        (tmp_path / category / f"{name.lower()}.py").write_text(COMPONENT_CODE.format(name=name))
+    (tmp_path / "second" / "broken.py").write_text("def build(:\n")
+    (tmp_path / "second" / "failing.py").write_text("import not_a_module\n" + COMPONENT_CODE.format(name="Failing"))
+    return tmp_path
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+async def test_errors_are_isolated_per_file(components_path, max_workers):
+    file_list = sorted(load_files_from_path(str(components_path)))
+    reader = DirectoryReader(str(components_path), max_workers=max_workers)
+
+    data = await reader.abuild_component_menu_list(file_list)
+    valid_components, _ = await abuild_and_validate_all_files(reader, file_list)
+
+    assert [menu["name"] for menu in data["menu"]] == ["first", "second"]
+    components = {component["file"]: component for menu in data["menu"] for component in menu["components"]}
+    assert components["broken.py"]["error"] == "Syntax error"
+    assert components["alpha.py"]["error"] == ""
+    assert _summary(data) == _summary(reader.build_component_menu_list(file_list))
+    valid_names = [name for menu in valid_components["menu"] for name, _, _ in menu["components"]]
+    assert valid_names == ["Alpha", "Gamma", "Beta"]
+
+
+def test_files_are_processed_in_process_by_default(tmp_path):
+    assert DirectoryReader(str(tmp_path)).max_workers == 1
+    assert DirectoryReader(str(tmp_path), max_workers=100).max_workers == MAX_WORKERS
+
+
+async def test_files_are_processed_concurrently_in_process(components_path, monkeypatch):
+    file_list = load_files_from_path(str(components_path))
+    # Every file waits for the others, which only succeeds if they are processed at the same time
+    barrier = threading.Barrier(len(file_list), timeout=10)
+    discover_component = DirectoryReader.discover_component
+
+    def discover_together(self, file_path, **kwargs):
+        barrier.wait()
+        return discover_component(self, file_path, **kwargs)
+
+    monkeypatch.setattr(DirectoryReader, "discover_component", discover_together)
+    data = await DirectoryReader(str(components_path)).abuild_component_menu_list(file_list)
+
+    assert sum(len(menu["components"]) for menu in data["menu"]) == len(file_list)
@@ -0,0 +1,68 @@
+from langflow.custom import CustomComponent
+from langflow.custom.eval import ComponentClassCache, eval_custom_component_code, get_component_class_cache
+from langflow.custom.utils import build_custom_component_template
+
+CODE = """
+from langflow.custom import Component
+
+
+class CachedComponent(Component):
+    display_name = "Cached Component"
+"""
+
+LEGACY_CODE = """
+from langflow.custom import CustomComponent
+
+
+class CachedLegacyComponent(CustomComponent):
+    display_name = "Cached Legacy Component"
+    field_config = {"text": {"display_name": "Input Text"}}
+
+    def build(self, text: str) -> str:
+        return text
+"""
+
+
+def test_eval_custom_component_code_reuses_compiled_class():
+    cache = get_component_class_cache()
+    cache.invalidate(CODE)
+    hits = cache.hits
+
+    first = eval_custom_component_code(CODE)
+    second = eval_custom_component_code(CODE)
+
+    assert first is second
+    assert first.__name__ == "CachedComponent"
+    assert cache.hits == hits + 1
+
+
+def test_invalidate_recompiles_class():
+    cache = get_component_class_cache()
+    first = eval_custom_component_code(CODE)
+    cache.invalidate(CODE)
+    second = eval_custom_component_code(CODE)
+
+    assert first is not second
+
+
+def test_building_a_cached_class_twice_keeps_its_field_config():
+    get_component_class_cache().invalidate(LEGACY_CODE)
+
+    first, _ = build_custom_component_template(CustomComponent(_code=LEGACY_CODE))
+    second, _ = build_custom_component_template(CustomComponent(_code=LEGACY_CODE))
+
+    assert first["template"]["text"]["display_name"] == "Input Text"
+    assert second["template"]["text"]["display_name"] == "Input Text"
+
+
+def test_component_class_cache_evicts_least_recently_used():
+    cache = ComponentClassCache(maxsize=2)
+    cache.set("a", int)
+    cache.set("b", str)
+    assert cache.get("a") is int
+    cache.set("c", float)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is int
+    assert cache.get("c") is float
+    assert cache.stats() == {"hits": 3, "misses": 1, "size": 2, "maxsize": 2}
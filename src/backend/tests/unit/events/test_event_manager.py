@@ -1,5 +1,6 @@
 import asyncio
 import json
+import threading
 import time
 import uuid
 
@@ -222,3 +223,87 @@ class TestEventManager:
         # Accessing a non-registered event callback should return the 'noop' function
         callback = event_manager.on_non_existing_event
         assert callback.__name__ == "noop"
+
+    # Sending events from another thread delivers them, in order, to the consumer loop
+    @pytest.mark.asyncio
+    async def test_send_event_from_another_thread(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+
+        def send_events():
+            for i in range(100):
+                manager.send_event(event_type="test_type", data={"index": i})
+
+        await asyncio.to_thread(send_events)
+        await asyncio.sleep(0)
+
+        indexes = []
+        while not queue.empty():
+            _, str_data, _ = queue.get_nowait()
+            indexes.append(json.loads(str_data)["data"]["index"])
+        assert indexes == list(range(100))
+
+    # Consecutive token events of the same message are coalesced within the window
+    @pytest.mark.asyncio
+    async def test_token_events_are_coalesced(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue, token_coalesce_window=0.01)
+        text = ""
+        for chunk in ["Hello", ", ", "world"]:
+            text += chunk
+            manager.send_event(event_type="token", data={"id": "message-1", "chunk": chunk, "text": text})
+        manager.send_event(event_type="end", data={})
+
+        events = []
+        while not queue.empty():
+            _, str_data, _ = queue.get_nowait()
+            events.append(json.loads(str_data))
+        assert events == [
+            {"event": "token", "data": {"id": "message-1", "chunk": "Hello, world", "text": "Hello, world"}},
+            {"event": "end", "data": {}},
+        ]
+
+    # A pending coalesced token is flushed once the window elapses
+    @pytest.mark.asyncio
+    async def test_pending_token_is_flushed_after_window(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue, token_coalesce_window=0.01)
+        manager.send_event(event_type="token", data={"id": "message-1", "chunk": "Hi", "text": "Hi"})
+        assert queue.empty()
+
+        _, str_data, _ = await asyncio.wait_for(queue.get(), timeout=1)
+        assert json.loads(str_data)["data"]["chunk"] == "Hi"
+
+    # A token replaced by the next message is queued before a concurrent flush of that message
+    @pytest.mark.asyncio
+    async def test_tokens_keep_their_order_with_a_concurrent_flush(self, monkeypatch):
+        queue = asyncio.Queue()
+        manager = EventManager(queue, token_coalesce_window=10)
+        serialize = EventManager._serialize
+        serializing_first = threading.Event()
+
+        def slow_serialize(event_type, data):
+            if data.get("id") == "message-1":
+                # Give the concurrent flush a chance to queue the second message first
+                serializing_first.set()
+                time.sleep(0.05)
+            return serialize(event_type, data)
+
+        monkeypatch.setattr(manager, "_serialize", slow_serialize)
+        manager.send_event(event_type="token", data={"id": "message-1", "chunk": "first"})
+
+        def flush_concurrently():
+            serializing_first.wait(timeout=1)
+            manager.flush_tokens()
+
+        flusher = threading.Thread(target=flush_concurrently)
+        flusher.start()
+        await asyncio.to_thread(manager.send_event, event_type="token", data={"id": "message-2", "chunk": "second"})
+        await asyncio.to_thread(flusher.join)
+        await asyncio.sleep(0)
+
+        chunks = []
+        while not queue.empty():
+            _, str_data, _ = queue.get_nowait()
+            chunks.append(json.loads(str_data)["data"]["chunk"])
+        assert chunks == ["first", "second"]
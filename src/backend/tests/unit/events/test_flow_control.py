@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+from langflow.events.flow_control import FlowControlQueue
+
+
+def test_window_must_be_positive():
+    with pytest.raises(ValueError, match="at least 1"):
+        FlowControlQueue(0)
+
+
+async def test_producer_waits_until_window_has_room():
+    queue = FlowControlQueue(2)
+    queue.put_nowait(("1", b"a", 0))
+    await asyncio.wait_for(queue.wait_for_credit(), timeout=1)
+
+    queue.put_nowait(("2", b"b", 0))
+    waiter = asyncio.create_task(queue.wait_for_credit())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    await queue.get()
+    await queue.mark_consumed()
+    await asyncio.wait_for(waiter, timeout=1)
+
+
+async def test_detached_queue_is_bounded_by_buffered_bytes():
+    queue = FlowControlQueue(detached=True, max_buffer_bytes=4)
+    for i in range(3):
+        queue.put_nowait((str(i), b"x", 0))
+    assert queue.has_credit()
+    assert queue.buffered_bytes == 3
+
+    queue.put_nowait(("3", b"x", 0))
+    assert not queue.has_credit()
+
+    await queue.get()
+    assert queue.buffered_bytes == 3
+    assert queue.has_credit()
+
+
+async def test_end_marker_does_not_count_towards_buffered_bytes():
+    queue = FlowControlQueue()
+    queue.put_nowait((None, None, 0))
+    assert queue.buffered_bytes == 0
+    assert not queue.has_credit()
@@ -0,0 +1,66 @@
+import pickle
+import random
+from types import SimpleNamespace
+
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.graph import Graph
+
+
+def _generate_edges(num_nodes: int, fan_out: int = 3, seed: int = 42) -> list[SimpleNamespace]:
+    """Generates a random DAG shaped like a flow, where each node feeds up to `fan_out` later nodes."""
+    rng = random.Random(seed)  # noqa: S311
+    return [
+        SimpleNamespace(source_id=f"node-{source}", target_id=f"node-{target}")
+        for source in range(num_nodes - 1)
+        for target in rng.sample(range(source + 1, num_nodes), min(fan_out, num_nodes - source - 1))
+    ]
+
+
+def _linear_vertex_edges(edges, vertex_id: str):
+    return [edge for edge in edges if vertex_id in {edge.source_id, edge.target_id}]
+
+
+def test_edge_index_matches_linear_scan():
+    graph = Graph()
+    graph.edges = _generate_edges(100)
+    for node in range(100):
+        vertex_id = f"node-{node}"
+        assert graph.get_vertex_edges(vertex_id) == _linear_vertex_edges(graph.edges, vertex_id)
+        assert graph.get_vertex_edges(vertex_id, is_target=False) == [
+            edge for edge in graph.edges if edge.source_id == vertex_id
+        ]
+        assert graph.get_vertex_edges(vertex_id, is_source=False) == [
+            edge for edge in graph.edges if edge.target_id == vertex_id
+        ]
+
+
+def test_edge_index_stays_in_sync():
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+
+    output_vertex = graph.get_vertex("chat_output")
+    assert [edge.source_id for edge in output_vertex.incoming_edges] == ["chat_input"]
+    assert graph.get_edge("chat_input", "chat_output") is graph.edges[0]
+
+    unpickled_graph = pickle.loads(pickle.dumps(graph))  # noqa: S301
+    assert len(unpickled_graph.get_vertex_edges("chat_output")) == 1
+
+    graph.remove_vertex("chat_input")
+    assert graph.get_vertex_edges("chat_output") == []
+    assert graph.get_edge("chat_input", "chat_output") is None
+
+
+@pytest.mark.parametrize("num_nodes", [50, 1000])
+def test_edge_index_matches_linear_scan_on_large_graphs(num_nodes):
+    graph = Graph()
+    graph.edges = _generate_edges(num_nodes)
+    # Sample a fixed number of lookups so the linear scan stays cheap on large graphs
+    vertex_ids = [f"node-{node}" for node in random.Random(0).sample(range(num_nodes), 50)]  # noqa: S311
+
+    assert [graph.get_vertex_edges(vertex_id) for vertex_id in vertex_ids] == [
+        _linear_vertex_edges(graph.edges, vertex_id) for vertex_id in vertex_ids
+    ]
@@ -0,0 +1,101 @@
+import asyncio
+
+from langflow.components.inputs import ChatInput
+from langflow.custom import Component
+from langflow.graph import Graph
+from langflow.io import FloatInput, MessageTextInput, Output
+from langflow.schema.message import Message
+from langflow.services.telemetry import metrics
+
+EVENTS: list[str] = []
+
+
+class Delay(Component):
+    display_name = "Delay"
+    description = "Passes the text through after a delay"
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text"),
+        FloatInput(name="delay", display_name="Delay", value=0.0),
+    ]
+    outputs = [
+        Output(display_name="Text", name="delayed_text", method="delay_text"),
+    ]
+
+    async def delay_text(self) -> Message:
+        EVENTS.append(f"{self._id} start")
+        await asyncio.sleep(self.delay)
+        EVENTS.append(f"{self._id} end")
+        return Message(text=self.text)
+
+
+class Join(Component):
+    display_name = "Join"
+    description = "Joins two texts"
+
+    inputs = [
+        MessageTextInput(name="first", display_name="First"),
+        MessageTextInput(name="second", display_name="Second"),
+    ]
+    outputs = [
+        Output(display_name="Text", name="joined_text", method="join"),
+    ]
+
+    def join(self) -> Message:
+        return Message(text=f"{self.first} {self.second}")
+
+
+def _fan_out_graph() -> Graph:
+    """A slow branch next to a fast branch of two vertices, joined at the end."""
+    chat_input = ChatInput(_id="chat_input", input_value="hello")
+    slow = Delay(_id="slow", delay=0.5)
+    slow.set(text=chat_input.message_response)
+    fast = Delay(_id="fast", delay=0.0)
+    fast.set(text=chat_input.message_response)
+    fast_successor = Delay(_id="fast_successor", delay=0.0)
+    fast_successor.set(text=fast.delay_text)
+    join = Join(_id="join")
+    join.set(first=slow.delay_text, second=fast_successor.delay_text)
+    return Graph(chat_input, join)
+
+
+async def test_process_starts_successors_without_waiting_for_the_layer():
+    EVENTS.clear()
+    graph = _fan_out_graph()
+
+    await graph.process(fallback_to_env_vars=False)
+
+    assert EVENTS.index("fast_successor end") < EVENTS.index("slow end")
+    assert graph.get_vertex("join").built_object["joined_text"].text == "hello hello"
+
+
+async def test_process_respects_max_parallelism():
+    EVENTS.clear()
+    graph = _fan_out_graph()
+
+    await graph.process(fallback_to_env_vars=False, max_parallelism=1)
+
+    # With a single slot, every build finishes before the next one starts
+    assert all(
+        start.endswith("start") and end == start.replace("start", "end")
+        for start, end in zip(EVENTS[::2], EVENTS[1::2], strict=True)
+    )
+    assert graph.get_vertex("join").built_object["joined_text"].text == "hello hello"
+
+
+async def test_process_records_build_metrics(monkeypatch):
+    observed: list[tuple[str, float, dict]] = []
+    monkeypatch.setattr(metrics, "observe", lambda name, value, labels: observed.append((name, value, labels)))
+    graph = _fan_out_graph()
+
+    await graph.process(fallback_to_env_vars=False)
+
+    component_builds = [labels for name, _, labels in observed if name == "component_build_duration"]
+    assert len(component_builds) == len(graph.vertices)
+    assert {labels["component_type"] for labels in component_builds} == {"ChatInput", "Delay", "Join"}
+    assert all(labels["status"] == "success" for labels in component_builds)
+    assert len([name for name, _, _ in observed if name == "component_queue_wait"]) == len(graph.vertices)
+    graph_builds = [(value, labels) for name, value, labels in observed if name == "graph_build_duration"]
+    assert len(graph_builds) == 1
+    assert graph_builds[0][0] >= 0.5
+    assert graph_builds[0][1]["status"] == "success"
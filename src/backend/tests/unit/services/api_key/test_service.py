@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+import pytest
+from langflow.services.api_key import service as api_key_service_module
+from langflow.services.api_key.service import ApiKeyService
+from langflow.services.database.models.api_key.model import ApiKey
+from langflow.services.database.models.user.model import User, UserRead
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.pool import StaticPool
+
+
+@pytest.fixture
+def database_service():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine, tables=[User.__table__, ApiKey.__table__])
+    database_service = SimpleNamespace(engine=engine, commits=0)
+
+    @event.listens_for(engine, "commit")
+    def count_commits(_):
+        database_service.commits += 1
+
+    return database_service
+
+
+@pytest.fixture
+def user_and_key(database_service):
+    with Session(database_service.engine) as session:
+        user = User(username="api-key-user", password="password", is_active=True)  # noqa: S106
+        api_key = ApiKey(name="key", api_key="sk-test", user_id=user.id)
+        session.add_all([user, api_key])
+        session.commit()
+        return UserRead.model_validate(user, from_attributes=True), api_key.id
+
+
+def _settings_service(**overrides):
+    settings = {
+        "api_key_cache_ttl": 60,
+        "api_key_cache_size": 2,
+        "api_key_usage_flush_interval": 10,
+        **overrides,
+    }
+    return SimpleNamespace(settings=SimpleNamespace(**settings))
+
+
+async def test_usage_is_written_in_one_bulk_update(database_service, user_and_key):
+    _, api_key_id = user_and_key
+    service = ApiKeyService(_settings_service(), database_service)
+    commits = database_service.commits
+    for _ in range(5):
+        service.record_use(api_key_id)
+    service.flush()
+
+    with Session(database_service.engine) as session:
+        api_key = session.get(ApiKey, api_key_id)
+        assert api_key.total_uses == 5
+        assert api_key.last_used_at is not None
+    assert database_service.commits == commits + 1
+
+    # Pending uses are written on teardown
+    service.record_use(api_key_id)
+    await service.teardown()
+    with Session(database_service.engine) as session:
+        assert session.get(ApiKey, api_key_id).total_uses == 6
+
+
+async def test_verified_keys_are_cached_until_they_expire(database_service, user_and_key, monkeypatch):
+    user, api_key_id = user_and_key
+    service = ApiKeyService(_settings_service(), database_service)
+    now = 1000.0
+    monkeypatch.setattr(api_key_service_module.time, "monotonic", lambda: now)
+
+    assert service.get_user("sk-test") is None
+    service.set_user("sk-test", api_key_id, user)
+    assert service.get_user("sk-test") == user
+    assert service._usage[api_key_id].uses == 1
+
+    now += 61
+    assert service.get_user("sk-test") is None
+    await service.teardown()
+
+
+async def test_invalidate_forgets_keys(database_service, user_and_key):
+    user, api_key_id = user_and_key
+    service = ApiKeyService(_settings_service(), database_service)
+
+    service.set_user("sk-test", api_key_id, user)
+    service.invalidate(api_key_id=api_key_id)
+    assert service.get_user("sk-test") is None
+
+    service.set_user("sk-test", api_key_id, user)
+    service.invalidate(user_id=user.id)
+    assert service.get_user("sk-test") is None
+    await service.teardown()
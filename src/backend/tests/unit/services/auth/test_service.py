@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import pytest
+from langflow.services.auth.service import AuthService
+from langflow.services.database.models.user.model import User
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.pool import StaticPool
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine, tables=[User.__table__])
+    engine.selects = 0
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_selects(_conn, _cursor, statement, *_args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            engine.selects += 1
+
+    return engine
+
+
+@pytest.fixture
+def user(engine):
+    with Session(engine) as session:
+        user = User(username="cached-user", password="password", is_active=True)  # noqa: S106
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        return user
+
+
+def _auth_service(**overrides):
+    settings = {"jwt_user_cache_ttl": 30, "jwt_user_cache_size": 2, **overrides}
+    return AuthService(SimpleNamespace(settings=SimpleNamespace(**settings)))
+
+
+def test_cached_user_is_returned_as_a_detached_copy_without_a_query(engine, user):
+    auth_service = _auth_service()
+    auth_service.set_user(str(user.id), 123, user)
+
+    with Session(engine) as session:
+        selects = engine.selects
+        cached_user = auth_service.get_user(str(user.id), 123)
+        assert engine.selects == selects
+        assert cached_user.username == "cached-user"
+        assert cached_user not in session
+
+        # Changing the copy neither writes it back nor changes the cached user
+        cached_user.profile_image = "new_image"
+        session.commit()
+        assert auth_service.get_user(str(user.id), 123).profile_image != "new_image"
+    with Session(engine) as session:
+        assert session.get(User, user.id).profile_image != "new_image"
+
+    # Another token of the same user isn't cached
+    assert auth_service.get_user(str(user.id), 456) is None
+
+
+def test_invalidate_user_forgets_its_tokens(user):
+    auth_service = _auth_service()
+    auth_service.set_user(str(user.id), 123, user)
+    auth_service.invalidate_user(user.id)
+
+    assert auth_service.get_user(str(user.id), 123) is None
+
+
+def test_cache_is_disabled_with_zero_ttl(user):
+    auth_service = _auth_service(jwt_user_cache_ttl=0)
+    auth_service.set_user(str(user.id), 123, user)
+
+    assert auth_service.get_user(str(user.id), 123) is None
@@ -0,0 +1,96 @@
+import threading
+import time
+
+from langflow.services.cache.service import ThreadingInMemoryCache
+from langflow.services.cache.utils import approximate_size
+
+
+def test_evicts_least_recently_used_items_beyond_max_bytes():
+    cache = ThreadingInMemoryCache(max_bytes=3 * approximate_size("x" * 1000))
+    cache.set("a", "a" * 1000)
+    cache.set("b", "b" * 1000)
+    cache.set("c", "c" * 1000)
+    assert cache.get("a") is not None
+
+    cache.set("d", "d" * 1000)
+
+    assert "b" not in cache
+    assert all(key in cache for key in ("a", "c", "d"))
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= cache.max_bytes
+
+
+def test_keeps_an_item_larger_than_max_bytes():
+    cache = ThreadingInMemoryCache(max_bytes=10)
+    cache.set("small", "x")
+    cache.set("large", "x" * 1000)
+
+    assert "small" not in cache
+    assert cache.get("large") == "x" * 1000
+
+
+def test_upsert_merges_dicts_in_place():
+    cache = ThreadingInMemoryCache(max_bytes=1024 * 1024)
+    value = {"a": "x" * 100}
+    cache.set("key", value)
+    cache.upsert("key", {"b": "y" * 100})
+    cache.upsert("key", {"a": "z"})
+
+    assert cache.get("key") is value
+    assert value == {"a": "z", "b": "y" * 100}
+    assert cache.stats()["bytes"] < approximate_size({"a": "x" * 100, "b": "y" * 100})
+
+
+def test_upsert_merges_pickled_values():
+    cache = ThreadingInMemoryCache()
+    cache.set("key", b"\x80\x04}\x94\x8c\x01a\x94K\x01s.")  # pickle.dumps({"a": 1})
+    cache.upsert("key", {"b": 2})
+
+    assert cache.get("key") == {"a": 1, "b": 2}
+
+
+def test_sweeper_purges_expired_items():
+    cache = ThreadingInMemoryCache(expiration_time=0.05, sweep_interval=0.02)
+    cache.set("key", "value")
+    deadline = time.monotonic() + 2
+    while "key" in cache and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert "key" not in cache
+    assert cache.stats()["expirations"] == 1
+
+
+def test_operations_with_a_caller_lock_also_take_the_cache_lock():
+    cache = ThreadingInMemoryCache()
+    caller_lock = threading.Lock()
+    writer = threading.Thread(target=cache.set, args=("a", 1), kwargs={"lock": caller_lock})
+
+    # The sweeper purges under the cache lock, so writes under another lock must wait for it
+    with cache._lock:
+        writer.start()
+        writer.join(timeout=0.2)
+        assert writer.is_alive()
+        assert "a" not in cache._cache
+    writer.join()
+
+    assert cache.get("a", lock=caller_lock) == 1
+
+
+def test_stats_count_hits_and_misses():
+    cache = ThreadingInMemoryCache(max_size=1)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("missing")
+    cache.set("b", 2)
+
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "expirations": 0,
+        "size": 1,
+        "bytes": 0,
+        "max_size": 1,
+        "max_bytes": None,
+    }
@@ -0,0 +1,85 @@
+import importlib.util
+
+import fakeredis
+import pytest
+from langflow.services.cache.service import RedisCache
+from langflow.services.settings.base import Settings
+from pydantic import ValidationError
+
+
+def _redis_cache(**kwargs) -> RedisCache:
+    cache = RedisCache(**kwargs)
+    cache._client = fakeredis.FakeAsyncRedis()
+    return cache
+
+
+@pytest.fixture
+def redis_cache():
+    return _redis_cache()
+
+
+async def test_dicts_are_stored_as_hashes(redis_cache):
+    await redis_cache.set("key", {"a": 1, "b": [1, 2]})
+
+    assert await redis_cache._client.type("key") == b"hash"
+    assert await redis_cache.get("key") == {"a": 1, "b": [1, 2]}
+    assert await redis_cache._client.ttl("key") > 0
+
+
+async def test_upsert_only_writes_updated_fields(redis_cache):
+    await redis_cache.set("key", {"a": 1, "b": 2})
+    await redis_cache.upsert("key", {"b": 3, "c": 4})
+
+    assert await redis_cache.get("key") == {"a": 1, "b": 3, "c": 4}
+
+
+async def test_upsert_merges_into_plain_values(redis_cache):
+    await redis_cache.set("key", {1: "int keys can't be hash fields"})
+    assert await redis_cache._client.type("key") == b"string"
+
+    await redis_cache.upsert("key", {"a": 1})
+
+    assert await redis_cache.get("key") == {1: "int keys can't be hash fields", "a": 1}
+
+
+async def test_set_replaces_values_of_another_type(redis_cache):
+    await redis_cache.set("key", {"a": 1})
+    await redis_cache.set("key", "value")
+    assert await redis_cache.get("key") == "value"
+
+    await redis_cache.set("key", {"b": 2})
+    assert await redis_cache.get("key") == {"b": 2}
+
+
+async def test_get_many_returns_values_in_order(redis_cache):
+    await redis_cache.set("a", 1)
+    await redis_cache.set("b", {"field": "value"})
+
+    assert await redis_cache.get_many(["b", "missing", "a"]) == [{"field": "value"}, None, 1]
+
+
+@pytest.mark.parametrize("compression", ["zstd", "lz4"])
+async def test_large_values_are_compressed(compression):
+    cache = _redis_cache(compression=compression, compression_threshold=1024)
+    value = "x" * 100_000
+    await cache.set("large", value)
+    await cache.set("small", "x")
+
+    assert len(await cache._client.get("large")) < 1024
+    assert await cache.get("large") == value
+    assert await cache.get("small") == "x"
+
+    # Values stay readable when compression is turned off
+    cache.compression = None
+    assert await cache.get("large") == value
+
+
+def test_compression_without_its_package_is_rejected(monkeypatch):
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None if name == "lz4" else find_spec(name))
+
+    monkeypatch.setenv("LANGFLOW_REDIS_CACHE_COMPRESSION", "lz4")
+    with pytest.raises(ValidationError, match="the lz4 package is not installed"):
+        Settings()
+    monkeypatch.setenv("LANGFLOW_REDIS_CACHE_COMPRESSION", "zstd")
+    assert Settings().redis_cache_compression == "zstd"
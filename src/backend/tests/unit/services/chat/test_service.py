@@ -0,0 +1,118 @@
+import pickle
+
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.graph import Graph
+from langflow.services.cache.base import AsyncBaseCacheService
+from langflow.services.chat.service import ChatService
+
+
+class PickleCache(AsyncBaseCacheService):
+    """A cache that pickles values like a remote cache would and records what was written."""
+
+    def __init__(self):
+        self._cache: dict[str, bytes] = {}
+        self.writes: list[str] = []
+
+    async def get(self, key, lock=None):  # noqa: ARG002
+        value = self._cache.get(key)
+        return pickle.loads(value) if value is not None else None  # noqa: S301
+
+    async def set(self, key, value, lock=None):  # noqa: ARG002
+        self.writes.append(key)
+        self._cache[key] = pickle.dumps(value)
+
+    async def upsert(self, key, value, lock=None):
+        await self.set(key, value, lock)
+
+    async def delete(self, key, lock=None):  # noqa: ARG002
+        self._cache.pop(key, None)
+
+    async def clear(self, lock=None):  # noqa: ARG002
+        self._cache.clear()
+
+    async def contains(self, key):
+        return key in self._cache
+
+    async def teardown(self):
+        pass
+
+
+@pytest.fixture
+def chat_service():
+    service = ChatService()
+    service.cache_service = PickleCache()
+    return service
+
+
+@pytest.fixture
+def graph():
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output, flow_id="flow")
+    graph.prepare()
+    graph.set_run_id()
+    return graph
+
+
+def _build(graph: Graph, vertex_id: str, result: str) -> None:
+    vertex = graph.get_vertex(vertex_id)
+    vertex.built = True
+    vertex.results = {"message": result}
+    graph.run_manager.remove_vertex_from_runnables(vertex_id)
+
+
+async def test_checkpoints_only_write_run_state_and_changed_vertices(chat_service, graph):
+    _build(graph, "chat_input", "hello")
+    await chat_service.checkpoint_graph("flow", graph, vertex_ids=["chat_input"])
+    assert chat_service.cache_service.writes == ["flow"]
+
+    _build(graph, "chat_output", "world")
+    await chat_service.checkpoint_graph("flow", graph, vertex_ids=["chat_output"])
+    assert chat_service.cache_service.writes[1:] == [
+        f"flow:checkpoint:{graph.run_id}:chat_output",
+        "flow:checkpoint",
+    ]
+
+    restored = await chat_service.get_graph("flow")
+    assert restored is not graph
+    assert restored.get_vertex("chat_input").results == {"message": "hello"}
+    assert restored.get_vertex("chat_output").built
+    assert restored.get_vertex("chat_output").results == {"message": "world"}
+    assert restored.run_manager.to_dict() == graph.run_manager.to_dict()
+    assert restored.checkpointed_vertices == {"chat_output"}
+
+
+async def test_snapshot_supersedes_checkpoints(chat_service, graph):
+    await chat_service.checkpoint_graph("flow", graph)
+    _build(graph, "chat_input", "hello")
+    await chat_service.checkpoint_graph("flow", graph, vertex_ids=["chat_input"])
+    assert await chat_service.cache_service.contains("flow:checkpoint")
+
+    await chat_service.set_cache("flow", graph)
+    assert not await chat_service.cache_service.contains("flow:checkpoint")
+    restored = await chat_service.get_graph("flow")
+    assert restored.get_vertex("chat_input").results == {"message": "hello"}
+
+
+async def test_snapshots_and_clearing_delete_vertex_checkpoints(chat_service, graph):
+    await chat_service.checkpoint_graph("flow", graph)
+    _build(graph, "chat_input", "hello")
+    await chat_service.checkpoint_graph("flow", graph, vertex_ids=["chat_input"])
+    await chat_service.set_cache("flow", graph)
+    assert set(chat_service.cache_service._cache) == {"flow"}
+
+    graph.set_run_id()
+    await chat_service.checkpoint_graph("flow", graph)
+    await chat_service.checkpoint_graph("flow", graph, vertex_ids=["chat_input"])
+    # Another process sharing the cache only knows the checkpoints from the stored run state
+    other_service = ChatService()
+    other_service.cache_service = chat_service.cache_service
+    await other_service.clear_cache("flow")
+    assert chat_service.cache_service._cache == {}
+
+
+async def test_get_graph_returns_none_when_not_cached(chat_service):
+    assert await chat_service.get_graph("missing") is None
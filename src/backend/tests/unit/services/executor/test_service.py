@@ -0,0 +1,91 @@
+import asyncio
+import threading
+from contextvars import ContextVar
+
+import pytest
+from langflow.services.deps import get_settings_service
+from langflow.services.executor.service import ExecutorService
+
+request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+
+@pytest.fixture
+async def executor():
+    service = ExecutorService(get_settings_service())
+    service.num_workers = 2
+    yield service
+    await service.teardown()
+
+
+async def test_run_uses_long_lived_worker_loops(executor):
+    async def current_thread():
+        await asyncio.sleep(0)
+        return threading.current_thread().name, id(asyncio.get_running_loop())
+
+    results = await asyncio.gather(*[executor.run(current_thread()) for _ in range(10)])
+
+    thread_names = {name for name, _ in results}
+    assert thread_names <= {"langflow-executor-0", "langflow-executor-1"}
+    assert len({loop_id for _, loop_id in results}) <= 2
+
+
+async def test_run_limits_concurrency_per_flow(executor):
+    executor.max_concurrency_per_flow = 2
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    async def job():
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        await asyncio.sleep(0.02)
+        with lock:
+            running -= 1
+
+    await asyncio.gather(*[executor.run(job(), flow_id="flow") for _ in range(8)])
+
+    assert max_running == 2
+    assert executor._flow_semaphores == {}
+
+
+async def test_run_keeps_the_coroutines_of_a_flow_on_one_loop(executor):
+    async def current_loop():
+        await asyncio.sleep(0.01)
+        return id(asyncio.get_running_loop())
+
+    flow_loops = await asyncio.gather(*[executor.run(current_loop(), flow_id="flow") for _ in range(6)])
+    other_loops = await asyncio.gather(*[executor.run(current_loop(), flow_id=f"flow-{i}") for i in range(6)])
+
+    assert len(set(flow_loops)) == 1
+    assert len(set(other_loops)) == 2
+    assert executor._flow_workers == {}
+
+
+async def test_run_uses_the_context_of_the_caller(executor):
+    async def get_request_id():
+        return request_id.get()
+
+    request_id.set("request")
+    assert await executor.run(get_request_id(), flow_id="flow") == "request"
+
+
+async def test_nested_run_executes_inline(executor):
+    async def inner():
+        return threading.current_thread().name
+
+    async def outer():
+        return threading.current_thread().name, await executor.run(inner())
+
+    outer_thread, inner_thread = await executor.run(outer())
+    assert outer_thread == inner_thread
+
+
+async def test_run_propagates_exceptions(executor):
+    async def fail():
+        msg = "boom"
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="boom"):
+        await executor.run(fail(), flow_id="flow")
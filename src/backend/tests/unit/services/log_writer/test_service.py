@@ -0,0 +1,96 @@
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from langflow.services.database.models.transactions.model import TransactionTable
+from langflow.services.database.models.vertex_builds.model import VertexBuildTable
+from langflow.services.log_writer.service import LogWriterService
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine, select
+from sqlmodel.pool import StaticPool
+
+
+@pytest.fixture
+def database_service():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine, tables=[TransactionTable.__table__, VertexBuildTable.__table__])
+    database_service = SimpleNamespace(engine=engine, commits=0)
+
+    @event.listens_for(engine, "commit")
+    def count_commits(_):
+        database_service.commits += 1
+
+    return database_service
+
+
+def _settings_service(**overrides):
+    settings = {
+        "log_writer_queue_size": 100,
+        "log_writer_batch_size": 10,
+        "log_writer_flush_interval": 0.05,
+        "log_writer_overflow_policy": "drop",
+        **overrides,
+    }
+    return SimpleNamespace(settings=SimpleNamespace(**settings))
+
+
+def _transaction(flow_id):
+    return TransactionTable(vertex_id="vertex", status="success", flow_id=flow_id)
+
+
+def _count(engine, table) -> int:
+    with Session(engine) as session:
+        return len(session.exec(select(table)).all())
+
+
+async def test_rows_are_written_in_batches(database_service):
+    service = LogWriterService(_settings_service(), database_service)
+    flow_id = uuid4()
+    for _ in range(25):
+        await service.aadd(_transaction(flow_id))
+    service.add(VertexBuildTable(id="vertex", valid=True, flow_id=flow_id))
+    service.flush()
+
+    assert _count(database_service.engine, TransactionTable) == 25
+    assert _count(database_service.engine, VertexBuildTable) == 1
+    assert database_service.commits <= 4
+    await service.teardown()
+
+
+async def test_flush_only_waits_for_the_rows_queued_before_it(database_service):
+    service = LogWriterService(_settings_service(log_writer_flush_interval=10), database_service)
+    flow_id = uuid4()
+    for _ in range(3):
+        service.add(_transaction(flow_id))
+
+    start = time.monotonic()
+    await service.aflush()
+    # The batch is written without waiting for more rows to fill it
+    assert time.monotonic() - start < 5
+    assert _count(database_service.engine, TransactionTable) == 3
+    await service.teardown()
+
+
+async def test_rows_are_dropped_when_queue_is_full(database_service, monkeypatch):
+    service = LogWriterService(_settings_service(log_writer_queue_size=1), database_service)
+    # Hold the writer back so the queue fills up
+    monkeypatch.setattr(service, "_ensure_started", lambda: None)
+    flow_id = uuid4()
+    service.add(_transaction(flow_id))
+    service.add(_transaction(flow_id))
+
+    assert service.dropped == 1
+
+
+async def test_teardown_flushes_pending_rows(database_service):
+    service = LogWriterService(_settings_service(log_writer_flush_interval=10), database_service)
+    flow_id = uuid4()
+    for _ in range(3):
+        service.add(_transaction(flow_id))
+    await service.teardown()
+
+    assert _count(database_service.engine, TransactionTable) == 3
+    # Rows added after teardown are written right away
+    service.add(_transaction(flow_id))
+    assert _count(database_service.engine, TransactionTable) == 4
@@ -0,0 +1,61 @@
+import hashlib
+from types import SimpleNamespace
+
+import pytest
+from langflow.services.storage.local import LocalStorageService
+
+
+@pytest.fixture
+def storage_service(tmp_path):
+    return LocalStorageService(None, SimpleNamespace(settings=SimpleNamespace(config_dir=str(tmp_path))))
+
+
+async def _chunks(content: bytes, size: int):
+    for offset in range(0, len(content), size):
+        yield content[offset : offset + size]
+
+
+async def _read(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+async def test_save_file_stream_hashes_the_file_as_it_is_written(storage_service, tmp_path):
+    content = bytes(range(256)) * 1000
+
+    stored_file = await storage_service.save_file_stream("flow", "data.bin", _chunks(content, 1000))
+
+    assert stored_file.size == len(content)
+    assert stored_file.sha256 == hashlib.sha256(content).hexdigest()
+    assert await storage_service.get_file("flow", "data.bin") == content
+    assert [path.name for path in (tmp_path / "flow").iterdir()] == ["data.bin"]
+
+
+async def test_failed_save_keeps_the_previous_file(storage_service, tmp_path):
+    await storage_service.save_file("flow", "data.bin", b"previous")
+
+    async def failing_chunks():
+        yield b"partial"
+        raise ValueError
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        await storage_service.save_file_stream("flow", "data.bin", failing_chunks())
+
+    assert await storage_service.get_file("flow", "data.bin") == b"previous"
+    assert [path.name for path in (tmp_path / "flow").iterdir()] == ["data.bin"]
+
+
+async def test_get_file_stream_reads_a_range_in_chunks(storage_service):
+    content = b"0123456789" * 10
+    await storage_service.save_file("flow", "data.txt", content)
+
+    assert await storage_service.get_file_size("flow", "data.txt") == len(content)
+    chunks = [chunk async for chunk in storage_service.get_file_stream("flow", "data.txt", chunk_size=30)]
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    assert await _read(storage_service.get_file_stream("flow", "data.txt", start=95)) == content[95:]
+    assert (
+        await _read(storage_service.get_file_stream("flow", "data.txt", start=5, length=42, chunk_size=8))
+        == (content[5:47])
+    )
+
+    with pytest.raises(FileNotFoundError):
+        await storage_service.get_file_size("flow", "missing.txt")
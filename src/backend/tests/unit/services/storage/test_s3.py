@@ -0,0 +1,139 @@
+import hashlib
+import io
+import re
+
+import pytest
+from langflow.services.storage import s3
+from langflow.services.storage.s3 import S3StorageService
+
+
+class StubS3Client:
+    """Keeps the objects of an S3 bucket in memory and records the calls made to it."""
+
+    def __init__(self, *, fail_on_part: int | None = None) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.calls: list[tuple[str, dict]] = []
+        self.fail_on_part = fail_on_part
+
+    def put_object(self, **kwargs):
+        self.calls.append(("put_object", kwargs))
+        self.objects[kwargs["Key"]] = kwargs["Body"]
+
+    def create_multipart_upload(self, **kwargs):
+        self.calls.append(("create_multipart_upload", kwargs))
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, **kwargs):
+        self.calls.append(("upload_part", {key: value for key, value in kwargs.items() if key != "Body"}))
+        if kwargs["PartNumber"] == self.fail_on_part:
+            msg = "Part upload failed"
+            raise ConnectionError(msg)
+        self.uploads[kwargs["UploadId"]][kwargs["PartNumber"]] = kwargs["Body"]
+        return {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+    def complete_multipart_upload(self, **kwargs):
+        self.calls.append(("complete_multipart_upload", kwargs))
+        parts = self.uploads.pop(kwargs["UploadId"])
+        numbers = [part["PartNumber"] for part in kwargs["MultipartUpload"]["Parts"]]
+        self.objects[kwargs["Key"]] = b"".join(parts[number] for number in numbers)
+
+    def abort_multipart_upload(self, **kwargs):
+        self.calls.append(("abort_multipart_upload", kwargs))
+        self.uploads.pop(kwargs["UploadId"])
+
+    def head_object(self, **kwargs):
+        self.calls.append(("head_object", kwargs))
+        return {"ContentLength": len(self.objects[kwargs["Key"]])}
+
+    def get_object(self, **kwargs):
+        self.calls.append(("get_object", kwargs))
+        content = self.objects[kwargs["Key"]]
+        if "Range" in kwargs:
+            match = re.fullmatch(r"bytes=(\d+)-(\d*)", kwargs["Range"])
+            assert match is not None
+            start, end = int(match[1]), int(match[2]) + 1 if match[2] else len(content)
+            content = content[start:end]
+        return {"Body": io.BytesIO(content)}
+
+
+def _storage_service(monkeypatch, client: StubS3Client) -> S3StorageService:
+    monkeypatch.setattr(s3.boto3, "client", lambda _name: client)
+    monkeypatch.setattr(s3, "MULTIPART_PART_SIZE", 10)
+    return S3StorageService(None, None)
+
+
+async def _chunks(content: bytes, size: int):
+    for offset in range(0, len(content), size):
+        yield content[offset : offset + size]
+
+
+async def _read(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+async def test_small_files_are_saved_with_one_request(monkeypatch):
+    client = StubS3Client()
+    storage_service = _storage_service(monkeypatch, client)
+
+    stored_file = await storage_service.save_file_stream(
+        flow_id="flow", file_name="data.txt", chunks=_chunks(b"abc", 2)
+    )
+
+    assert stored_file.size == 3
+    assert stored_file.sha256 == hashlib.sha256(b"abc").hexdigest()
+    assert client.objects == {"flow/data.txt": b"abc"}
+    assert [name for name, _ in client.calls] == ["put_object"]
+
+
+async def test_large_files_are_saved_with_a_multipart_upload(monkeypatch):
+    client = StubS3Client()
+    storage_service = _storage_service(monkeypatch, client)
+    content = bytes(range(25))
+
+    stored_file = await storage_service.save_file_stream(
+        flow_id="flow", file_name="data.bin", chunks=_chunks(content, 4)
+    )
+
+    assert stored_file.size == len(content)
+    assert stored_file.sha256 == hashlib.sha256(content).hexdigest()
+    assert client.objects == {"flow/data.bin": content}
+    assert [name for name, _ in client.calls] == [
+        "create_multipart_upload",
+        "upload_part",
+        "upload_part",
+        "upload_part",
+        "complete_multipart_upload",
+    ]
+    assert [kwargs["PartNumber"] for name, kwargs in client.calls if name == "upload_part"] == [1, 2, 3]
+
+
+async def test_failed_multipart_upload_is_aborted(monkeypatch):
+    client = StubS3Client(fail_on_part=2)
+    storage_service = _storage_service(monkeypatch, client)
+
+    with pytest.raises(ConnectionError):
+        await storage_service.save_file_stream(flow_id="flow", file_name="data.bin", chunks=_chunks(bytes(30), 4))
+
+    assert client.objects == {}
+    assert client.uploads == {}
+    assert client.calls[-1][0] == "abort_multipart_upload"
+
+
+async def test_get_file_stream_requests_a_range(monkeypatch):
+    client = StubS3Client()
+    storage_service = _storage_service(monkeypatch, client)
+    content = b"0123456789" * 10
+    client.objects["flow/data.txt"] = content
+
+    assert await storage_service.get_file_size(flow_id="flow", file_name="data.txt") == len(content)
+    chunks = storage_service.get_file_stream(flow_id="flow", file_name="data.txt", start=5, length=42, chunk_size=8)
+    assert await _read(chunks) == content[5:47]
+    assert client.calls[-1] == ("get_object", {"Bucket": "langflow", "Key": "flow/data.txt", "Range": "bytes=5-46"})
+
+    assert await _read(storage_service.get_file_stream(flow_id="flow", file_name="data.txt", start=95)) == content[95:]
+    assert client.calls[-1][1]["Range"] == "bytes=95-"
+    assert await _read(storage_service.get_file_stream(flow_id="flow", file_name="data.txt")) == content
+    assert "Range" not in client.calls[-1][1]
@@ -0,0 +1,137 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from langflow.services.task.backends.local import LocalQueueBackend
+from langflow.services.task.service import TaskService
+
+calls: list[str] = []
+
+
+async def record(value: str) -> str:
+    calls.append(value)
+    return value.upper()
+
+
+def fail_once(key: str) -> str:
+    calls.append(key)
+    if calls.count(key) == 1:
+        msg = "first attempt fails"
+        raise ValueError(msg)
+    return "done"
+
+
+def fail() -> None:
+    msg = "always fails"
+    raise ValueError(msg)
+
+
+@pytest.fixture(autouse=True)
+def _clear_calls():
+    calls.clear()
+
+
+async def _wait_until_ready(backend: LocalQueueBackend, task_id: str):
+    for _ in range(200):
+        task = backend.get_task(task_id)
+        if task.ready():
+            return task
+        await asyncio.sleep(0.01)
+    pytest.fail(f"Task {task_id} didn't finish")
+
+
+async def test_queued_task_runs_in_the_background(tmp_path):
+    backend = LocalQueueBackend(tmp_path / "tasks.db", workers=2)
+    task_id, task = await backend.launch_task(record, "value")
+    assert task.status == "PENDING"
+
+    task = await _wait_until_ready(backend, task_id)
+    assert task.status == "SUCCESS"
+    assert task.result == "VALUE"
+    assert calls == ["value"]
+    assert backend.get_task("unknown") is None
+    await backend.teardown()
+
+
+async def test_failed_tasks_are_retried(tmp_path):
+    backend = LocalQueueBackend(tmp_path / "tasks.db", max_retries=1, retry_delay=0, poll_interval=0.01)
+    task_id, _ = await backend.launch_task(fail_once, "key")
+    task = await _wait_until_ready(backend, task_id)
+    assert task.status == "SUCCESS"
+    assert task.result == "done"
+    assert calls == ["key", "key"]
+
+    task_id, _ = await backend.launch_task(fail)
+    task = await _wait_until_ready(backend, task_id)
+    assert task.status == "FAILURE"
+    assert isinstance(task.result, ValueError)
+    assert "always fails" in task.traceback
+    await backend.teardown()
+
+
+async def test_tasks_survive_a_restart(tmp_path, monkeypatch):
+    path = tmp_path / "tasks.db"
+    stopped = LocalQueueBackend(path)
+    monkeypatch.setattr(stopped, "start", lambda: asyncio.sleep(0))
+    task_id, _ = await stopped.launch_task(record, "value")
+    # The process stops while running the task, so its lease isn't renewed
+    stopped.lease_seconds = 0
+    assert stopped._claim().id == task_id
+    stopped._connection.close()
+
+    backend = LocalQueueBackend(path, poll_interval=0.01)
+    await backend.start()
+    task = await _wait_until_ready(backend, task_id)
+    assert task.status == "SUCCESS"
+    assert calls == ["value"]
+    await backend.teardown()
+
+
+async def test_expired_results_are_removed(tmp_path):
+    backend = LocalQueueBackend(tmp_path / "tasks.db", result_ttl=0)
+    backend.lease_seconds = 0.03
+    task_id, _ = await backend.launch_task(record, "value")
+    await _wait_until_ready(backend, task_id)
+    await asyncio.sleep(0.05)
+    assert backend.get_task(task_id) is None
+    await backend.teardown()
+
+
+def test_tasks_must_be_importable(tmp_path):
+    async def local_task():
+        return None
+
+    backend = LocalQueueBackend(tmp_path / "tasks.db")
+    with pytest.raises(ValueError, match="top level"):
+        asyncio.run(backend.launch_task(local_task))
+
+
+def test_local_backend_needs_a_queue_path_or_config_dir():
+    settings = SimpleNamespace(celery_enabled=False, task_backend="local", task_queue_path=None, config_dir=None)
+    with pytest.raises(ValueError, match="config_dir"):
+        TaskService(SimpleNamespace(settings=settings))
+
+
+async def test_task_service_looks_tasks_up_off_the_event_loop(tmp_path, monkeypatch):
+    settings = SimpleNamespace(
+        celery_enabled=False,
+        task_backend="local",
+        task_queue_path=tmp_path / "tasks.db",
+        task_queue_workers=1,
+        task_max_retries=0,
+        task_result_ttl=60,
+    )
+    task_service = TaskService(SimpleNamespace(settings=settings))
+    lookup_threads = []
+    get_task = task_service.backend.get_task
+
+    def record_thread(task_id):
+        lookup_threads.append(threading.current_thread())
+        return get_task(task_id)
+
+    monkeypatch.setattr(task_service.backend, "get_task", record_thread)
+
+    assert await task_service.aget_task("unknown") is None
+    assert lookup_threads
+    assert threading.main_thread() not in lookup_threads
@@ -0,0 +1,33 @@
+from langflow.services.telemetry import metrics
+from langflow.services.telemetry.opentelemetry import OpenTelemetry
+from opentelemetry.metrics._internal.instrument import Counter, Histogram
+
+
+def test_flow_execution_metrics_are_registered():
+    open_telemetry = OpenTelemetry(prometheus_enabled=False)
+
+    for name in ("graph_build_duration", "component_build_duration", "component_queue_wait", "log_writer_lag"):
+        assert isinstance(open_telemetry._metrics[name], Histogram)
+    assert isinstance(open_telemetry._metrics["cache_requests"], Counter)
+    open_telemetry.validate_labels("cache_requests", {"cache": "memory", "result": "hit"})
+
+
+def test_recording_an_invalid_metric_does_not_raise(monkeypatch):
+    monkeypatch.setattr(metrics, "_open_telemetry", OpenTelemetry(prometheus_enabled=False))
+
+    metrics.observe("unknown_metric", 1.0, {"flow_id": "flow"})
+    metrics.increment("cache_requests", {"cache": "memory"})
+    metrics.record_cache_request("memory", hit=True)
+
+
+def test_removed_gauge_values_are_no_longer_reported():
+    open_telemetry = OpenTelemetry(prometheus_enabled=False)
+    gauge = open_telemetry._metrics["event_queue_backlog"]
+
+    open_telemetry.update_gauge("event_queue_backlog", 3, {"flow_id": "flow"})
+    open_telemetry.update_gauge("event_queue_backlog", 1, {"flow_id": "other"})
+    open_telemetry.remove_gauge("event_queue_backlog", {"flow_id": "flow"})
+
+    assert [(dict(observation.attributes), observation.value) for observation in gauge._callback(None)] == [
+        ({"flow_id": "other"}, 1)
+    ]
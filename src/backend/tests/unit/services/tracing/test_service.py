@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import uuid
+from types import SimpleNamespace
+
+from langflow.services.tracing.service import TracingService
+
+
+class RecordingTracer:
+    ready = True
+
+    def __init__(self, events: list):
+        self.events = events
+
+    def add_trace(self, _trace_id, trace_name, _trace_type, inputs, *_args):
+        self.events.append(("add_trace", trace_name, inputs))
+
+    def end_trace(self, *, trace_name, outputs, **_kwargs):
+        self.events.append(("end_trace", trace_name, outputs))
+
+    def end(self, _inputs, outputs, **_kwargs):
+        self.events.append(("end", dict(outputs)))
+
+
+def _tracing_service():
+    return TracingService(SimpleNamespace(settings=SimpleNamespace()))
+
+
+async def test_concurrent_runs_have_their_own_trace_state():
+    tracing_service = _tracing_service()
+    component = SimpleNamespace(_vertex=None, trace_type="chain")
+    events: dict[str, list] = {}
+
+    async def run(name: str):
+        run_id = uuid.uuid4()
+        tracing_service.set_run_id(run_id)
+        tracing_service.set_run_name(name)
+        events[name] = []
+        tracing_service._get_context(run_id).tracers["recording"] = RecordingTracer(events[name])
+        async with tracing_service.trace_context(component, "component", {"value": name}):
+            # Let the other run start its trace in between
+            await asyncio.sleep(0.01)
+            tracing_service.set_outputs("component", {"result": name})
+        assert tracing_service.run_name == name
+        await tracing_service.end({}, run_id=run_id)
+
+    await asyncio.gather(run("first"), run("second"))
+    await tracing_service.flush()
+
+    for name in ("first", "second"):
+        assert events[name] == [
+            ("add_trace", "component", {"value": name}),
+            ("end_trace", "component", {"result": name}),
+            ("end", {"component": {"result": name}}),
+        ]
+    assert not tracing_service._contexts
+    await tracing_service.teardown()
+
+
+async def test_discard_run_keeps_runs_with_ready_tracers():
+    tracing_service = _tracing_service()
+    unused, not_configured, traced = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    for run_id in (unused, not_configured, traced):
+        tracing_service.set_run_id(run_id)
+    tracing_service._get_context(not_configured).tracers["recording"] = SimpleNamespace(ready=False)
+    tracing_service._get_context(traced).tracers["recording"] = RecordingTracer([])
+
+    for run_id in (unused, not_configured, traced):
+        tracing_service.discard_run(run_id)
+    assert tracing_service._get_context(unused) is None
+    assert tracing_service._get_context(not_configured) is None
+    assert tracing_service._get_context(traced) is not None
+
+
+def test_traces_ended_on_other_threads_are_exported_by_one_worker():
+    tracing_service = _tracing_service()
+    exported = []
+
+    def end_traces(loop_number: int) -> None:
+        async def end():
+            for trace_number in range(50):
+                tracing_service._enqueue(exported.append, (loop_number, trace_number))
+
+        asyncio.run(end())
+
+    threads = [threading.Thread(target=end_traces, args=(loop_number,)) for loop_number in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    asyncio.run(tracing_service.flush())
+    assert sorted(exported) == [(loop_number, trace_number) for loop_number in range(4) for trace_number in range(50)]
+    asyncio.run(tracing_service.teardown())
+    assert not tracing_service.running
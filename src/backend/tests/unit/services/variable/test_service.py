@@ -237,3 +237,45 @@ def test_create_variable(service, session):
     assert result.type == GENERIC_TYPE
     assert isinstance(result.created_at, datetime)
     assert isinstance(result.updated_at, datetime)
+
+
+def test_prefetch_variables_loads_them_in_a_single_query(service, session):
+    user_id = uuid4()
+    service.create_variable(user_id, "first", "value1", session=session)
+    service.create_variable(user_id, "second", "value2", _type=CREDENTIAL_TYPE, session=session)
+
+    with patch.object(session, "exec", wraps=session.exec) as exec_:
+        service.prefetch_variables(user_id, ["first", "second", "missing"], session=session)
+        assert exec_.call_count == 1
+
+    with patch("langflow.services.variable.service.auth_utils.decrypt_api_key") as decrypt:
+        assert service.get_cached_variable(user_id, "first", "") == "value1"
+        assert service.get_cached_variable(user_id, "second", "") == "value2"
+        assert service.get_cached_variable(user_id, "missing", "") is None
+        decrypt.assert_not_called()
+    with pytest.raises(TypeError, match="cannot be used in a Session ID field"):
+        service.get_cached_variable(user_id, "second", "session_id")
+
+
+def test_changing_a_variable_invalidates_the_cached_values(service, session):
+    user_id = uuid4()
+    variable = service.create_variable(user_id, "name", "value", session=session)
+    assert service.get_variable(user_id, "name", "", session=session) == "value"
+
+    service.update_variable(user_id, "name", "new_value", session=session)
+    assert service.get_cached_variable(user_id, "name", "") is None
+    assert service.get_variable(user_id, "name", "", session=session) == "new_value"
+
+    service.delete_variable_by_id(user_id, variable.id, session=session)
+    assert service.get_cached_variable(user_id, "name", "") is None
+
+
+def test_variable_cache_is_disabled_with_zero_ttl(service, session):
+    user_id = uuid4()
+    service.cache_ttl = 0
+    service.create_variable(user_id, "name", "value", session=session)
+
+    service.get_variable(user_id, "name", "", session=session)
+    service.prefetch_variables(user_id, ["name"], session=session)
+
+    assert service.get_cached_variable(user_id, "name", "") is None
@@ -47,3 +47,29 @@ async def test_delete_api_key(client, logged_in_headers, api_key):
     data = response.json()
     assert data["detail"] == "API Key deleted"
     # Optionally, add a follow-up check to ensure that the key is actually removed from the database
+
+
+@pytest.mark.usefixtures("active_user")
+async def test_deleted_api_key_is_not_served_from_cache(client, logged_in_headers, api_key):
+    headers = {"x-api-key": api_key["api_key"]}
+    for _ in range(2):
+        response = await client.get("api/v1/users/whoami", headers=headers)
+        assert response.status_code == 200, response.text
+
+    response = await client.delete(f"api/v1/api_key/{api_key['id']}", headers=logged_in_headers)
+    assert response.status_code == 200
+
+    response = await client.get("api/v1/users/whoami", headers=headers)
+    assert response.status_code == 403
+
+
+@pytest.mark.usefixtures("active_user")
+async def test_store_api_key_changes_are_not_served_from_cache(client, logged_in_headers):
+    response = await client.get("api/v1/users/whoami", headers=logged_in_headers)
+    assert response.status_code == 200
+    assert not response.json()["store_api_key"]
+
+    response = await client.post("api/v1/api_key/store", json={"api_key": "store-key"}, headers=logged_in_headers)
+    assert response.status_code == 200
+    response = await client.get("api/v1/users/whoami", headers=logged_in_headers)
+    assert response.json()["store_api_key"]
@@ -217,6 +217,68 @@ async def test_read_flows_components_only(client: TestClient, logged_in_headers)
     assert all(flow["is_component"] is True for flow in response_json)
 
 
+async def test_read_flows_headers_with_keyset_pagination(client: TestClient, logged_in_headers):
+    names = set()
+    for i in range(5):
+        flow = FlowCreate(name=f"Header flow {i}", description="description", data={}, is_component=i == 0)
+        response = await client.post("api/v1/flows/", json=flow.model_dump(), headers=logged_in_headers)
+        assert response.status_code == 201
+        names.add(flow.name)
+
+    headers = []
+    params = {"get_all": True, "header_flows": True, "limit": 2}
+    while True:
+        response = await client.get("api/v1/flows/", headers=logged_in_headers, params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= 2
+        if not page:
+            break
+        headers.extend(page)
+        params["after"] = page[-1]["id"]
+
+    assert [header["id"] for header in headers] == sorted(header["id"] for header in headers)
+    headers = {header["name"]: header for header in headers if header["name"] in names}
+    assert set(headers) == names
+    assert all("data" not in header for header in headers.values())
+    assert headers["Header flow 0"]["is_component"] is True
+    assert headers["Header flow 1"]["is_component"] is False
+    assert headers["Header flow 1"]["description"] == "description"
+
+    response = await client.get(
+        "api/v1/flows/",
+        headers=logged_in_headers,
+        params={"header_flows": True, "components_only": True, "remove_example_flows": True},
+    )
+    assert [header["name"] for header in response.json() if header["name"] in names] == ["Header flow 0"]
+
+
+@pytest.mark.usefixtures("active_user")
+async def test_read_flows_headers_infer_is_component_from_data(client: TestClient, logged_in_headers):
+    flow = FlowCreate(name="Legacy flow", data={"nodes": [{"id": "node"}], "edges": []})
+    response = await client.post("api/v1/flows/", json=flow.model_dump(), headers=logged_in_headers)
+    flow_id = UUID(response.json()["id"])
+    with session_getter(get_db_service()) as session:
+        db_flow = session.get(Flow, flow_id)
+        db_flow.is_component = None
+        session.add(db_flow)
+        session.commit()
+
+    response = await client.get("api/v1/flows/", headers=logged_in_headers, params={"header_flows": True})
+    assert response.status_code == 200
+    headers = {header["name"]: header for header in response.json()}
+    assert headers["Legacy flow"]["is_component"] is True
+
+    for header_flows in (True, False):
+        response = await client.get(
+            "api/v1/flows/",
+            headers=logged_in_headers,
+            params={"header_flows": header_flows, "components_only": True},
+        )
+        assert response.status_code == 200
+        assert [flow["name"] for flow in response.json()] == ["Legacy flow"]
+
+
 async def test_read_flow(client: TestClient, json_flow: str, logged_in_headers):
     flow = orjson.loads(json_flow)
     data = flow["data"]
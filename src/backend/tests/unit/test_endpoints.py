@@ -5,7 +5,8 @@ import pytest
 from fastapi import status
 from httpx import AsyncClient
 from langflow.custom.directory_reader.directory_reader import DirectoryReader
-from langflow.services.deps import get_settings_service
+from langflow.services.deps import get_settings_service, get_task_service
+from langflow.services.task.backends.local import LocalQueueBackend
 
 
 async def run_post(client, flow_id, headers, post_data):
@@ -602,6 +603,70 @@ async def test_successful_run_with_input_type_chat(client: AsyncClient, simple_a
     ), chat_input_outputs
 
 
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+async def test_successful_run_with_batch_of_input_values(
+    client: AsyncClient, simple_api_test, created_api_key, monkeypatch, max_concurrency
+):
+    monkeypatch.setattr(get_settings_service().settings, "run_batch_max_concurrency", max_concurrency)
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    input_values = [f"value{index}" for index in range(5)]
+    payload = {
+        "input_type": "chat",
+        "output_type": "debug",
+        "input_values": input_values,
+    }
+    response = await client.post(f"/api/v1/run/{flow_id}", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    outer_outputs = response.json()["outputs"]
+    # One entry per input value, in the order they were sent
+    assert [outputs_dict.get("inputs") for outputs_dict in outer_outputs] == [
+        {"input_value": input_value} for input_value in input_values
+    ]
+    for index, (input_value, outputs_dict) in enumerate(zip(input_values, outer_outputs, strict=True)):
+        chat_input_outputs = [
+            output for output in outputs_dict.get("outputs") if "ChatInput" in output.get("component_id")
+        ]
+        assert len(chat_input_outputs) == 1
+        message = chat_input_outputs[0].get("results").get("message")
+        assert message.get("text") == input_value
+        # Each input runs in its own session
+        assert message.get("session_id") == f"{flow_id}-{index}"
+
+
+async def test_batch_of_input_values_is_capped(client: AsyncClient, simple_api_test, created_api_key, monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "run_batch_max_inputs", 2)
+    headers = {"x-api-key": created_api_key.api_key}
+    payload = {"input_type": "chat", "output_type": "debug", "input_values": ["a", "b", "c"]}
+    response = await client.post(f"/api/v1/run/{simple_api_test['id']}", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+    assert "at most 2 input values" in response.json()["detail"]
+
+
+async def test_background_run_is_queued_in_the_local_task_queue(
+    client: AsyncClient, simple_api_test, created_api_key, tmp_path, monkeypatch
+):
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    payload = {"input_type": "chat", "output_type": "debug", "input_value": "value1"}
+    response = await client.post(f"/api/v1/run/{flow_id}?background=true", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+    backend = LocalQueueBackend(tmp_path / "tasks.db", poll_interval=0.05)
+    monkeypatch.setattr(get_task_service(), "backend", backend)
+    try:
+        response = await client.post(f"/api/v1/run/{flow_id}?background=true", headers=headers, json=payload)
+        assert response.status_code == status.HTTP_202_ACCEPTED, response.text
+        task_id = response.json()["task_id"]
+
+        task_status = await poll_task_status(client, headers, f"api/v1/task/{task_id}", sleep_time=0.1)
+        assert task_status is not None
+        outputs = task_status["result"]["outputs"][0]["outputs"]
+        assert any("ChatInput" in output["component_id"] for output in outputs)
+    finally:
+        await backend.teardown()
+
+
 async def test_invalid_run_with_input_type_chat(client, simple_api_test, created_api_key):
     headers = {"x-api-key": created_api_key.api_key}
     flow_id = simple_api_test["id"]
@@ -9,7 +9,7 @@ import pytest
 from asgi_lifespan import LifespanManager
 from httpx import ASGITransport, AsyncClient
 from langflow.services.deps import get_storage_service
-from langflow.services.storage.service import StorageService
+from langflow.services.storage.service import StorageService, StoredFile
 from sqlmodel import Session
 
 
@@ -20,6 +20,13 @@ def mock_storage_service():
     # Setup mock behaviors for the service methods as needed
     service.save_file.return_value = None
     service.get_file.return_value = b"file content"  # Binary content for files
+    service.save_file_stream.return_value = StoredFile(12, "hash")
+    service.get_file_size.return_value = len(b"file content")
+
+    async def get_file_stream(*_args, start=0, length=None, **_kwargs):
+        yield b"file content"[start : None if length is None else start + length]
+
+    service.get_file_stream = get_file_stream
     service.list_files.return_value = ["file1.txt", "file2.jpg"]
     service.delete_file.return_value = None
     return service
@@ -148,3 +155,40 @@ async def test_file_operations(client, created_api_key, flow):
     # Verify that the file is indeed deleted
     response = await client.get(f"api/v1/files/list/{flow_id}", headers=headers)
     assert full_file_name not in response.json()["files"]
+
+
+async def test_download_file_range(client, created_api_key, flow):
+    headers = {"x-api-key": created_api_key.api_key}
+    file_content = b"0123456789" * 1000
+
+    response = await client.post(
+        f"api/v1/files/upload/{flow.id}",
+        files={"file": ("range.txt", file_content)},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    full_file_name = response.json()["file_path"].split("/")[-1]
+    url = f"api/v1/files/download/{flow.id}/{full_file_name}"
+
+    response = await client.get(url, headers=headers)
+    assert response.status_code == 200
+    assert response.content == file_content
+    assert response.headers["accept-ranges"] == "bytes"
+
+    response = await client.get(url, headers={**headers, "Range": "bytes=5-14"})
+    assert response.status_code == 206
+    assert response.content == file_content[5:15]
+    assert response.headers["content-range"] == f"bytes 5-14/{len(file_content)}"
+    assert response.headers["content-length"] == "10"
+
+    response = await client.get(url, headers={**headers, "Range": "bytes=9995-"})
+    assert response.status_code == 206
+    assert response.content == file_content[9995:]
+
+    response = await client.get(url, headers={**headers, "Range": "bytes=-3"})
+    assert response.status_code == 206
+    assert response.content == b"789"
+
+    response = await client.get(url, headers={**headers, "Range": "bytes=20000-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(file_content)}"
@@ -1,5 +1,12 @@
 import pytest
-from langflow.memory import add_messages, add_messagetables, delete_messages, get_messages, store_message
+from langflow.memory import (
+    add_messages,
+    add_messagetables,
+    delete_messages,
+    get_messages,
+    iter_messages,
+    store_message,
+)
 from langflow.schema.message import Message
 
 # Assuming you have these imports available
@@ -100,3 +107,29 @@ def test_convert_to_langchain(method_name):
     assert lc_message.content == ""
     assert lc_message.type == "ai"
     assert len(list(iterator)) == 2
+
+
+@pytest.mark.usefixtures("client")
+def test_add_messagetables_commits_batch(session):
+    messages = [
+        MessageTable(text=f"Batch message {i}", sender="User", sender_name="User", session_id="batch_session_id")
+        for i in range(5)
+    ]
+    added_messages = add_messagetables(messages, session)
+    assert [message.text for message in added_messages] == [f"Batch message {i}" for i in range(5)]
+    assert session.query(MessageTable).filter(MessageTable.session_id == "batch_session_id").count() == 5
+
+
+@pytest.mark.usefixtures("client")
+def test_iter_messages_paginates_with_keyset():
+    add_messages(
+        [
+            Message(text=f"Paged message {i}", sender="User", sender_name="User", session_id="paged_session_id")
+            for i in range(7)
+        ]
+    )
+    ascending = [message.text for message in iter_messages(session_id="paged_session_id", batch_size=3)]
+    assert sorted(ascending) == [f"Paged message {i}" for i in range(7)]
+
+    descending = [message.text for message in iter_messages(session_id="paged_session_id", order="DESC", batch_size=2)]
+    assert descending == ascending[::-1]
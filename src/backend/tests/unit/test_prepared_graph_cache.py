@@ -0,0 +1,67 @@
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from langflow.api.v1.schemas import InputValueRequest
+from langflow.processing.graph_cache import PreparedGraphCache, get_prepared_graph, get_prepared_graph_cache
+from langflow.processing.process import run_graph_internal
+
+
+def _make_flow(json_flow: str):
+    return SimpleNamespace(
+        id=uuid4(), name="Memory Chatbot", updated_at=datetime.now(timezone.utc), data=json.loads(json_flow)["data"]
+    )
+
+
+async def test_get_prepared_graph_returns_clones_of_a_template(client, json_memory_chatbot_no_llm):  # noqa: ARG001
+    cache = get_prepared_graph_cache()
+    flow = _make_flow(json_memory_chatbot_no_llm)
+    hits, misses = cache.hits, cache.misses
+
+    first = await get_prepared_graph(flow, {}, user_id="user")
+    second = await get_prepared_graph(flow, {}, user_id="user")
+
+    assert (cache.hits, cache.misses) == (hits + 1, misses + 1)
+    assert first is not second
+    assert [vertex.id for vertex in first.vertices] == [vertex.id for vertex in second.vertices]
+    for first_vertex, second_vertex in zip(first.vertices, second.vertices, strict=True):
+        assert first_vertex is not second_vertex
+        assert second_vertex.graph is second
+        assert second_vertex.custom_component is not None
+        assert second_vertex.custom_component is not first_vertex.custom_component
+    assert second.predecessor_map == first.predecessor_map
+
+    # Different tweaks or a saved change to the flow build a new template
+    await get_prepared_graph(flow, {"stream": True}, user_id="user")
+    flow.updated_at += timedelta(seconds=1)
+    await get_prepared_graph(flow, {}, user_id="user")
+    assert cache.misses == misses + 3
+
+
+async def test_prepared_graph_clones_run_independently(client, json_memory_chatbot_no_llm):  # noqa: ARG001
+    flow = _make_flow(json_memory_chatbot_no_llm)
+    for message in ["first message", "second message"]:
+        graph = await get_prepared_graph(flow, {}, user_id=None)
+        outputs = [vertex.id for vertex in graph.vertices if vertex.is_output]
+        results, _ = await run_graph_internal(
+            graph=graph,
+            flow_id=str(flow.id),
+            inputs=[InputValueRequest(components=[], input_value=message, type="chat")],
+            outputs=outputs,
+        )
+        assert message in results[0].outputs[0].results["message"].text
+
+
+def test_prepared_graph_cache_evicts_least_recently_used():
+    cache = PreparedGraphCache(maxsize=2)
+    keys = [(str(index), "", "", "") for index in range(3)]
+    cache.set(keys[0], "a")
+    cache.set(keys[1], "b")
+    assert cache.get(keys[0]) == "a"
+    cache.set(keys[2], "c")
+
+    assert cache.get(keys[1]) is None
+    cache.invalidate("0")
+    assert cache.get(keys[0]) is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "size": 1, "maxsize": 2}
@@ -15,7 +15,7 @@ def opentelemetry_instance():
 def test_init(opentelemetry_instance):
     assert isinstance(opentelemetry_instance, OpenTelemetry)
     assert len(opentelemetry_instance._metrics) > 1
-    assert len(opentelemetry_instance._metrics) == len(opentelemetry_instance._metrics_registry) == 2
+    assert len(opentelemetry_instance._metrics) == len(opentelemetry_instance._metrics_registry) == 10
     assert "file_uploads" in opentelemetry_instance._metrics
 
 
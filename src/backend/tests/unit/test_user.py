@@ -123,6 +123,24 @@ async def test_data_consistency_after_update(client: AsyncClient, active_user, l
     assert response.json()["detail"] == "User not found or is inactive."
 
 
+@pytest.mark.api_key_required
+async def test_cached_user_is_invalidated_after_update(
+    client: AsyncClient, active_user, logged_in_headers, super_user_headers
+):
+    # The first request caches the user the token resolves to
+    response = await client.get("api/v1/users/whoami", headers=logged_in_headers)
+    assert response.status_code == 200, response.json()
+
+    update_data = UserUpdate(is_active=False)
+    response = await client.patch(
+        f"/api/v1/users/{active_user.id}", json=update_data.model_dump(), headers=super_user_headers
+    )
+    assert response.status_code == 200, response.json()
+
+    response = await client.get("api/v1/users/whoami", headers=logged_in_headers)
+    assert response.status_code == 401, response.json()
+
+
 @pytest.mark.api_key_required
 async def test_data_consistency_after_delete(client: AsyncClient, test_user, super_user_headers):
     user_id = test_user.get("id")
@@ -1,7 +1,10 @@
+import asyncio
 import tempfile
 from pathlib import Path
 
 import pytest
+from langflow.services.deps import get_task_service
+from langflow.services.task.backends.local import LocalQueueBackend
 
 
 @pytest.fixture(autouse=True)
@@ -35,6 +38,26 @@ async def test_webhook_endpoint(client, added_webhook_test):
     assert not file_path.exists()
 
 
+async def test_webhook_runs_in_the_local_task_queue(client, added_webhook_test, tmp_path, monkeypatch):
+    backend = LocalQueueBackend(tmp_path / "tasks.db", poll_interval=0.05)
+    monkeypatch.setattr(get_task_service(), "backend", backend)
+    endpoint = f"api/v1/webhook/{added_webhook_test['endpoint_name']}"
+    file_path = tmp_path / "test_file.txt"
+    try:
+        response = await client.post(endpoint, json={"path": str(file_path)})
+        assert response.status_code == 202
+        task_id = response.json()["task_id"]
+        for _ in range(100):
+            task = backend.get_task(task_id)
+            if task.ready():
+                break
+            await asyncio.sleep(0.1)
+        assert task.ready()
+        assert file_path.exists()
+    finally:
+        await backend.teardown()
+
+
 async def test_webhook_flow_on_run_endpoint(client, added_webhook_test, created_api_key):
     endpoint_name = added_webhook_test["endpoint_name"]
     endpoint = f"api/v1/run/{endpoint_name}?stream=false"